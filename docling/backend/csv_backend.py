@@ -1,31 +1,38 @@
 import csv
 import logging
 import warnings
-from io import BytesIO, StringIO
+from io import BytesIO, TextIOWrapper
 from pathlib import Path
-from typing import Set, Union
+from typing import List, Set, TextIO, Union
 
 from docling_core.types.doc import DoclingDocument, DocumentOrigin, TableCell, TableData
 
 from docling.backend.abstract_backend import DeclarativeDocumentBackend
 from docling.datamodel.base_models import InputFormat
 from docling.datamodel.document import InputDocument
+from docling.datamodel.settings import settings
 
 _log = logging.getLogger(__name__)
 
+# Maximum size of the sample the CSV dialect is sniffed on, in characters
+_SNIFF_SAMPLE_SIZE = 64 * 1024
+
 
 class CsvDocumentBackend(DeclarativeDocumentBackend):
-    content: StringIO
+    content: TextIO
 
     def __init__(self, in_doc: "InputDocument", path_or_stream: Union[BytesIO, Path]):
         super().__init__(in_doc, path_or_stream)
 
-        # Load content
+        # Open the content, which is read row by row during the conversion
         try:
             if isinstance(self.path_or_stream, BytesIO):
-                self.content = StringIO(self.path_or_stream.getvalue().decode("utf-8"))
+                self.content = TextIOWrapper(
+                    self.path_or_stream, encoding="utf-8", newline=""
+                )
             elif isinstance(self.path_or_stream, Path):
-                self.content = StringIO(self.path_or_stream.read_text("utf-8"))
+                self.content = open(self.path_or_stream, encoding="utf-8", newline="")
+            self.sample = self.content.read(_SNIFF_SAMPLE_SIZE)
             self.valid = True
         except Exception as e:
             raise RuntimeError(
@@ -41,6 +48,8 @@ class CsvDocumentBackend(DeclarativeDocumentBackend):
         return False
 
     def unload(self):
+        if hasattr(self, "content"):
+            self.content.close()
         if isinstance(self.path_or_stream, BytesIO):
             self.path_or_stream.close()
         self.path_or_stream = None
@@ -52,10 +61,13 @@ class CsvDocumentBackend(DeclarativeDocumentBackend):
     def convert(self) -> DoclingDocument:
         """
         Parses the CSV data into a structured document model.
+
+        The rows are streamed, and with `settings.perf.csv_chunk_rows` they are
+        split into tables of a bounded number of rows.
         """
 
-        # Detect CSV dialect
-        head = self.content.readline()
+        # Detect CSV dialect on the first line, within the sample
+        head = self.sample[: self.sample.find("\n") + 1] or self.sample
         dialect = csv.Sniffer().sniff(head, ",;\t|:")
         _log.info(f'Parsing CSV with delimiter: "{dialect.delimiter}"')
         if not dialect.delimiter in {",", ";", "\t", "|", ":"}:
@@ -63,22 +75,6 @@ class CsvDocumentBackend(DeclarativeDocumentBackend):
                 f"Cannot convert csv with unknown delimiter {dialect.delimiter}."
             )
 
-        # Parce CSV
-        self.content.seek(0)
-        result = csv.reader(self.content, dialect=dialect, strict=True)
-        self.csv_data = list(result)
-        _log.info(f"Detected {len(self.csv_data)} lines")
-
-        # Ensure uniform column length
-        expected_length = len(self.csv_data[0])
-        is_uniform = all(len(row) == expected_length for row in self.csv_data)
-        if not is_uniform:
-            warnings.warn(
-                f"Inconsistent column lengths detected in CSV data. "
-                f"Expected {expected_length} columns, but found rows with varying lengths. "
-                f"Ensure all rows have the same number of columns."
-            )
-
         # Parse the CSV into a structured document model
         origin = DocumentOrigin(
             filename=self.file.name or "file.csv",
@@ -88,38 +84,77 @@ class CsvDocumentBackend(DeclarativeDocumentBackend):
 
         doc = DoclingDocument(name=self.file.stem or "file.csv", origin=origin)
 
-        if self.is_valid():
-            # Convert CSV data to table
-            if self.csv_data:
-                num_rows = len(self.csv_data)
-                num_cols = max(len(row) for row in self.csv_data)
-
-                table_data = TableData(
-                    num_rows=num_rows,
-                    num_cols=num_cols,
-                    table_cells=[],
-                )
-
-                # Convert each cell to TableCell
-                for row_idx, row in enumerate(self.csv_data):
-                    for col_idx, cell_value in enumerate(row):
-                        cell = TableCell(
-                            text=str(cell_value),
-                            row_span=1,  # CSV doesn't support merged cells
-                            col_span=1,
-                            start_row_offset_idx=row_idx,
-                            end_row_offset_idx=row_idx + 1,
-                            start_col_offset_idx=col_idx,
-                            end_col_offset_idx=col_idx + 1,
-                            col_header=row_idx == 0,  # First row as header
-                            row_header=False,
-                        )
-                        table_data.table_cells.append(cell)
-
-                doc.add_table(data=table_data)
-        else:
+        if not self.is_valid():
             raise RuntimeError(
                 f"Cannot convert doc with {self.document_hash} because the backend failed to init."
             )
 
+        # Parse CSV
+        self.content.seek(0)
+        result = csv.reader(self.content, dialect=dialect, strict=True)
+
+        chunk_rows = settings.perf.csv_chunk_rows
+        header: List[str] = []
+        is_uniform = True
+        num_lines = 0
+        # Cells of the current table, which are added to the document when full
+        table_cells: List[TableCell] = []
+        num_rows = num_cols = 0
+        for row in result:
+            if num_lines == 0:
+                header = row
+            elif len(row) != len(header):
+                is_uniform = False
+            num_lines += 1
+
+            # Each chunk starts with the header row
+            if chunk_rows is not None and num_rows == chunk_rows + 1:
+                self._add_table(doc, table_cells, num_rows, num_cols)
+                table_cells, num_rows, num_cols = [], 0, 0
+                self._add_row(table_cells, num_rows, header)
+                num_rows, num_cols = 1, len(header)
+
+            self._add_row(table_cells, num_rows, row)
+            num_rows += 1
+            num_cols = max(num_cols, len(row))
+
+        if num_rows > 0:
+            self._add_table(doc, table_cells, num_rows, num_cols)
+        _log.info(f"Detected {num_lines} lines")
+
+        # Ensure uniform column length
+        if not is_uniform:
+            warnings.warn(
+                f"Inconsistent column lengths detected in CSV data. "
+                f"Expected {len(header)} columns, but found rows with varying lengths. "
+                f"Ensure all rows have the same number of columns."
+            )
+
         return doc
+
+    def _add_row(self, table_cells: List[TableCell], row_idx: int, row: List[str]):
+        for col_idx, cell_value in enumerate(row):
+            cell = TableCell(
+                text=cell_value,
+                row_span=1,  # CSV doesn't support merged cells
+                col_span=1,
+                start_row_offset_idx=row_idx,
+                end_row_offset_idx=row_idx + 1,
+                start_col_offset_idx=col_idx,
+                end_col_offset_idx=col_idx + 1,
+                col_header=row_idx == 0,  # First row as header
+                row_header=False,
+            )
+            table_cells.append(cell)
+
+    def _add_table(
+        self,
+        doc: DoclingDocument,
+        table_cells: List[TableCell],
+        num_rows: int,
+        num_cols: int,
+    ):
+        # The cells are already validated
+        table_data = TableData(num_rows=num_rows, num_cols=num_cols, table_cells=[])
+        table_data.table_cells = table_cells
+        doc.add_table(data=table_data)
@@ -16,6 +16,7 @@ from docling_core.types.doc import (
     TableData,
 )
 from docling_core.types.doc.document import ContentLayer
+from pydantic import BaseModel
 from typing_extensions import override
 
 from docling.backend.abstract_backend import DeclarativeDocumentBackend
@@ -43,6 +44,15 @@ TAGS_FOR_NODE_ITEMS: Final = [
 ]
 
 
+class HTMLTableCell(BaseModel):
+    """A cell of an HTML table, before its placement in the grid."""
+
+    name: str
+    text: str
+    col_span: int
+    row_span: int
+
+
 class HTMLDocumentBackend(DeclarativeDocumentBackend):
     @override
     def __init__(self, in_doc: "InputDocument", path_or_stream: Union[BytesIO, Path]):
@@ -59,18 +69,20 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
 
         try:
             if isinstance(self.path_or_stream, BytesIO):
-                text_stream = self.path_or_stream.getvalue()
-                self.soup = BeautifulSoup(text_stream, "html.parser")
+                self.load(self.path_or_stream.getvalue())
             if isinstance(self.path_or_stream, Path):
                 with open(self.path_or_stream, "rb") as f:
-                    html_content = f.read()
-                    self.soup = BeautifulSoup(html_content, "html.parser")
+                    self.load(f.read())
         except Exception as e:
             raise RuntimeError(
                 "Could not initialize HTML backend for file with "
                 f"hash {self.document_hash}."
             ) from e
 
+    def load(self, html_content: bytes) -> None:
+        """Parse the HTML content."""
+        self.soup = BeautifulSoup(html_content, "html.parser")
+
     @override
     def is_valid(self) -> bool:
         return self.soup is not None
@@ -105,18 +117,7 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
         _log.debug("Trying to convert HTML...")
 
         if self.is_valid():
-            assert self.soup is not None
-            content = self.soup.body or self.soup
-            # Replace <br> tags with newline characters
-            # TODO: remove style to avoid losing text from tags like i, b, span, ...
-            for br in content("br"):
-                br.replace_with(NavigableString("\n"))
-
-            headers = content.find(["h1", "h2", "h3", "h4", "h5", "h6"])
-            self.content_layer = (
-                ContentLayer.BODY if headers is None else ContentLayer.FURNITURE
-            )
-            self.walk(content, doc)
+            self.convert_content(doc)
         else:
             raise RuntimeError(
                 f"Cannot convert doc with {self.document_hash} because the backend "
@@ -124,6 +125,31 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
             )
         return doc
 
+    def convert_content(
+        self,
+        doc: DoclingDocument,
+        parent: Optional[Union[DocItem, GroupItem]] = None,
+        fragment: bool = False,
+    ) -> None:
+        """Add the content of the parsed HTML to the document.
+
+        The items are added under the parent. A fragment is embedded in the
+        document, its items are all in the body.
+        """
+        assert self.soup is not None
+        content = self.soup.body or self.soup
+        # Replace <br> tags with newline characters
+        # TODO: remove style to avoid losing text from tags like i, b, span, ...
+        for br in content("br"):
+            br.replace_with(NavigableString("\n"))
+
+        headers = content.find(["h1", "h2", "h3", "h4", "h5", "h6"])
+        self.content_layer = (
+            ContentLayer.BODY if headers is None or fragment else ContentLayer.FURNITURE
+        )
+        self.parents[0] = parent
+        self.walk(content, doc)
+
     def walk(self, tag: Tag, doc: DoclingDocument) -> None:
 
         # Iterate over elements in the body of the document
@@ -204,13 +230,16 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
     def handle_header(self, element: Tag, doc: DoclingDocument) -> None:
         """Handles header tags (h1, h2, etc.)."""
         hlevel = int(element.name.replace("h", ""))
-        text = element.text.strip()
+        self.add_header(doc, hlevel, element.text.strip())
 
+    def add_header(self, doc: DoclingDocument, hlevel: int, text: str) -> None:
+        """Adds a header at its level of the hierarchy."""
         if hlevel == 1:
             self.content_layer = ContentLayer.BODY
 
             for key in self.parents.keys():
-                self.parents[key] = None
+                if key > 0:
+                    self.parents[key] = None
 
             self.level = 1
             self.parents[self.level] = doc.add_text(
@@ -251,7 +280,11 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
         """Handles monospace code snippets (pre)."""
         if element.text is None:
             return
-        text = element.text.strip()
+        self.add_code(doc, element.text)
+
+    def add_code(self, doc: DoclingDocument, text: str) -> None:
+        """Adds a code snippet, unless it is blank."""
+        text = text.strip()
         if text:
             doc.add_code(
                 parent=self.parents[self.level],
@@ -263,7 +296,11 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
         """Handles paragraph tags (p)."""
         if element.text is None:
             return
-        text = element.text.strip()
+        self.add_paragraph(doc, element.text)
+
+    def add_paragraph(self, doc: DoclingDocument, text: str) -> None:
+        """Adds a paragraph, unless it is blank."""
+        text = text.strip()
         if text:
             doc.add_text(
                 parent=self.parents[self.level],
@@ -274,8 +311,20 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
 
     def handle_list(self, element: Tag, doc: DoclingDocument) -> None:
         """Handles list tags (ul, ol) and their list items."""
+        start_attr = element.get("start")
+        self.open_list(
+            doc, element.name, start_attr if isinstance(start_attr, str) else None
+        )
 
-        if element.name == "ul":
+        self.walk(element, doc)
+
+        self.close_level()
+
+    def open_list(
+        self, doc: DoclingDocument, name: str, start_attr: Optional[str]
+    ) -> None:
+        """Adds a list group, as parent of the next level of the hierarchy."""
+        if name == "ul":
             # create a list group
             self.parents[self.level + 1] = doc.add_group(
                 parent=self.parents[self.level],
@@ -283,8 +332,7 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
                 label=GroupLabel.LIST,
                 content_layer=self.content_layer,
             )
-        elif element.name == "ol":
-            start_attr = element.get("start")
+        elif name == "ol":
             start: int = (
                 int(start_attr)
                 if isinstance(start_attr, str) and start_attr.isnumeric()
@@ -299,8 +347,8 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
             )
         self.level += 1
 
-        self.walk(element, doc)
-
+    def close_level(self) -> None:
+        """Closes the level opened by a list or a list item with a nested list."""
         self.parents[self.level + 1] = None
         self.level -= 1
 
@@ -312,64 +360,79 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
         if parent is None:
             _log.debug(f"list-item has no parent in DoclingDocument: {element}")
             return
-        parent_label: str = parent.label
-        index_in_list = len(parent.children) + 1
-        if (
-            parent_label == GroupLabel.ORDERED_LIST
-            and isinstance(parent, GroupItem)
-            and parent.name
-        ):
-            start_in_list: str = parent.name.split(" ")[-1]
-            start: int = int(start_in_list) if start_in_list.isnumeric() else 1
-            index_in_list += start - 1
 
         if nested_list:
             # Text in list item can be hidden within hierarchy, hence
             # we need to extract it recursively
-            text: str = self.get_text(element)
-            # Flatten text, remove break lines:
-            text = text.replace("\n", "").replace("\r", "")
-            text = " ".join(text.split()).strip()
-
-            marker = ""
-            enumerated = False
-            if parent_label == GroupLabel.ORDERED_LIST:
-                marker = str(index_in_list)
-                enumerated = True
-
-            if len(text) > 0:
-                # create a list-item
-                self.parents[self.level + 1] = doc.add_list_item(
-                    text=text,
-                    enumerated=enumerated,
-                    marker=marker,
-                    parent=parent,
-                    content_layer=self.content_layer,
-                )
-                self.level += 1
+            self.open_list_item(doc, parent, self.get_text(element))
 
             self.walk(element, doc)
 
-            self.parents[self.level + 1] = None
-            self.level -= 1
+            self.close_level()
 
         elif element.text.strip():
-            text = element.text.strip()
-
-            marker = ""
-            enumerated = False
-            if parent_label == GroupLabel.ORDERED_LIST:
-                marker = f"{str(index_in_list)}."
-                enumerated = True
-            doc.add_list_item(
+            self.add_list_item(doc, parent, element.text.strip())
+        else:
+            _log.debug(f"list-item has no text: {element}")
+
+    def get_index_in_list(self, parent: Union[DocItem, GroupItem]) -> int:
+        """The number of the next item of a list."""
+        index_in_list = len(parent.children) + 1
+        if (
+            parent.label == GroupLabel.ORDERED_LIST
+            and isinstance(parent, GroupItem)
+            and parent.name
+        ):
+            start_in_list: str = parent.name.split(" ")[-1]
+            start: int = int(start_in_list) if start_in_list.isnumeric() else 1
+            index_in_list += start - 1
+        return index_in_list
+
+    def open_list_item(
+        self, doc: DoclingDocument, parent: Union[DocItem, GroupItem], text: str
+    ) -> None:
+        """Adds a list item with a nested list, as parent of the next level."""
+        index_in_list = self.get_index_in_list(parent)
+
+        # Flatten text, remove break lines:
+        text = text.replace("\n", "").replace("\r", "")
+        text = " ".join(text.split()).strip()
+
+        marker = ""
+        enumerated = False
+        if parent.label == GroupLabel.ORDERED_LIST:
+            marker = str(index_in_list)
+            enumerated = True
+
+        if len(text) > 0:
+            # create a list-item
+            self.parents[self.level + 1] = doc.add_list_item(
                 text=text,
                 enumerated=enumerated,
                 marker=marker,
                 parent=parent,
                 content_layer=self.content_layer,
             )
-        else:
-            _log.debug(f"list-item has no text: {element}")
+            self.level += 1
+
+    def add_list_item(
+        self, doc: DoclingDocument, parent: Union[DocItem, GroupItem], text: str
+    ) -> None:
+        """Adds a list item without nested list."""
+        index_in_list = self.get_index_in_list(parent)
+
+        marker = ""
+        enumerated = False
+        if parent.label == GroupLabel.ORDERED_LIST:
+            marker = f"{str(index_in_list)}."
+            enumerated = True
+        doc.add_list_item(
+            text=text,
+            enumerated=enumerated,
+            marker=marker,
+            parent=parent,
+            content_layer=self.content_layer,
+        )
 
     @staticmethod
     def parse_table_data(element: Tag) -> Optional[TableData]:
@@ -378,44 +441,13 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
             _log.debug("Skipping nested table.")
             return None
 
-        # Count the number of rows (number of <tr> elements)
-        num_rows = len(element("tr"))
-
-        # Find the number of columns (taking into account colspan)
-        num_cols = 0
+        # Collect the cells of each row (both <td> and <th>), with their text
+        rows: list[list[HTMLTableCell]] = []
         for row in element("tr"):
-            col_count = 0
             if not isinstance(row, Tag):
                 continue
-            for cell in row(["td", "th"]):
-                if not isinstance(row, Tag):
-                    continue
-                val = cast(Tag, cell).get("colspan", "1")
-                colspan = int(val) if (isinstance(val, str) and val.isnumeric()) else 1
-                col_count += colspan
-            num_cols = max(num_cols, col_count)
-
-        grid: list = [[None for _ in range(num_cols)] for _ in range(num_rows)]
-
-        data = TableData(num_rows=num_rows, num_cols=num_cols, table_cells=[])
-
-        # Iterate over the rows in the table
-        for row_idx, row in enumerate(element("tr")):
-            if not isinstance(row, Tag):
-                continue
-
-            # For each row, find all the column cells (both <td> and <th>)
-            cells = row(["td", "th"])
-
-            # Check if each cell in the row is a header -> means it is a column header
-            col_header = True
-            for html_cell in cells:
-                if isinstance(html_cell, Tag) and html_cell.name == "td":
-                    col_header = False
-
-            # Extract the text content of each cell
-            col_idx = 0
-            for html_cell in cells:
+            cells: list[HTMLTableCell] = []
+            for html_cell in row(["td", "th"]):
                 if not isinstance(html_cell, Tag):
                     continue
 
@@ -427,38 +459,62 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
                         formula.replace_with(NavigableString(math_formula))
 
                 # TODO: extract content correctly from table-cells with lists
-                text = html_cell.text
-
-                # label = html_cell.name
                 col_val = html_cell.get("colspan", "1")
-                col_span = (
-                    int(col_val)
-                    if isinstance(col_val, str) and col_val.isnumeric()
-                    else 1
-                )
                 row_val = html_cell.get("rowspan", "1")
-                row_span = (
-                    int(row_val)
-                    if isinstance(row_val, str) and row_val.isnumeric()
-                    else 1
+                cells.append(
+                    HTMLTableCell(
+                        name=html_cell.name,
+                        text=html_cell.text,
+                        col_span=(
+                            int(col_val)
+                            if isinstance(col_val, str) and col_val.isnumeric()
+                            else 1
+                        ),
+                        row_span=(
+                            int(row_val)
+                            if isinstance(row_val, str) and row_val.isnumeric()
+                            else 1
+                        ),
+                    )
                 )
+            rows.append(cells)
+
+        return HTMLDocumentBackend.build_table_data(rows)
+
+    @staticmethod
+    def build_table_data(rows: list[list[HTMLTableCell]]) -> TableData:
+        """Places the cells of the rows in the grid of the table."""
+        # Find the number of columns (taking into account colspan)
+        num_rows = len(rows)
+        num_cols = max((sum(c.col_span for c in cells) for cells in rows), default=0)
 
+        grid: list = [[None for _ in range(num_cols)] for _ in range(num_rows)]
+
+        data = TableData(num_rows=num_rows, num_cols=num_cols, table_cells=[])
+
+        # Iterate over the rows in the table
+        for row_idx, cells in enumerate(rows):
+            # Check if each cell in the row is a header -> means it is a column header
+            col_header = all(cell.name != "td" for cell in cells)
+
+            col_idx = 0
+            for cell in cells:
                 while grid[row_idx][col_idx] is not None:
                     col_idx += 1
-                for r in range(row_span):
-                    for c in range(col_span):
-                        grid[row_idx + r][col_idx + c] = text
+                for r in range(cell.row_span):
+                    for c in range(cell.col_span):
+                        grid[row_idx + r][col_idx + c] = cell.text
 
                 table_cell = TableCell(
-                    text=text,
-                    row_span=row_span,
-                    col_span=col_span,
+                    text=cell.text,
+                    row_span=cell.row_span,
+                    col_span=cell.col_span,
                     start_row_offset_idx=row_idx,
-                    end_row_offset_idx=row_idx + row_span,
+                    end_row_offset_idx=row_idx + cell.row_span,
                     start_col_offset_idx=col_idx,
-                    end_col_offset_idx=col_idx + col_span,
+                    end_col_offset_idx=col_idx + cell.col_span,
                     col_header=col_header,
-                    row_header=((not col_header) and html_cell.name == "th"),
+                    row_header=((not col_header) and cell.name == "th"),
                 )
                 data.table_cells.append(table_cell)
 
@@ -514,19 +570,26 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
 
         contains_captions = element.find(["figcaption"])
         if not isinstance(contains_captions, Tag):
+            self.add_figure(doc, None)
+        else:
+            texts = []
+            for item in contains_captions:
+                texts.append(item.text)
+
+            self.add_figure(doc, "".join(texts))
+
+    def add_figure(self, doc: DoclingDocument, caption: Optional[str]) -> None:
+        """Adds a picture, with its caption if any."""
+        if caption is None:
             doc.add_picture(
                 parent=self.parents[self.level],
                 caption=None,
                 content_layer=self.content_layer,
             )
         else:
-            texts = []
-            for item in contains_captions:
-                texts.append(item.text)
-
             fig_caption = doc.add_text(
                 label=DocItemLabel.CAPTION,
-                text=("".join(texts)).strip(),
+                text=caption.strip(),
                 content_layer=self.content_layer,
             )
             doc.add_picture(
@@ -539,8 +602,4 @@ class HTMLDocumentBackend(DeclarativeDocumentBackend):
         """Handles image tags (img)."""
         _log.debug(f"ignoring <img> tags at the moment: {element}")
 
-        doc.add_picture(
-            parent=self.parents[self.level],
-            caption=None,
-            content_layer=self.content_layer,
-        )
+        self.add_figure(doc, None)
@@ -0,0 +1,365 @@
+import logging
+from typing import Callable, Final, Optional, Union
+
+import lxml.html
+from bs4.dammit import UnicodeDammit
+from docling_core.types.doc import DocItem, DoclingDocument, GroupItem
+from docling_core.types.doc.document import ContentLayer
+from lxml import etree
+from typing_extensions import override
+
+from docling.backend.html_backend import (
+    TAGS_FOR_NODE_ITEMS,
+    HTMLDocumentBackend,
+    HTMLTableCell,
+)
+
+_log = logging.getLogger(__name__)
+
+_HEADER_TAGS: Final = ("h1", "h2", "h3", "h4", "h5", "h6")
+
+# Tags whose strings are not part of the text of their ancestors, like the strings
+# of the special containers of the BeautifulSoup html.parser tree builder
+_STRING_CONTAINERS: Final = {"script", "style", "template", "rt", "rp"}
+
+# Tags where the whitespace-only strings are kept as they are
+_PRESERVE_WHITESPACE_TAGS: Final = {"pre", "textarea"}
+
+_ASCII_SPACES: Final = "\x20\x0a\x09\x0c\x0d"
+
+
+def _get_string(string: str, preserve_whitespace: bool) -> str:
+    """A string of the tree, with the whitespace-only strings collapsed.
+
+    Like BeautifulSoup, such a string is a newline if it has one, else a space.
+    """
+    if preserve_whitespace or string.strip(_ASCII_SPACES):
+        return string
+    return "\n" if "\n" in string else " "
+
+
+class _StringContext:
+    """The string container and the whitespace preservation within an element."""
+
+    def __init__(self, container: Optional[str], preserve_whitespace: bool):
+        self.container = container
+        self.preserve_whitespace = preserve_whitespace
+
+    @classmethod
+    def of(cls, element: lxml.html.HtmlElement) -> "_StringContext":
+        context = cls(None, False)
+        for el in reversed([element, *element.iterancestors()]):
+            context = context.enter(el)
+        return context
+
+    def enter(self, element: lxml.html.HtmlElement) -> "_StringContext":
+        return _StringContext(
+            element.tag if element.tag in _STRING_CONTAINERS else self.container,
+            self.preserve_whitespace or element.tag in _PRESERVE_WHITESPACE_TAGS,
+        )
+
+
+def _get_element_text(
+    element: lxml.html.HtmlElement,
+    context: Optional[_StringContext] = None,
+    with_formulas: bool = False,
+) -> str:
+    """The text of an element, as `Tag.text` of BeautifulSoup.
+
+    The strings are the ones of the element and its descendants, except comments
+    and the strings of other string containers. The string context of the element
+    is found from its ancestors, unless it is given. With `with_formulas`, the
+    inline formulas are replaced by their LaTeX between `$$`.
+    """
+    text_container = element.tag if element.tag in _STRING_CONTAINERS else None
+
+    parts: list[str] = []
+    contexts = [context or _StringContext.of(element)]
+    walker = etree.iterwalk(element, events=("start", "end", "comment", "pi"))
+    for event, el in walker:
+        if event == "start":
+            if el is not element:
+                contexts.append(contexts[-1].enter(el))
+            context = contexts[-1]
+            if with_formulas and el.tag == "inline-formula":
+                math_parts = _get_element_text(el, context).split("$$")
+                if len(math_parts) == 3:
+                    parts.append(f"$${math_parts[1]}$$")
+                    walker.skip_subtree()
+                    continue
+            if context.container == text_container:
+                if el.tag == "br":
+                    parts.append("\n")
+                elif el.text:
+                    parts.append(_get_string(el.text, context.preserve_whitespace))
+            continue
+
+        if event == "end":
+            contexts.pop()
+        if el is not element and el.tail and contexts[-1].container == text_container:
+            parts.append(_get_string(el.tail, contexts[-1].preserve_whitespace))
+
+    return "".join(parts)
+
+
+def _get_list_item_text(element: lxml.html.HtmlElement, context: _StringContext) -> str:
+    """The text of a list item with nested lists, as `get_text()` of the backend.
+
+    All strings are kept except the ones of the nested lists, and each element is
+    followed by a space.
+    """
+    parts: list[str] = []
+    contexts = [context]
+    walker = etree.iterwalk(element, events=("start", "end", "comment", "pi"))
+    for event, el in walker:
+        if event == "start":
+            if el is not element:
+                contexts.append(contexts[-1].enter(el))
+            if el.tag in ("ul", "ol"):
+                # The end event of a skipped element is still generated
+                walker.skip_subtree()
+            elif el.tag == "br":
+                parts.append("\n")
+            elif el.text:
+                parts.append(_get_string(el.text, contexts[-1].preserve_whitespace))
+            continue
+
+        if event == "end":
+            contexts.pop()
+            if el.tag != "br":
+                parts.append(" ")
+        elif event == "comment" and el.text:
+            parts.append(_get_string(el.text, contexts[-1].preserve_whitespace))
+        elif event == "pi":
+            pi_text = f"{el.target} {el.text}" if el.text else el.target
+            parts.append(_get_string(pi_text, contexts[-1].preserve_whitespace))
+        if el is not element and el.tail:
+            parts.append(_get_string(el.tail, contexts[-1].preserve_whitespace))
+
+    return "".join(parts) + " "
+
+
+class _WalkFrame:
+    """The children of an element being walked, with the position in them."""
+
+    def __init__(
+        self,
+        element: lxml.html.HtmlElement,
+        context: _StringContext,
+        on_exit: Optional[Callable[[], None]] = None,
+    ):
+        self.name: str = element.tag
+        self.context = context
+        self.on_exit = on_exit
+
+        # The strings and the elements, like the children of a BeautifulSoup tag
+        preserve = self.context.preserve_whitespace
+        self.children: list = []
+        if element.text:
+            self.children.append(_get_string(element.text, preserve))
+        for child in element:
+            # A line break is a string of its own
+            self.children.append("\n" if child.tag == "br" else child)
+            if child.tail:
+                self.children.append(_get_string(child.tail, preserve))
+
+        # Whether an element generating a node item follows each position
+        self.node_item_after = [False] * (len(self.children) + 1)
+        for ix in range(len(self.children) - 1, -1, -1):
+            child = self.children[ix]
+            self.node_item_after[ix] = self.node_item_after[ix + 1] or (
+                not isinstance(child, str) and child.tag in TAGS_FOR_NODE_ITEMS
+            )
+
+        self.index = 0
+        self.text = ""
+
+
+class LxmlHTMLDocumentBackend(HTMLDocumentBackend):
+    """HTML backend parsing with lxml, for large documents.
+
+    The document is the same as the one of the BeautifulSoup-based backend, where
+    the <br> tags are line breaks. The tree is walked with an explicit stack
+    instead of recursive calls, such that the depth of the HTML is not limited by
+    the recursion limit.
+    """
+
+    @override
+    def load(self, html_content: bytes) -> None:
+        self.root: Optional[lxml.html.HtmlElement] = None
+        # Decode like BeautifulSoup, the declared encoding or utf-8 first
+        markup = UnicodeDammit(html_content, is_html=True).unicode_markup
+        parser = lxml.html.HTMLParser(encoding="utf-8", huge_tree=True)
+        self.root = lxml.html.document_fromstring(markup.encode("utf-8"), parser=parser)
+
+    @override
+    def is_valid(self) -> bool:
+        return self.root is not None
+
+    @override
+    def convert_content(
+        self,
+        doc: DoclingDocument,
+        parent: Optional[Union[DocItem, GroupItem]] = None,
+        fragment: bool = False,
+    ) -> None:
+        assert self.root is not None
+        content = self.root.find("body")
+        if content is None:
+            content = self.root
+
+        headers = next(content.iter(*_HEADER_TAGS), None)
+        self.content_layer = (
+            ContentLayer.BODY if headers is None or fragment else ContentLayer.FURNITURE
+        )
+        self.parents[0] = parent
+        self.walk(content, doc)
+
+    @override
+    def walk(self, tag: lxml.html.HtmlElement, doc: DoclingDocument) -> None:
+        stack = [_WalkFrame(tag, _StringContext.of(tag))]
+        while stack:
+            frame = stack[-1]
+            if frame.index == len(frame.children):
+                stack.pop()
+                if frame.on_exit is not None:
+                    frame.on_exit()
+                continue
+
+            ix = frame.index
+            frame.index += 1
+            element = frame.children[ix]
+            if isinstance(element, str):
+                # Floating text outside paragraphs or analyzed tags
+                frame.text += element
+                if ix == len(frame.children) - 1 or frame.node_item_after[ix + 1]:
+                    text = frame.text.strip()
+                    if text and frame.name in ["div"]:
+                        self.add_paragraph(doc, text)
+                    frame.text = ""
+                continue
+
+            # Skip the comments and processing instructions
+            if not isinstance(element.tag, str):
+                continue
+
+            try:
+                child_frame = self.analyze_element(
+                    element, frame.context.enter(element), doc
+                )
+            except Exception as exc_child:
+                _log.error(f"Error processing child from tag{frame.name}: {exc_child}")
+                raise exc_child
+            if child_frame is not None:
+                stack.append(child_frame)
+
+    def analyze_element(
+        self,
+        element: lxml.html.HtmlElement,
+        context: _StringContext,
+        doc: DoclingDocument,
+    ) -> Optional[_WalkFrame]:
+        """Handles an element, and returns its frame if its children are walked."""
+        name = element.tag
+        if name in _HEADER_TAGS:
+            hlevel = int(name.replace("h", ""))
+            self.add_header(doc, hlevel, _get_element_text(element, context).strip())
+        elif name == "p":
+            self.add_paragraph(doc, _get_element_text(element, context))
+        elif name == "pre":
+            self.add_code(doc, _get_element_text(element, context))
+        elif name in ["ul", "ol"]:
+            self.open_list(doc, name, element.get("start"))
+            return _WalkFrame(element, context, on_exit=self.close_level)
+        elif name == "li":
+            return self.handle_list_element(element, context, doc)
+        elif name == "table":
+            self.handle_table_element(element, context, doc)
+        elif name == "figure":
+            self.handle_figure_element(element, doc)
+        elif name == "img":
+            self.add_figure(doc, None)
+        else:
+            return _WalkFrame(element, context)
+        return None
+
+    def handle_list_element(
+        self,
+        element: lxml.html.HtmlElement,
+        context: _StringContext,
+        doc: DoclingDocument,
+    ) -> Optional[_WalkFrame]:
+        nested_list = next(element.iterdescendants("ul", "ol"), None)
+
+        parent = self.parents[self.level]
+        if parent is None:
+            _log.debug("list-item has no parent in DoclingDocument")
+            return None
+
+        if nested_list is not None:
+            # Text in list item can be hidden within hierarchy, hence
+            # we need to extract it from all the descendants
+            self.open_list_item(doc, parent, _get_list_item_text(element, context))
+            return _WalkFrame(element, context, on_exit=self.close_level)
+
+        text = _get_element_text(element, context).strip()
+        if text:
+            self.add_list_item(doc, parent, text)
+        else:
+            _log.debug("list-item has no text")
+        return None
+
+    def handle_table_element(
+        self,
+        element: lxml.html.HtmlElement,
+        context: _StringContext,
+        doc: DoclingDocument,
+    ) -> None:
+        if next(element.iterdescendants("table"), None) is not None:
+            _log.debug("Skipping nested table.")
+            return
+
+        # Collect the cells of each row in one pass over the table
+        rows: list[list[HTMLTableCell]] = []
+        for row in element.iterdescendants("tr"):
+            cells: list[HTMLTableCell] = []
+            for html_cell in row.iterdescendants("td", "th"):
+                col_val = html_cell.get("colspan", "1")
+                row_val = html_cell.get("rowspan", "1")
+                cells.append(
+                    HTMLTableCell(
+                        name=html_cell.tag,
+                        text=_get_element_text(
+                            html_cell, context.enter(html_cell), with_formulas=True
+                        ),
+                        col_span=int(col_val) if col_val.isnumeric() else 1,
+                        row_span=int(row_val) if row_val.isnumeric() else 1,
+                    )
+                )
+            rows.append(cells)
+
+        doc.add_table(
+            data=self.build_table_data(rows),
+            parent=self.parents[self.level],
+            content_layer=self.content_layer,
+        )
+
+    def handle_figure_element(
+        self, element: lxml.html.HtmlElement, doc: DoclingDocument
+    ) -> None:
+        figcaption = next(element.iterdescendants("figcaption"), None)
+        if figcaption is None:
+            self.add_figure(doc, None)
+            return
+
+        # The text of the children of the caption, where comments have no text
+        context = _StringContext.of(figcaption)
+        texts = []
+        if figcaption.text:
+            texts.append(_get_string(figcaption.text, context.preserve_whitespace))
+        for child in figcaption:
+            if isinstance(child.tag, str):
+                texts.append(_get_element_text(child, context.enter(child)))
+            if child.tail:
+                texts.append(_get_string(child.tail, context.preserve_whitespace))
+        self.add_figure(doc, "".join(texts))
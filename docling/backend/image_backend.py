@@ -0,0 +1,158 @@
+import logging
+from io import BytesIO
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Optional, Set, Union
+
+from docling_core.types.doc import BoundingBox, CoordOrigin, Size
+from PIL import Image, UnidentifiedImageError
+
+from docling.backend.pdf_backend import PdfDocumentBackend, PdfPageBackend
+from docling.datamodel.base_models import Cell, InputFormat
+
+if TYPE_CHECKING:
+    from docling.datamodel.document import InputDocument
+
+_log = logging.getLogger(__name__)
+
+
+class ImagePageBackend(PdfPageBackend):
+    """Page backend serving a single frame of a (multi-frame) image.
+
+    The page is measured in points, using the resolution stored in the image
+    metadata (72 dpi when missing). The frame is only decoded on the first
+    request of a page bitmap and released with `unload()`.
+    """
+
+    def __init__(self, image: Image.Image, page_no: int):
+        self.valid = True
+        self._image: Optional[Image.Image] = image
+        self._frame: Optional[Image.Image] = None
+        self.page_no = page_no
+
+        try:
+            # Seeking only parses the frame header, the pixels are decoded lazily.
+            image.seek(page_no)
+            self._px_size = image.size
+            self._px_per_pt = self._get_px_per_pt(image)
+        except (EOFError, OSError, ValueError):
+            _log.info(f"Could not load frame {page_no} of the image.", exc_info=True)
+            self.valid = False
+            self._px_size = (0, 0)
+            self._px_per_pt = (1.0, 1.0)
+
+    @staticmethod
+    def _get_px_per_pt(image: Image.Image) -> tuple[float, float]:
+        dpi = image.info.get("dpi", (72, 72))
+        try:
+            dpi_x, dpi_y = float(dpi[0]), float(dpi[1])
+        except (TypeError, ValueError, IndexError):
+            dpi_x, dpi_y = 72.0, 72.0
+        if dpi_x <= 1 or dpi_y <= 1:
+            dpi_x, dpi_y = 72.0, 72.0
+        return dpi_x / 72.0, dpi_y / 72.0
+
+    def _get_frame(self) -> Image.Image:
+        if self._frame is None:
+            assert self._image is not None
+            self._image.seek(self.page_no)
+            self._frame = self._image.convert("RGB")
+        return self._frame
+
+    def is_valid(self) -> bool:
+        return self.valid
+
+    def get_text_in_rect(self, bbox: BoundingBox) -> str:
+        # Images have no programmatic text layer
+        return ""
+
+    def get_text_cells(self) -> Iterable[Cell]:
+        # Images have no programmatic text layer
+        return []
+
+    def get_bitmap_rects(self, scale: float = 1) -> Iterable[BoundingBox]:
+        # The whole page is a bitmap
+        page_size = self.get_size()
+        yield BoundingBox(
+            l=0,
+            t=0,
+            r=page_size.width,
+            b=page_size.height,
+            coord_origin=CoordOrigin.TOPLEFT,
+        ).scaled(scale=scale)
+
+    def get_page_image(
+        self, scale: float = 1, cropbox: Optional[BoundingBox] = None
+    ) -> Image.Image:
+        page_size = self.get_size()
+
+        if not cropbox:
+            cropbox = BoundingBox(
+                l=0,
+                r=page_size.width,
+                t=0,
+                b=page_size.height,
+                coord_origin=CoordOrigin.TOPLEFT,
+            )
+        else:
+            cropbox = cropbox.to_top_left_origin(page_height=page_size.height)
+
+        sx, sy = self._px_per_pt
+        box = (cropbox.l * sx, cropbox.t * sy, cropbox.r * sx, cropbox.b * sy)
+        size = (
+            max(1, round(cropbox.width * scale)),
+            max(1, round(cropbox.height * scale)),
+        )
+
+        return self._get_frame().resize(
+            size=size, resample=Image.Resampling.BICUBIC, box=box
+        )
+
+    def get_size(self) -> Size:
+        return Size(
+            width=self._px_size[0] / self._px_per_pt[0],
+            height=self._px_size[1] / self._px_per_pt[1],
+        )
+
+    def unload(self):
+        self._frame = None
+        self._image = None
+
+
+class ImageDocumentBackend(PdfDocumentBackend):
+    """Backend for image inputs, including multi-page TIFF files.
+
+    The page bitmaps are served directly from the decoded image, without the
+    round-trip through a generated PDF. Frames are decoded one at a time when
+    their page is processed.
+    """
+
+    def __init__(self, in_doc: "InputDocument", path_or_stream: Union[BytesIO, Path]):
+        super().__init__(in_doc, path_or_stream)
+
+        try:
+            self._image: Optional[Image.Image] = Image.open(self.path_or_stream)
+        except (UnidentifiedImageError, OSError) as e:
+            raise RuntimeError(
+                f"Could not load image document with hash {self.document_hash}"
+            ) from e
+
+    def page_count(self) -> int:
+        assert self._image is not None
+        return getattr(self._image, "n_frames", 1)
+
+    def load_page(self, page_no: int) -> ImagePageBackend:
+        assert self._image is not None
+        return ImagePageBackend(self._image, page_no)
+
+    def is_valid(self) -> bool:
+        return self._image is not None and self.page_count() > 0
+
+    @classmethod
+    def supported_formats(cls) -> Set[InputFormat]:
+        return {InputFormat.IMAGE}
+
+    def unload(self):
+        if self._image is not None:
+            self._image.close()
+            self._image = None
+        super().unload()
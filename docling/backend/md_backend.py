@@ -1,9 +1,7 @@
 import logging
-import re
-import warnings
 from io import BytesIO
 from pathlib import Path
-from typing import List, Optional, Set, Union
+from typing import List, Optional, Set, Union, cast
 
 import marko
 import marko.element
@@ -15,6 +13,7 @@ from docling_core.types.doc import (
     DocItemLabel,
     DoclingDocument,
     DocumentOrigin,
+    GroupItem,
     GroupLabel,
     NodeItem,
     TableCell,
@@ -30,35 +29,8 @@ from docling.datamodel.document import InputDocument
 
 _log = logging.getLogger(__name__)
 
-_MARKER_BODY = "DOCLING_DOC_MD_HTML_EXPORT"
-_START_MARKER = f"#_#_{_MARKER_BODY}_START_#_#"
-_STOP_MARKER = f"#_#_{_MARKER_BODY}_STOP_#_#"
-
 
 class MarkdownDocumentBackend(DeclarativeDocumentBackend):
-    def _shorten_underscore_sequences(self, markdown_text: str, max_length: int = 10):
-        # This regex will match any sequence of underscores
-        pattern = r"_+"
-
-        def replace_match(match):
-            underscore_sequence = match.group(
-                0
-            )  # Get the full match (sequence of underscores)
-
-            # Shorten the sequence if it exceeds max_length
-            if len(underscore_sequence) > max_length:
-                return "_" * max_length
-            else:
-                return underscore_sequence  # Leave it unchanged if it is shorter or equal to max_length
-
-        # Use re.sub to replace long underscore sequences
-        shortened_text = re.sub(pattern, replace_match, markdown_text)
-
-        if len(shortened_text) != len(markdown_text):
-            warnings.warn("Detected potentially incorrect Markdown, correcting...")
-
-        return shortened_text
-
     def __init__(self, in_doc: "InputDocument", path_or_stream: Union[BytesIO, Path]):
         super().__init__(in_doc, path_or_stream)
 
@@ -72,24 +44,15 @@ class MarkdownDocumentBackend(DeclarativeDocumentBackend):
         self.in_table = False
         self.md_table_buffer: list[str] = []
         self.inline_texts: list[str] = []
-        self._html_blocks: int = 0
+        # The input of the embedded HTML blocks, parsed as fragments
+        self.in_doc = in_doc
 
         try:
             if isinstance(self.path_or_stream, BytesIO):
-                text_stream = self.path_or_stream.getvalue().decode("utf-8")
-                # remove invalid sequences
-                # very long sequences of underscores will lead to unnecessary long processing times.
-                # In any proper Markdown files, underscores have to be escaped,
-                # otherwise they represent emphasis (bold or italic)
-                self.markdown = self._shorten_underscore_sequences(text_stream)
+                self.markdown = self.path_or_stream.getvalue().decode("utf-8")
             if isinstance(self.path_or_stream, Path):
                 with open(self.path_or_stream, "r", encoding="utf-8") as f:
-                    md_content = f.read()
-                    # remove invalid sequences
-                    # very long sequences of underscores will lead to unnecessary long processing times.
-                    # In any proper Markdown files, underscores have to be escaped,
-                    # otherwise they represent emphasis (bold or italic)
-                    self.markdown = self._shorten_underscore_sequences(md_content)
+                    self.markdown = f.read()
             self.valid = True
 
             _log.debug(self.markdown)
@@ -298,7 +261,7 @@ class MarkdownDocumentBackend(DeclarativeDocumentBackend):
         ):
             self._close_table(doc)
             self._process_inline_text(parent_item, doc)
-            _log.debug(f" - Code Block: {element.children}")
+            _log.debug(" - Code Block: %s", element.children)
             doc.add_code(parent=parent_item, text=snippet_text)
 
         elif isinstance(element, marko.inline.LineBreak):
@@ -307,22 +270,26 @@ class MarkdownDocumentBackend(DeclarativeDocumentBackend):
                 self.md_table_buffer.append("")
 
         elif isinstance(element, marko.block.HTMLBlock):
-            self._html_blocks += 1
             self._process_inline_text(parent_item, doc)
             self._close_table(doc)
-            _log.debug("HTML Block: {}".format(element))
+            _log.debug("HTML Block: %s", element)
             if (
                 len(element.body) > 0
             ):  # If Marko doesn't return any content for HTML block, skip it
-                html_block = element.body.strip()
-
-                # wrap in markers to enable post-processing in convert()
-                text_to_add = f"{_START_MARKER}{html_block}{_STOP_MARKER}"
-                doc.add_code(parent=parent_item, text=text_to_add)
+                # Parse the HTML fragment in place, adding its items under the parent
+                html_backend = HTMLDocumentBackend(
+                    in_doc=self.in_doc,
+                    path_or_stream=BytesIO(element.body.encode("utf-8")),
+                )
+                html_backend.convert_content(
+                    doc,
+                    parent=cast(Optional[Union[DocItem, GroupItem]], parent_item),
+                    fragment=True,
+                )
         else:
             if not isinstance(element, str):
                 self._close_table(doc)
-                _log.debug("Some other element: {}".format(element))
+                _log.debug("Some other element: %s", element)
 
         processed_block_types = (
             marko.block.Heading,
@@ -385,42 +352,6 @@ class MarkdownDocumentBackend(DeclarativeDocumentBackend):
             )
             self._process_inline_text(None, doc)  # handle last hanging inline text
             self._close_table(doc=doc)  # handle any last hanging table
-
-            # if HTML blocks were detected, export to HTML and delegate to HTML backend
-            if self._html_blocks > 0:
-
-                # export to HTML
-                html_backend_cls = HTMLDocumentBackend
-                html_str = doc.export_to_html()
-
-                def _restore_original_html(txt, regex):
-                    _txt, count = re.subn(regex, "", txt)
-                    if count != self._html_blocks:
-                        raise RuntimeError(
-                            "An internal error has occurred during Markdown conversion."
-                        )
-                    return _txt
-
-                # restore original HTML by removing previouly added markers
-                for regex in [
-                    rf"<pre>\s*<code>\s*{_START_MARKER}",
-                    rf"{_STOP_MARKER}\s*</code>\s*</pre>",
-                ]:
-                    html_str = _restore_original_html(txt=html_str, regex=regex)
-                self._html_blocks = 0
-
-                # delegate to HTML backend
-                stream = BytesIO(bytes(html_str, encoding="utf-8"))
-                in_doc = InputDocument(
-                    path_or_stream=stream,
-                    format=InputFormat.HTML,
-                    backend=html_backend_cls,
-                    filename=self.file.name,
-                )
-                html_backend_obj = html_backend_cls(
-                    in_doc=in_doc, path_or_stream=stream
-                )
-                doc = html_backend_obj.convert()
         else:
             raise RuntimeError(
                 f"Cannot convert md with {self.document_hash} because the backend failed to init."
@@ -1,7 +1,9 @@
 import logging
+from bisect import bisect_right
+from collections import defaultdict
 from io import BytesIO
 from pathlib import Path
-from typing import Dict, Set, Tuple, Union
+from typing import Dict, Iterable, Optional, Set, Tuple, Union
 
 from docling_core.types.doc import (
     DoclingDocument,
@@ -14,9 +16,19 @@ from docling_core.types.doc import (
 
 # from lxml import etree
 from openpyxl import Workbook, load_workbook
-from openpyxl.cell.cell import Cell
 from openpyxl.drawing.image import Image
-from openpyxl.worksheet.worksheet import Worksheet
+from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
+from openpyxl.packaging.relationship import get_dependents, get_rels_path
+from openpyxl.reader.drawings import find_images
+from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+from openpyxl.worksheet.cell_range import CellRange
+
+try:
+    # Private parser of openpyxl, which also provides the merged cells of the
+    # read-only sheets
+    from openpyxl.worksheet._reader import WorkSheetParser
+except ImportError:
+    WorkSheetParser = None  # type: ignore
 
 from docling.backend.abstract_backend import DeclarativeDocumentBackend
 from docling.datamodel.base_models import InputFormat
@@ -44,6 +56,117 @@ class ExcelTable(BaseModel):
     data: List[ExcelCell]
 
 
+class ExcelMergedRanges:
+    """Index of the merged cell ranges of a sheet, by row.
+
+    The ranges crossing each row are sorted by their first column, such that the
+    range of a cell is found with a binary search.
+    """
+
+    def __init__(self, ranges: Iterable[CellRange]):
+        rows: Dict[int, List[CellRange]] = defaultdict(list)
+        for merged_range in ranges:
+            for ri in range(merged_range.min_row - 1, merged_range.max_row):
+                rows[ri].append(merged_range)
+
+        self._ranges: Dict[int, List[CellRange]] = {}
+        self._starts: Dict[int, List[int]] = {}
+        for ri, row_ranges in rows.items():
+            row_ranges.sort(key=lambda mr: mr.min_col)
+            self._ranges[ri] = row_ranges
+            self._starts[ri] = [mr.min_col - 1 for mr in row_ranges]
+
+    def get(self, row: int, col: int) -> Optional[CellRange]:
+        """The merged range containing a cell, by 0-based row and column."""
+        starts = self._starts.get(row)
+        if starts is None:
+            return None
+        ix = bisect_right(starts, col) - 1
+        if ix < 0:
+            return None
+        merged_range = self._ranges[row][ix]
+        return merged_range if col < merged_range.max_col else None
+
+
+class ExcelSheetData:
+    """The content of a sheet, read in one streaming pass over its XML.
+
+    Only the cells with a value are kept, by 0-based row and column. The occupied
+    cells of each row, with a value or in a merged range, are kept as a bitmap
+    where bit j is set for column j.
+
+    The sheet XML is parsed with the private parser of openpyxl. When it is not
+    available, the values are read with `iter_rows()` and the merged cells, which
+    read-only sheets do not expose, are ignored.
+    """
+
+    def __init__(self, sheet: ReadOnlyWorksheet):
+        self.values: Dict[Tuple[int, int], Any] = {}
+        self.value_bits: Dict[int, int] = {}
+        self.occupied_bits: Dict[int, int] = {}
+
+        merged_ranges: List[CellRange] = []
+        if self._can_parse_xml(sheet):
+            merged_ranges = self._parse_xml(sheet)
+        else:
+            _log.warning(
+                f"Cannot parse the XML of sheet {sheet.title}, its merged cells are ignored."
+            )
+            for ri, row in enumerate(sheet.iter_rows(values_only=True)):
+                self._add_row(ri, enumerate(row))
+
+        self.merged_ranges = ExcelMergedRanges(merged_ranges)
+
+        for merged_range in merged_ranges:
+            range_bits = ((1 << merged_range.size["columns"]) - 1) << (
+                merged_range.min_col - 1
+            )
+            for ri in range(merged_range.min_row - 1, merged_range.max_row):
+                self.occupied_bits[ri] = self.occupied_bits.get(ri, 0) | range_bits
+
+    @staticmethod
+    def _can_parse_xml(sheet: ReadOnlyWorksheet) -> bool:
+        workbook = sheet.parent
+        return (
+            WorkSheetParser is not None
+            and hasattr(sheet, "_get_source")
+            and hasattr(sheet, "_shared_strings")
+            and hasattr(workbook, "_date_formats")
+            and hasattr(workbook, "_timedelta_formats")
+        )
+
+    def _parse_xml(self, sheet: ReadOnlyWorksheet) -> List[CellRange]:
+        workbook = sheet.parent
+        with sheet._get_source() as src:
+            parser = WorkSheetParser(
+                src,
+                sheet._shared_strings,
+                data_only=workbook.data_only,
+                epoch=workbook.epoch,
+                date_formats=workbook._date_formats,
+                timedelta_formats=workbook._timedelta_formats,
+            )
+            for row_no, cells in parser.parse():
+                self._add_row(
+                    row_no - 1, ((cell["column"] - 1, cell["value"]) for cell in cells)
+                )
+
+        # The merged cells are listed after the cells in the sheet XML
+        if parser.merged_cells is None:
+            return []
+        return [CellRange(mc.ref) for mc in parser.merged_cells.mergeCell]
+
+    def _add_row(self, ri: int, cells: Iterable[Tuple[int, Any]]):
+        row_bits = 0
+        for ci, value in cells:
+            if value is not None:
+                self.values[(ri, ci)] = value
+                row_bits |= 1 << ci
+        if row_bits:
+            self.value_bits[ri] = row_bits
+            self.occupied_bits[ri] = row_bits
+
+
 class MsExcelDocumentBackend(DeclarativeDocumentBackend):
     def __init__(self, in_doc: "InputDocument", path_or_stream: Union[BytesIO, Path]):
         super().__init__(in_doc, path_or_stream)
@@ -57,11 +180,16 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend):
 
         self.workbook = None
         try:
+            # The sheets are streamed from the archive, which is open until unload
             if isinstance(self.path_or_stream, BytesIO):
-                self.workbook = load_workbook(filename=self.path_or_stream)
+                self.workbook = load_workbook(
+                    filename=self.path_or_stream, read_only=True
+                )
 
             elif isinstance(self.path_or_stream, Path):
-                self.workbook = load_workbook(filename=str(self.path_or_stream))
+                self.workbook = load_workbook(
+                    filename=str(self.path_or_stream), read_only=True
+                )
 
             self.valid = True
         except Exception as e:
@@ -80,6 +208,10 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend):
         return True
 
     def unload(self):
+        if self.workbook is not None:
+            self.workbook.close()
+            self.workbook = None
+
         if isinstance(self.path_or_stream, BytesIO):
             self.path_or_stream.close()
 
@@ -132,17 +264,21 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend):
 
         return doc
 
-    def _convert_sheet(self, doc: DoclingDocument, sheet: Worksheet):
+    def _convert_sheet(self, doc: DoclingDocument, sheet: ReadOnlyWorksheet):
 
-        doc = self._find_tables_in_sheet(doc, sheet)
+        if not isinstance(sheet, ReadOnlyWorksheet):
+            _log.info(f"Skipping sheet without cells: {sheet.title}")
+            return doc
+
+        doc = self._find_tables_in_sheet(doc, ExcelSheetData(sheet))
 
         doc = self._find_images_in_sheet(doc, sheet)
 
         return doc
 
-    def _find_tables_in_sheet(self, doc: DoclingDocument, sheet: Worksheet):
+    def _find_tables_in_sheet(self, doc: DoclingDocument, sheet_data: ExcelSheetData):
 
-        tables = self._find_data_tables(sheet)
+        tables = self._find_data_tables(sheet_data)
 
         for excel_table in tables:
             num_rows = excel_table.num_rows
@@ -173,161 +309,135 @@ class MsExcelDocumentBackend(DeclarativeDocumentBackend):
 
         return doc
 
-    def _find_data_tables(self, sheet: Worksheet):
+    def _find_data_tables(self, sheet_data: "ExcelSheetData") -> List[ExcelTable]:
         """
         Find all compact rectangular data tables in a sheet.
         """
-        # _log.info("find_data_tables")
-
-        tables = []  # List to store found tables
-        visited: set[Tuple[int, int]] = set()  # Track already visited cells
-
-        # Iterate over all cells in the sheet
-        for ri, row in enumerate(sheet.iter_rows(values_only=False)):
-            for rj, cell in enumerate(row):
-
-                # Skip empty or already visited cells
-                if cell.value is None or (ri, rj) in visited:
-                    continue
-
-                # If the cell starts a new table, find its bounds
-                table_bounds, visited_cells = self._find_table_bounds(
-                    sheet, ri, rj, visited
+        tables: List[ExcelTable] = []  # List to store found tables
+        visited: Dict[int, int] = {}  # Bitmap of the visited cells, by row
+
+        # Iterate over the cells with a value, row by row
+        for ri in sorted(sheet_data.value_bits):
+            candidates = sheet_data.value_bits[ri] & ~visited.get(ri, 0)
+            while candidates:
+                rj = (candidates & -candidates).bit_length() - 1
+
+                # The cell starts a new table, find its bounds
+                tables.append(self._find_table_bounds(sheet_data, ri, rj, visited))
+
+                # Skip the cells visited by the table, on the right of the cell
+                candidates = (
+                    sheet_data.value_bits[ri]
+                    & ~visited.get(ri, 0)
+                    & ~((1 << (rj + 1)) - 1)
                 )
 
-                visited.update(visited_cells)  # Mark these cells as visited
-                tables.append(table_bounds)
-
         return tables
 
     def _find_table_bounds(
         self,
-        sheet: Worksheet,
+        sheet_data: "ExcelSheetData",
         start_row: int,
         start_col: int,
-        visited: set[Tuple[int, int]],
-    ):
+        visited: Dict[int, int],
+    ) -> ExcelTable:
         """
         Determine the bounds of a compact rectangular table.
-        Returns:
-        - A dictionary with the bounds and data.
-        - A set of visited cell coordinates.
+        The cells of the table, and the cells spanned by them, are marked in
+        `visited`.
         """
-        _log.info("find_table_bounds")
-
-        max_row = self._find_table_bottom(sheet, start_row, start_col)
-        max_col = self._find_table_right(sheet, start_row, start_col)
+        max_row = self._find_table_bottom(sheet_data, start_row, start_col)
+        max_col = self._find_table_right(sheet_data, start_row, start_col)
 
         # Collect the data within the bounds
         data = []
-        visited_cells = set()
+        spanned_cells: Set[Tuple[int, int]] = set()
         for ri in range(start_row, max_row + 1):
             for rj in range(start_col, max_col + 1):
-
-                cell = sheet.cell(row=ri + 1, column=rj + 1)  # 1-based indexing
+                if (ri, rj) in spanned_cells:
+                    continue
 
                 # Check if the cell belongs to a merged range
                 row_span = 1
                 col_span = 1
-
-                # _log.info(sheet.merged_cells.ranges)
-                for merged_range in sheet.merged_cells.ranges:
-
-                    if (
-                        merged_range.min_row <= ri + 1
-                        and ri + 1 <= merged_range.max_row
-                        and merged_range.min_col <= rj + 1
-                        and rj + 1 <= merged_range.max_col
-                    ):
-
-                        row_span = merged_range.max_row - merged_range.min_row + 1
-                        col_span = merged_range.max_col - merged_range.min_col + 1
-                        break
-
-                if (ri, rj) not in visited_cells:
-                    data.append(
-                        ExcelCell(
-                            row=ri - start_row,
-                            col=rj - start_col,
-                            text=str(cell.value),
-                            row_span=row_span,
-                            col_span=col_span,
-                        )
+                merged_range = sheet_data.merged_ranges.get(ri, rj)
+                if merged_range is not None:
+                    row_span = merged_range.max_row - merged_range.min_row + 1
+                    col_span = merged_range.max_col - merged_range.min_col + 1
+
+                data.append(
+                    ExcelCell(
+                        row=ri - start_row,
+                        col=rj - start_col,
+                        text=str(sheet_data.values.get((ri, rj))),
+                        row_span=row_span,
+                        col_span=col_span,
                     )
-                    # _log.info(f"cell: {ri}, {rj} -> {ri - start_row}, {rj - start_col}, {row_span}, {col_span}: {str(cell.value)}")
+                )
 
-                    # Mark all cells in the span as visited
+                # Mark all cells in the span as visited
+                if row_span > 1 or col_span > 1:
+                    span_bits = ((1 << col_span) - 1) << rj
                     for span_row in range(ri, ri + row_span):
+                        visited[span_row] = visited.get(span_row, 0) | span_bits
                         for span_col in range(rj, rj + col_span):
-                            visited_cells.add((span_row, span_col))
+                            spanned_cells.add((span_row, span_col))
 
-        return (
-            ExcelTable(
-                num_rows=max_row + 1 - start_row,
-                num_cols=max_col + 1 - start_col,
-                data=data,
-            ),
-            visited_cells,
+            table_bits = ((1 << (max_col + 1 - start_col)) - 1) << start_col
+            visited[ri] = visited.get(ri, 0) | table_bits
+
+        return ExcelTable(
+            num_rows=max_row + 1 - start_row,
+            num_cols=max_col + 1 - start_col,
+            data=data,
         )
 
-    def _find_table_bottom(self, sheet: Worksheet, start_row: int, start_col: int):
+    def _find_table_bottom(
+        self, sheet_data: "ExcelSheetData", start_row: int, start_col: int
+    ) -> int:
         """Function to find the bottom boundary of the table"""
 
+        # Stop at the first cell which is empty and not merged
         max_row = start_row
-
-        while max_row < sheet.max_row - 1:
-            # Get the cell value or check if it is part of a merged cell
-            cell = sheet.cell(row=max_row + 2, column=start_col + 1)
-
-            # Check if the cell is part of a merged range
-            merged_range = next(
-                (mr for mr in sheet.merged_cells.ranges if cell.coordinate in mr),
-                None,
-            )
-
-            if cell.value is None and not merged_range:
-                break  # Stop if the cell is empty and not merged
-
-            # Expand max_row to include the merged range if applicable
-            if merged_range:
-                max_row = max(max_row, merged_range.max_row - 1)
-            else:
-                max_row += 1
+        col_bit = 1 << start_col
+        while sheet_data.occupied_bits.get(max_row + 1, 0) & col_bit:
+            max_row += 1
 
         return max_row
 
-    def _find_table_right(self, sheet: Worksheet, start_row: int, start_col: int):
+    def _find_table_right(
+        self, sheet_data: "ExcelSheetData", start_row: int, start_col: int
+    ) -> int:
         """Function to find the right boundary of the table"""
 
-        max_col = start_col
-
-        while max_col < sheet.max_column - 1:
-            # Get the cell value or check if it is part of a merged cell
-            cell = sheet.cell(row=start_row + 1, column=max_col + 2)
-
-            # Check if the cell is part of a merged range
-            merged_range = next(
-                (mr for mr in sheet.merged_cells.ranges if cell.coordinate in mr),
-                None,
-            )
+        # Stop at the first cell which is empty and not merged, i.e. after the
+        # trailing ones of the row bitmap from the start column
+        row_bits = sheet_data.occupied_bits.get(start_row, 0) >> start_col
+        num_cols = ((row_bits + 1) & ~row_bits).bit_length() - 1
 
-            if cell.value is None and not merged_range:
-                break  # Stop if the cell is empty and not merged
+        return start_col + max(num_cols, 1) - 1
 
-            # Expand max_col to include the merged range if applicable
-            if merged_range:
-                max_col = max(max_col, merged_range.max_col - 1)
-            else:
-                max_col += 1
+    def _get_sheet_images(self, sheet: ReadOnlyWorksheet) -> List[Image]:
+        """The images of a sheet, which are not loaded in read-only mode."""
+        archive = sheet.parent._archive
+        rels_path = get_rels_path(sheet._worksheet_path)
+        if rels_path not in archive.namelist():
+            return []
 
-        return max_col
+        images: List[Image] = []
+        for rel in get_dependents(archive, rels_path).find(
+            SpreadsheetDrawing._rel_type
+        ):
+            _, drawing_images = find_images(archive, rel.target)
+            images.extend(drawing_images)
+        return images
 
     def _find_images_in_sheet(
-        self, doc: DoclingDocument, sheet: Worksheet
+        self, doc: DoclingDocument, sheet: ReadOnlyWorksheet
     ) -> DoclingDocument:
 
         # Iterate over byte images in the sheet
-        for idx, image in enumerate(sheet._images):  # type: ignore
+        for idx, image in enumerate(self._get_sheet_images(sheet)):
 
             try:
                 pil_image = PILImage.open(image.ref)
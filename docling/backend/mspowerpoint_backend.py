@@ -1,7 +1,8 @@
 import logging
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from io import BytesIO
 from pathlib import Path
-from typing import Set, Union
+from typing import Optional, Set, Union
 
 from docling_core.types.doc import (
     BoundingBox,
@@ -10,13 +11,12 @@ from docling_core.types.doc import (
     DoclingDocument,
     DocumentOrigin,
     GroupLabel,
-    ImageRef,
     ProvenanceItem,
     Size,
     TableCell,
     TableData,
 )
-from PIL import Image, UnidentifiedImageError
+from PIL import UnidentifiedImageError
 from pptx import Presentation
 from pptx.enum.shapes import MSO_SHAPE_TYPE, PP_PLACEHOLDER
 
@@ -26,6 +26,13 @@ from docling.backend.abstract_backend import (
 )
 from docling.datamodel.base_models import InputFormat
 from docling.datamodel.document import InputDocument
+from docling.datamodel.settings import (
+    BatchConcurrencySettings,
+    ImageExtractionMode,
+    settings,
+)
+from docling.utils.document_fragments import append_document_fragment
+from docling.utils.embedded_images import get_embedded_image_ref
 
 _log = logging.getLogger(__name__)
 
@@ -44,10 +51,7 @@ class MsPowerpointDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentB
         self.pptx_obj = None
         self.valid = False
         try:
-            if isinstance(self.path_or_stream, BytesIO):
-                self.pptx_obj = Presentation(self.path_or_stream)
-            elif isinstance(self.path_or_stream, Path):
-                self.pptx_obj = Presentation(str(self.path_or_stream))
+            self.pptx_obj = self.load_presentation()
 
             self.valid = True
         except Exception as e:
@@ -57,6 +61,13 @@ class MsPowerpointDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentB
 
         return
 
+    def load_presentation(self):
+        if isinstance(self.path_or_stream, BytesIO):
+            return Presentation(self.path_or_stream)
+        elif isinstance(self.path_or_stream, Path):
+            return Presentation(str(self.path_or_stream))
+        return None
+
     def page_count(self) -> int:
         if self.is_valid():
             assert self.pptx_obj is not None
@@ -280,17 +291,19 @@ class MsPowerpointDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentB
     def handle_pictures(self, shape, parent_slide, slide_ind, doc, slide_size):
         # Open it with PIL
         try:
-            # Get the image bytes
-            image = shape.image
-            image_bytes = image.blob
-            im_dpi, _ = image.dpi
-            pil_image = Image.open(BytesIO(image_bytes))
+            image_ref = None
+            image_mode = settings.perf.image_extraction_mode
+            if image_mode != ImageExtractionMode.SKIP:
+                # Get the image bytes
+                image = shape.image
+                im_dpi, _ = image.dpi
+                image_ref = get_embedded_image_ref(image.blob, im_dpi, image_mode)
 
             # shape has picture
             prov = self.generate_prov(shape, slide_ind, "", slide_size)
             doc.add_picture(
                 parent=parent_slide,
-                image=ImageRef.from_pil(image=pil_image, dpi=im_dpi),
+                image=image_ref,
                 caption=None,
                 prov=prov,
             )
@@ -364,61 +377,117 @@ class MsPowerpointDocumentBackend(DeclarativeDocumentBackend, PaginatedDocumentB
 
     def walk_linear(self, pptx_obj, doc) -> DoclingDocument:
         # Units of size in PPTX by default are EMU units (English Metric Units)
-        slide_width = pptx_obj.slide_width
-        slide_height = pptx_obj.slide_height
+        slide_size = Size(width=pptx_obj.slide_width, height=pptx_obj.slide_height)
+
+        # The slides are listed once, the index of each one being its position
+        slides = list(pptx_obj.slides)
+        num_workers = min(settings.perf.pptx_slide_workers, len(slides))
+        if num_workers <= 1:
+            # Loop through each slide
+            for slide_ind, slide in enumerate(slides):
+                self.convert_slide(slide, slide_ind, slide_size, doc)
+            return doc
+
+        # Each slide is converted into its own fragment, appended in order
+        executor: Executor
+        if settings.perf.pptx_slide_processes:
+            executor = ProcessPoolExecutor(
+                max_workers=num_workers,
+                initializer=_init_slide_worker,
+                initargs=(self, settings.perf),
+            )
+            fragments = executor.map(
+                _convert_slide_in_worker,
+                range(len(slides)),
+                chunksize=max(1, len(slides) // (4 * num_workers)),
+            )
+        else:
+            executor = ThreadPoolExecutor(max_workers=num_workers)
+            fragments = executor.map(
+                lambda slide_ind: self.convert_slide_fragment(
+                    slides[slide_ind], slide_ind, slide_size
+                ),
+                range(len(slides)),
+            )
+        with executor:
+            for fragment in fragments:
+                append_document_fragment(doc, fragment)
 
-        text_content = []  # type: ignore
+        return doc
 
-        max_levels = 10
-        parents = {}  # type: ignore
-        for i in range(0, max_levels):
-            parents[i] = None
+    def convert_slide(self, slide, slide_ind, slide_size, doc):
+        parent_slide = doc.add_group(
+            name=f"slide-{slide_ind}", label=GroupLabel.CHAPTER, parent=None
+        )
+        doc.add_page(page_no=slide_ind + 1, size=slide_size)
 
-        # Loop through each slide
-        for slide_num, slide in enumerate(pptx_obj.slides):
-            slide_ind = pptx_obj.slides.index(slide)
-            parent_slide = doc.add_group(
-                name=f"slide-{slide_ind}", label=GroupLabel.CHAPTER, parent=parents[0]
-            )
+        # Loop through each shape in the slide
+        for shape in slide.shapes:
+            self.handle_shapes(shape, parent_slide, slide_ind, doc, slide_size)
 
-            slide_size = Size(width=slide_width, height=slide_height)
-            parent_page = doc.add_page(page_no=slide_ind + 1, size=slide_size)
-
-            def handle_shapes(shape, parent_slide, slide_ind, doc, slide_size):
-                handle_groups(shape, parent_slide, slide_ind, doc, slide_size)
-                if shape.has_table:
-                    # Handle Tables
-                    self.handle_tables(shape, parent_slide, slide_ind, doc, slide_size)
-                if shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
-                    # Handle Pictures
-                    self.handle_pictures(
-                        shape, parent_slide, slide_ind, doc, slide_size
-                    )
-                # If shape doesn't have any text, move on to the next shape
-                if not hasattr(shape, "text"):
-                    return
-                if shape.text is None:
-                    return
-                if len(shape.text.strip()) == 0:
-                    return
-                if not shape.has_text_frame:
-                    _log.warning("Warning: shape has text but not text_frame")
-                    return
-                # Handle other text elements, including lists (bullet lists, numbered lists)
-                self.handle_text_elements(
-                    shape, parent_slide, slide_ind, doc, slide_size
+    def convert_slide_fragment(self, slide, slide_ind, slide_size) -> DoclingDocument:
+        fragment = DoclingDocument(name=f"slide-{slide_ind}")
+        self.convert_slide(slide, slide_ind, slide_size, fragment)
+        return fragment
+
+    def handle_shapes(self, shape, parent_slide, slide_ind, doc, slide_size):
+        self.handle_groups(shape, parent_slide, slide_ind, doc, slide_size)
+        if shape.has_table:
+            # Handle Tables
+            self.handle_tables(shape, parent_slide, slide_ind, doc, slide_size)
+        if shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
+            # Handle Pictures
+            self.handle_pictures(shape, parent_slide, slide_ind, doc, slide_size)
+        # If shape doesn't have any text, move on to the next shape
+        if not hasattr(shape, "text"):
+            return
+        if shape.text is None:
+            return
+        if len(shape.text.strip()) == 0:
+            return
+        if not shape.has_text_frame:
+            _log.warning("Warning: shape has text but not text_frame")
+            return
+        # Handle other text elements, including lists (bullet lists, numbered lists)
+        self.handle_text_elements(shape, parent_slide, slide_ind, doc, slide_size)
+        return
+
+    def handle_groups(self, shape, parent_slide, slide_ind, doc, slide_size):
+        if shape.shape_type == MSO_SHAPE_TYPE.GROUP:
+            for groupedshape in shape.shapes:
+                self.handle_shapes(
+                    groupedshape, parent_slide, slide_ind, doc, slide_size
                 )
-                return
 
-            def handle_groups(shape, parent_slide, slide_ind, doc, slide_size):
-                if shape.shape_type == MSO_SHAPE_TYPE.GROUP:
-                    for groupedshape in shape.shapes:
-                        handle_shapes(
-                            groupedshape, parent_slide, slide_ind, doc, slide_size
-                        )
+    def __getstate__(self):
+        # The presentation is not picklable, it is opened again from its source
+        state = self.__dict__.copy()
+        state["pptx_obj"] = None
+        return state
 
-            # Loop through each shape in the slide
-            for shape in slide.shapes:
-                handle_shapes(shape, parent_slide, slide_ind, doc, slide_size)
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.pptx_obj = self.load_presentation()
 
-        return doc
+
+# The backend and the slides of the presentation in a slide worker process
+_worker_backend: Optional[MsPowerpointDocumentBackend] = None
+_worker_slides: list = []
+
+
+def _init_slide_worker(
+    backend: MsPowerpointDocumentBackend, perf: BatchConcurrencySettings
+) -> None:
+    global _worker_backend, _worker_slides
+    settings.perf = perf
+    _worker_backend = backend
+    _worker_slides = list(backend.pptx_obj.slides)
+
+
+def _convert_slide_in_worker(slide_ind: int) -> DoclingDocument:
+    assert _worker_backend is not None
+    pptx_obj = _worker_backend.pptx_obj
+    slide_size = Size(width=pptx_obj.slide_width, height=pptx_obj.slide_height)
+    return _worker_backend.convert_slide_fragment(
+        _worker_slides[slide_ind], slide_ind, slide_size
+    )
@@ -9,7 +9,6 @@ from docling_core.types.doc import (
     DoclingDocument,
     DocumentOrigin,
     GroupLabel,
-    ImageRef,
     NodeItem,
     TableCell,
     TableData,
@@ -22,15 +21,30 @@ from docx.table import Table, _Cell
 from docx.text.paragraph import Paragraph
 from lxml import etree
 from lxml.etree import XPath
-from PIL import Image, UnidentifiedImageError
+from PIL import UnidentifiedImageError
 from typing_extensions import override
 
 from docling.backend.abstract_backend import DeclarativeDocumentBackend
 from docling.datamodel.base_models import InputFormat
 from docling.datamodel.document import InputDocument
+from docling.datamodel.settings import settings
+from docling.utils.embedded_images import get_embedded_image_ref
 
 _log = logging.getLogger(__name__)
 
+_NAMESPACES = {
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+    "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+    "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main",
+}
+# Compiled once, since they are evaluated for each element of the body
+_BLIP_XPATH = XPath(".//a:blip", namespaces=_NAMESPACES)
+_SDT_CONTENT_PATH = f".//{{{_NAMESPACES['w']}}}sdtContent"
+_PARAGRAPH_PATH = f".//{{{_NAMESPACES['w']}}}p"
+_NUMPR_PATH = f".//{{{_NAMESPACES['w']}}}numPr"
+_NUMID_TAG = f"{{{_NAMESPACES['w']}}}numId"
+_ILVL_TAG = f"{{{_NAMESPACES['w']}}}ilvl"
+
 
 class MsWordDocumentBackend(DeclarativeDocumentBackend):
     @override
@@ -57,6 +71,8 @@ class MsWordDocumentBackend(DeclarativeDocumentBackend):
 
         self.level = 0
         self.listIter = 0
+        # The label and level of each paragraph style, looked up once per style
+        self.style_labels: dict[Optional[str], tuple[str, Optional[int]]] = {}
 
         self.history: dict[str, Any] = {
             "names": [None],
@@ -164,13 +180,7 @@ class MsWordDocumentBackend(DeclarativeDocumentBackend):
         for element in body:
             tag_name = etree.QName(element).localname
             # Check for Inline Images (blip elements)
-            namespaces = {
-                "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
-                "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
-                "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main",
-            }
-            xpath_expr = XPath(".//a:blip", namespaces=namespaces)
-            drawing_blip = xpath_expr(element)
+            drawing_blip = _BLIP_XPATH(element)
 
             # Check for Tables
             if element.tag.endswith("tbl"):
@@ -183,10 +193,10 @@ class MsWordDocumentBackend(DeclarativeDocumentBackend):
                 self.handle_pictures(docx_obj, drawing_blip, doc)
             # Check for the sdt containers, like table of contents
             elif tag_name in ["sdt"]:
-                sdt_content = element.find(".//w:sdtContent", namespaces=namespaces)
+                sdt_content = element.find(_SDT_CONTENT_PATH)
                 if sdt_content is not None:
                     # Iterate paragraphs, runs, or text inside <w:sdtContent>.
-                    paragraphs = sdt_content.findall(".//w:p", namespaces=namespaces)
+                    paragraphs = sdt_content.iterfind(_PARAGRAPH_PATH)
                     for p in paragraphs:
                         self.handle_text_elements(p, docx_obj, doc)
             # Check for Text
@@ -217,14 +227,12 @@ class MsWordDocumentBackend(DeclarativeDocumentBackend):
         self, paragraph: Paragraph
     ) -> tuple[Optional[int], Optional[int]]:
         # Access the XML element of the paragraph
-        numPr = paragraph._element.find(
-            ".//w:numPr", namespaces=paragraph._element.nsmap
-        )
+        numPr = paragraph._element.find(_NUMPR_PATH)
 
         if numPr is not None:
             # Get the numId element and extract the value
-            numId_elem = numPr.find("w:numId", namespaces=paragraph._element.nsmap)
-            ilvl_elem = numPr.find("w:ilvl", namespaces=paragraph._element.nsmap)
+            numId_elem = numPr.find(_NUMID_TAG)
+            ilvl_elem = numPr.find(_ILVL_TAG)
             numId = numId_elem.get(self.XML_KEY) if numId_elem is not None else None
             ilvl = ilvl_elem.get(self.XML_KEY) if ilvl_elem is not None else None
 
@@ -233,6 +241,16 @@ class MsWordDocumentBackend(DeclarativeDocumentBackend):
         return None, None  # If the paragraph is not part of a list
 
     def get_label_and_level(self, paragraph: Paragraph) -> tuple[str, Optional[int]]:
+        # The style is resolved through the styles part, so each style is looked up
+        # once and its label is reused for the next paragraphs of that style
+        style_val = paragraph._p.style
+        if style_val not in self.style_labels:
+            self.style_labels[style_val] = self.get_style_label_and_level(paragraph)
+        return self.style_labels[style_val]
+
+    def get_style_label_and_level(
+        self, paragraph: Paragraph
+    ) -> tuple[str, Optional[int]]:
         if paragraph.style is None:
             return "Normal", None
         label = paragraph.style.style_id
@@ -268,9 +286,10 @@ class MsWordDocumentBackend(DeclarativeDocumentBackend):
     ) -> None:
         paragraph = Paragraph(element, docx_obj)
 
-        if paragraph.text is None:
+        paragraph_text = paragraph.text
+        if paragraph_text is None:
             return
-        text = paragraph.text.strip()
+        text = paragraph_text.strip()
 
         # Common styles for bullet and numbered lists.
         # "List Bullet", "List Number", "List Paragraph"
@@ -485,6 +504,37 @@ class MsWordDocumentBackend(DeclarativeDocumentBackend):
             )
         return
 
+    @staticmethod
+    def get_table_grid(table: Table) -> list[list[CT_Tc]]:
+        """The cell at each position of the layout grid of a table, row by row.
+
+        Like `_Row.cells` of python-docx, a cell spanning several grid columns fills
+        as many positions and a vertically merged cell is the cell above it. The rows
+        are read once, the cells above being looked up in the previous row.
+        """
+        grid: list[list[CT_Tc]] = []
+        # The cell of each grid offset where a <w:tc> of the previous row starts
+        tcs_above: Optional[dict[int, CT_Tc]] = None
+        for tr in table._tbl.tr_lst:
+            row_cells: list[CT_Tc] = []
+            row_tcs: dict[int, CT_Tc] = {}
+            grid_offset = tr.grid_before
+            for tc in tr.tc_lst:
+                cell_tc = tc
+                if tc.vMerge == "continue":
+                    if tcs_above is None:
+                        raise ValueError("no tr above topmost tr in w:tbl")
+                    if grid_offset not in tcs_above:
+                        raise ValueError(f"no `tc` element at {grid_offset=}")
+                    cell_tc = tcs_above[grid_offset]
+                row_tcs[grid_offset] = cell_tc
+                row_cells.extend([cell_tc] * cell_tc.grid_span)
+                grid_offset += tc.grid_span
+            grid.append(row_cells)
+            tcs_above = row_tcs
+
+        return grid
+
     def handle_tables(
         self,
         element: BaseOxmlElement,
@@ -492,58 +542,51 @@ class MsWordDocumentBackend(DeclarativeDocumentBackend):
         doc: DoclingDocument,
     ) -> None:
         table: Table = Table(element, docx_obj)
-        num_rows = len(table.rows)
+        grid = self.get_table_grid(table)
+        num_rows = len(grid)
         num_cols = len(table.columns)
         _log.debug(f"Table grid with {num_rows} rows and {num_cols} columns")
 
         if num_rows == 1 and num_cols == 1:
-            cell_element = table.rows[0].cells[0]
+            cell_element = grid[0][0]
             # In case we have a table of only 1 cell, we consider it furniture
             # And proceed processing the content of the cell as though it's in the document body
-            self.walk_linear(cell_element._element, docx_obj, doc)
+            self.walk_linear(cell_element, docx_obj, doc)
             return
 
         data = TableData(num_rows=num_rows, num_cols=num_cols)
         cell_set: set[CT_Tc] = set()
-        for row_idx, row in enumerate(table.rows):
-            _log.debug(f"Row index {row_idx} with {len(row.cells)} populated cells")
+        for row_idx, (tr, row_cells) in enumerate(zip(table._tbl.tr_lst, grid)):
+            _log.debug(f"Row index {row_idx} with {len(row_cells)} populated cells")
+            grid_cols_before = tr.grid_before
             col_idx = 0
             while col_idx < num_cols:
-                cell: _Cell = row.cells[col_idx]
-                _log.debug(
-                    f" col {col_idx} grid_span {cell.grid_span} grid_cols_before {row.grid_cols_before}"
-                )
-                if cell is None or cell._tc in cell_set:
+                tc = row_cells[col_idx]
+                if tc in cell_set:
                     _log.debug(f"  skipped since repeated content")
-                    col_idx += cell.grid_span
+                    col_idx += tc.grid_span
                     continue
                 else:
-                    cell_set.add(cell._tc)
+                    cell_set.add(tc)
 
-                spanned_idx = row_idx
-                spanned_tc: Optional[CT_Tc] = cell._tc
-                while spanned_tc == cell._tc:
+                spanned_idx = row_idx + 1
+                while spanned_idx < num_rows and grid[spanned_idx][col_idx] is tc:
                     spanned_idx += 1
-                    spanned_tc = (
-                        table.rows[spanned_idx].cells[col_idx]._tc
-                        if spanned_idx < num_rows
-                        else None
-                    )
                 _log.debug(f"  spanned before row {spanned_idx}")
 
                 table_cell = TableCell(
-                    text=cell.text,
+                    text=_Cell(tc, table).text,
                     row_span=spanned_idx - row_idx,
-                    col_span=cell.grid_span,
-                    start_row_offset_idx=row.grid_cols_before + row_idx,
-                    end_row_offset_idx=row.grid_cols_before + spanned_idx,
+                    col_span=tc.grid_span,
+                    start_row_offset_idx=grid_cols_before + row_idx,
+                    end_row_offset_idx=grid_cols_before + spanned_idx,
                     start_col_offset_idx=col_idx,
-                    end_col_offset_idx=col_idx + cell.grid_span,
+                    end_col_offset_idx=col_idx + tc.grid_span,
                     col_header=False,
                     row_header=False,
                 )
                 data.table_cells.append(table_cell)
-                col_idx += cell.grid_span
+                col_idx += tc.grid_span
 
         level = self.get_level()
         doc.add_table(data=data, parent=self.parents[level - 1])
@@ -566,11 +609,11 @@ class MsWordDocumentBackend(DeclarativeDocumentBackend):
         # Open the BytesIO object with PIL to create an Image
         try:
             image_data = get_docx_image(drawing_blip)
-            image_bytes = BytesIO(image_data)
-            pil_image = Image.open(image_bytes)
             doc.add_picture(
                 parent=self.parents[level - 1],
-                image=ImageRef.from_pil(image=pil_image, dpi=72),
+                image=get_embedded_image_ref(
+                    image_data, 72, settings.perf.image_extraction_mode
+                ),
                 caption=None,
             )
         except (UnidentifiedImageError, OSError) as e:
@@ -47,7 +47,7 @@ class PdfDocumentBackend(PaginatedDocumentBackend):
     def __init__(self, in_doc: InputDocument, path_or_stream: Union[BytesIO, Path]):
         super().__init__(in_doc, path_or_stream)
 
-        if self.input_format is not InputFormat.PDF:
+        if self.input_format not in self.supported_formats():
             if self.input_format is InputFormat.IMAGE:
                 buf = BytesIO()
                 img = Image.open(self.path_or_stream)
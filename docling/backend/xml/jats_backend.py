@@ -1,8 +1,9 @@
 import logging
 import traceback
+from contextlib import nullcontext
 from io import BytesIO
 from pathlib import Path
-from typing import Final, Optional, Union
+from typing import BinaryIO, ContextManager, Final, Optional, Union
 
 from bs4 import BeautifulSoup, Tag
 from docling_core.types.doc import (
@@ -21,6 +22,7 @@ from docling.backend.abstract_backend import DeclarativeDocumentBackend
 from docling.backend.html_backend import HTMLDocumentBackend
 from docling.datamodel.base_models import InputFormat
 from docling.datamodel.document import InputDocument
+from docling.datamodel.settings import settings
 
 _log = logging.getLogger(__name__)
 
@@ -65,6 +67,50 @@ class XMLComponents(TypedDict):
     abstract: list[Abstract]
 
 
+# Elements holding the metadata of the document
+_METADATA_TAGS: Final = ("title-group", "abstract", "article-meta", "book-part-meta")
+
+
+class _MetadataCollector:
+    """Collects the metadata of a JATS document from its elements, in one pass.
+
+    The elements of `_METADATA_TAGS` are added in document order, each one being
+    parsed when it is added. The title joins the title groups of the article, book
+    or collection metadata, and the authors are taken from the first article
+    metadata, or else from the first book part metadata.
+    """
+
+    def __init__(self) -> None:
+        self.titles: list[str] = []
+        self.abstracts: list[Abstract] = []
+        self.authors: dict[str, list[Author]] = {}
+
+    def add(self, node: etree._Element) -> None:
+        if node.tag == "title-group":
+            parent = node.getparent()
+            if parent is not None and parent.tag in (
+                "article-meta",
+                "collection-meta",
+                "book-meta",
+                "book-part-meta",
+            ):
+                self.titles.append(JatsDocumentBackend._parse_title_group(node))
+        elif node.tag == "abstract":
+            self.abstracts.append(JatsDocumentBackend._parse_abstract(node))
+        elif node.tag not in self.authors:
+            self.authors[node.tag] = JatsDocumentBackend._parse_authors(node)
+
+    def components(self) -> XMLComponents:
+        authors = self.authors.get("article-meta")
+        if authors is None:
+            authors = self.authors.get("book-part-meta", [])
+        return {
+            "title": " - ".join(self.titles),
+            "authors": authors,
+            "abstract": self.abstracts,
+        }
+
+
 class JatsDocumentBackend(DeclarativeDocumentBackend):
     """Backend to parse articles in XML format tagged according to JATS definition.
 
@@ -98,9 +144,17 @@ class JatsDocumentBackend(DeclarativeDocumentBackend):
         try:
             if isinstance(self.path_or_stream, BytesIO):
                 self.path_or_stream.seek(0)
-            self.tree: etree._ElementTree = etree.parse(self.path_or_stream)
+            self.tree: Optional[etree._ElementTree] = None
+            if settings.perf.jats_iterparse:
+                # The document type is known from the first element, the tree is
+                # built while converting
+                with self._open_source() as source:
+                    _, first = next(etree.iterparse(source, events=("start",)))
+                    doc_info: etree.DocInfo = first.getroottree().docinfo
+            else:
+                self.tree = etree.parse(self.path_or_stream)
+                doc_info = self.tree.docinfo
 
-            doc_info: etree.DocInfo = self.tree.docinfo
             if doc_info.system_url and any(
                 [kwd in doc_info.system_url for kwd in JATS_DTD_URL]
             ):
@@ -139,15 +193,20 @@ class JatsDocumentBackend(DeclarativeDocumentBackend):
 
     @override
     def convert(self) -> DoclingDocument:
-        try:
-            # Create empty document
-            origin = DocumentOrigin(
-                filename=self.file.name or "file",
-                mimetype="application/xml",
-                binary_hash=self.document_hash,
-            )
-            doc = DoclingDocument(name=self.file.stem or "file", origin=origin)
+        # Create empty document
+        origin = DocumentOrigin(
+            filename=self.file.name or "file",
+            mimetype="application/xml",
+            binary_hash=self.document_hash,
+        )
+        doc = DoclingDocument(name=self.file.stem or "file", origin=origin)
 
+        if self.tree is None:
+            # The content is only parsed now, its syntax errors fail the conversion
+            self._convert_iterparse(doc)
+            return doc
+
+        try:
             # Get metadata XML components
             xml_components: XMLComponents = self._parse_metadata()
 
@@ -155,19 +214,75 @@ class JatsDocumentBackend(DeclarativeDocumentBackend):
             self._add_metadata(doc, xml_components)
 
             # walk over the XML body
-            body = self.tree.xpath("//body")
-            if self.root and len(body) > 0:
-                self._walk_linear(doc, self.root, body[0])
+            body = self.tree.find(".//body")
+            if self.root and body is not None:
+                self._walk_linear(doc, self.root, body)
 
             # walk over the XML back matter
-            back = self.tree.xpath("//back")
-            if self.root and len(back) > 0:
-                self._walk_linear(doc, self.root, back[0])
+            back = self.tree.find(".//back")
+            if self.root and back is not None:
+                self._walk_linear(doc, self.root, back)
         except Exception:
             _log.error(traceback.format_exc())
 
         return doc
 
+    def _open_source(self) -> ContextManager[BinaryIO]:
+        if isinstance(self.path_or_stream, BytesIO):
+            self.path_or_stream.seek(0)
+            return nullcontext(self.path_or_stream)
+        return open(self.path_or_stream, "rb")
+
+    def _convert_iterparse(self, doc: DoclingDocument) -> None:
+        """Convert the document while parsing it.
+
+        The metadata is collected from the elements parsed before the first body or
+        back matter, which are walked once parsed. The elements are then cleared, with
+        the ones preceding them, so that only the part of the tree being parsed is
+        kept in memory.
+        """
+        collector = _MetadataCollector()
+        body_walked = False
+        back: Optional[etree._Element] = None
+        with self._open_source() as source:
+            for _, node in etree.iterparse(
+                source, events=("end",), tag=(*_METADATA_TAGS, "body", "back")
+            ):
+                if node.tag in _METADATA_TAGS:
+                    collector.add(node)
+                    if node.tag in ("article-meta", "book-part-meta"):
+                        JatsDocumentBackend._clear(node)
+                    continue
+
+                if self.root is None:
+                    self._add_metadata(doc, collector.components())
+                if node.tag == "body" and not body_walked:
+                    body_walked = True
+                    self._walk_linear(doc, self.root, node)
+                    # The back matter is walked after the body, if any
+                    if back is not None:
+                        self._walk_linear(doc, self.root, back)
+                        JatsDocumentBackend._clear(back)
+                    JatsDocumentBackend._clear(node)
+                elif node.tag == "back" and back is None:
+                    back = node
+                    if body_walked:
+                        self._walk_linear(doc, self.root, back)
+                        JatsDocumentBackend._clear(back)
+
+        if self.root is None:
+            self._add_metadata(doc, collector.components())
+        if back is not None and not body_walked:
+            self._walk_linear(doc, self.root, back)
+
+        return
+
+    @staticmethod
+    def _clear(node: etree._Element) -> None:
+        node.clear(keep_tail=True)
+        while node.getprevious() is not None:
+            del node.getparent()[0]
+
     @staticmethod
     def _get_text(node: etree._Element, sep: Optional[str] = None) -> str:
         skip_tags = ["term", "disp-formula", "inline-formula"]
@@ -186,116 +301,85 @@ class JatsDocumentBackend(DeclarativeDocumentBackend):
 
         return text
 
-    def _find_metadata(self) -> Optional[etree._Element]:
-        meta_names: list[str] = ["article-meta", "book-part-meta"]
-        meta: Optional[etree._Element] = None
-        for name in meta_names:
-            node = self.tree.xpath(f".//{name}")
-            if len(node) > 0:
-                meta = node[0]
-                break
-
-        return meta
-
-    def _parse_abstract(self) -> list[Abstract]:
+    @staticmethod
+    def _parse_abstract(abs_node: etree._Element) -> Abstract:
         # TODO: address cases with multiple sections
-        abs_list: list[Abstract] = []
-
-        for abs_node in self.tree.xpath(".//abstract"):
-            abstract: Abstract = dict(label="", content="")
-            texts = []
-            for abs_par in abs_node.xpath("p"):
-                texts.append(JatsDocumentBackend._get_text(abs_par).strip())
-            abstract["content"] = " ".join(texts)
-
-            label_node = abs_node.xpath("title|label")
-            if len(label_node) > 0:
-                abstract["label"] = label_node[0].text.strip()
+        abstract: Abstract = dict(label="", content="")
+        texts = []
+        for abs_par in abs_node.iterchildren("p"):
+            texts.append(JatsDocumentBackend._get_text(abs_par).strip())
+        abstract["content"] = " ".join(texts)
 
-            abs_list.append(abstract)
+        label_node = next(abs_node.iterchildren("title", "label"), None)
+        if label_node is not None:
+            abstract["label"] = label_node.text.strip()
 
-        return abs_list
+        return abstract
 
-    def _parse_authors(self) -> list[Author]:
+    @staticmethod
+    def _parse_authors(meta: etree._Element) -> list[Author]:
         # Get mapping between affiliation ids and names
         authors: list[Author] = []
-        meta: Optional[etree._Element] = self._find_metadata()
-        if meta is None:
-            return authors
-
-        affiliation_names = []
-        for affiliation_node in meta.xpath(".//aff[@id]"):
-            aff = ", ".join([t for t in affiliation_node.itertext() if t.strip()])
-            aff = aff.replace("\n", " ")
-            label = affiliation_node.xpath("label")
-            if label:
-                # TODO: once superscript is supported, add label with formatting
-                aff = aff.removeprefix(f"{label[0].text}, ")
-            affiliation_names.append(aff)
-        affiliation_ids_names = {
-            id: name
-            for id, name in zip(meta.xpath(".//aff[@id]/@id"), affiliation_names)
-        }
+        affiliation_ids_names: dict[str, str] = {}
+        author_nodes: list[etree._Element] = []
+        for node in meta.iter("aff", "contrib"):
+            if node.tag == "aff" and "id" in node.attrib:
+                aff = ", ".join([t for t in node.itertext() if t.strip()])
+                aff = aff.replace("\n", " ")
+                label = node.find("label")
+                if label is not None:
+                    # TODO: once superscript is supported, add label with formatting
+                    aff = aff.removeprefix(f"{label.text}, ")
+                affiliation_ids_names[node.attrib["id"]] = aff
+            elif (
+                node.tag == "contrib"
+                and node.get("contrib-type") == "author"
+                and node.getparent().tag == "contrib-group"
+            ):
+                author_nodes.append(node)
 
         # Get author names and affiliation names
-        for author_node in meta.xpath(
-            './/contrib-group/contrib[@contrib-type="author"]'
-        ):
+        for author_node in author_nodes:
             author: Author = {
                 "name": "",
                 "affiliation_names": [],
             }
 
             # Affiliation names
-            affiliation_ids = [
-                a.attrib["rid"] for a in author_node.xpath('xref[@ref-type="aff"]')
-            ]
-            for id in affiliation_ids:
+            for xref in author_node.iterchildren("xref"):
+                if xref.get("ref-type") != "aff":
+                    continue
+                id = xref.attrib["rid"]
                 if id in affiliation_ids_names:
                     author["affiliation_names"].append(affiliation_ids_names[id])
 
             # Name
             author["name"] = (
-                author_node.xpath("name/given-names")[0].text
+                author_node.find("name/given-names").text
                 + " "
-                + author_node.xpath("name/surname")[0].text
+                + author_node.find("name/surname").text
             )
 
             authors.append(author)
 
         return authors
 
-    def _parse_title(self) -> str:
-        meta_names: list[str] = [
-            "article-meta",
-            "collection-meta",
-            "book-meta",
-            "book-part-meta",
-        ]
+    @staticmethod
+    def _parse_title_group(title_node: etree._Element) -> str:
         title_names: list[str] = ["article-title", "subtitle", "title", "label"]
-        titles: list[str] = [
-            " ".join(
-                elem.text.replace("\n", " ").strip()
-                for elem in list(title_node)
-                if elem.tag in title_names
-            ).strip()
-            for title_node in self.tree.xpath(
-                "|".join([f".//{item}/title-group" for item in meta_names])
-            )
-        ]
-
-        text = " - ".join(titles)
-
-        return text
+        return " ".join(
+            elem.text.replace("\n", " ").strip()
+            for elem in list(title_node)
+            if elem.tag in title_names
+        ).strip()
 
     def _parse_metadata(self) -> XMLComponents:
         """Parsing JATS document metadata."""
-        xml_components: XMLComponents = {
-            "title": self._parse_title(),
-            "authors": self._parse_authors(),
-            "abstract": self._parse_abstract(),
-        }
-        return xml_components
+        collector = _MetadataCollector()
+        for node in self.tree.iter(*_METADATA_TAGS):
+            collector.add(node)
+
+        return collector.components()
 
     def _add_abstract(
         self, doc: DoclingDocument, xml_components: XMLComponents
@@ -364,18 +448,30 @@ class JatsDocumentBackend(DeclarativeDocumentBackend):
 
         _log.debug("Citation parsing started")
 
+        # First child of each tag, and the publication identifiers
+        children: dict[str, etree._Element] = {}
+        id_nodes: list[etree._Element] = []
+        for child in node.iterchildren(tag=etree.Element):
+            children.setdefault(child.tag, child)
+            if child.tag == "pub-id":
+                id_nodes.append(child)
+
         # Author names
         names = []
-        for name_node in node.xpath(".//name"):
+        etal_node: Optional[etree._Element] = None
+        for name_node in node.iterdescendants("name", "etal"):
+            if name_node.tag == "etal":
+                if etal_node is None:
+                    etal_node = name_node
+                continue
             name_str = (
-                name_node.xpath("surname")[0].text.replace("\n", " ").strip()
+                name_node.find("surname").text.replace("\n", " ").strip()
                 + " "
-                + name_node.xpath("given-names")[0].text.replace("\n", " ").strip()
+                + name_node.find("given-names").text.replace("\n", " ").strip()
             )
             names.append(name_str)
-        etal_node = node.xpath(".//etal")
-        if len(etal_node) > 0:
-            etal_text = etal_node[0].text or DEFAULT_TEXT_ETAL
+        if etal_node is not None:
+            etal_text = etal_node.text or DEFAULT_TEXT_ETAL
             names.append(etal_text)
         citation["author_names"] = ", ".join(names)
 
@@ -389,9 +485,8 @@ class JatsDocumentBackend(DeclarativeDocumentBackend):
         ]
         title_node: Optional[etree._Element] = None
         for name in titles:
-            name_node = node.xpath(name)
-            if len(name_node) > 0:
-                title_node = name_node[0]
+            if name in children:
+                title_node = children[name]
                 break
         citation["title"] = (
             JatsDocumentBackend._get_text(title_node)
@@ -408,16 +503,15 @@ class JatsDocumentBackend(DeclarativeDocumentBackend):
             "volume",
         ]
         for item in fields:
-            item_node = node.xpath(item)
-            if len(item_node) > 0:
+            if item in children:
                 citation[item.replace("-", "_")] = (  # type: ignore[literal-required]
-                    item_node[0].text.replace("\n", " ").strip()
+                    children[item].text.replace("\n", " ").strip()
                 )
 
         # Publication identifier
-        if len(node.xpath("pub-id")) > 0:
+        if id_nodes:
             pub_id: list[str] = []
-            for id_node in node.xpath("pub-id"):
+            for id_node in id_nodes:
                 id_type = id_node.get("assigning-authority") or id_node.get(
                     "pub-id-type"
                 )
@@ -432,15 +526,13 @@ class JatsDocumentBackend(DeclarativeDocumentBackend):
                 citation["pub_id"] = ", ".join(pub_id)
 
         # Pages
-        if len(node.xpath("elocation-id")) > 0:
-            citation["page"] = (
-                node.xpath("elocation-id")[0].text.replace("\n", " ").strip()
-            )
-        elif len(node.xpath("fpage")) > 0:
-            citation["page"] = node.xpath("fpage")[0].text.replace("\n", " ").strip()
-            if len(node.xpath("lpage")) > 0:
+        if "elocation-id" in children:
+            citation["page"] = children["elocation-id"].text.replace("\n", " ").strip()
+        elif "fpage" in children:
+            citation["page"] = children["fpage"].text.replace("\n", " ").strip()
+            if "lpage" in children:
                 citation["page"] += (
-                    "–" + node.xpath("lpage")[0].text.replace("\n", " ").strip()
+                    "–" + children["lpage"].text.replace("\n", " ").strip()
                 )
 
         # Flatten the citation to string
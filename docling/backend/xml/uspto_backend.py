@@ -11,10 +11,12 @@ import re
 import xml.sax
 import xml.sax.xmlreader
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
 from enum import Enum, unique
 from io import BytesIO
-from pathlib import Path
-from typing import Final, Optional, Union
+from pathlib import Path, PurePath
+from typing import Final, Iterator, Optional, Union
 
 from bs4 import BeautifulSoup, Tag
 from docling_core.types.doc import (
@@ -33,6 +35,7 @@ from typing_extensions import Self, TypedDict, override
 from docling.backend.abstract_backend import DeclarativeDocumentBackend
 from docling.datamodel.base_models import InputFormat
 from docling.datamodel.document import InputDocument
+from docling.datamodel.settings import DocumentLimits, settings
 
 _log = logging.getLogger(__name__)
 
@@ -66,24 +69,69 @@ class PatentUsptoDocumentBackend(DeclarativeDocumentBackend):
 
         self.patent_content: str = ""
         self.parser: Optional[PatentUspto] = None
+        self.parsed_doc: Optional[Future[Optional[DoclingDocument]]] = None
 
         try:
-            if isinstance(self.path_or_stream, BytesIO):
-                while line := self.path_or_stream.readline().decode("utf-8"):
-                    if line.startswith("<!DOCTYPE") or line == "PATN\n":
-                        self._set_parser(line)
-                    self.patent_content += line
-            elif isinstance(self.path_or_stream, Path):
-                with open(self.path_or_stream, encoding="utf-8") as file_obj:
-                    while line := file_obj.readline():
-                        if line.startswith("<!DOCTYPE") or line == "PATN\n":
-                            self._set_parser(line)
-                        self.patent_content += line
+            lines: list[str] = []
+            for line in _iter_lines(self.path_or_stream):
+                if line.startswith("<!DOCTYPE") or line == "PATN\n":
+                    self._set_parser(line)
+                lines.append(line)
+            self.patent_content = "".join(lines)
         except Exception as exc:
             raise RuntimeError(
                 f"Could not initialize USPTO backend for file with hash {self.document_hash}."
             ) from exc
 
+    @classmethod
+    def iter_bulk_documents(
+        cls,
+        path_or_stream: Union[BytesIO, Path],
+        filename: str,
+        limits: Optional[DocumentLimits] = None,
+    ) -> Iterator[InputDocument]:
+        """Split a USPTO bulk file into one input document per patent.
+
+        The file is read line by line, a patent starting at each XML declaration or
+        "PATN" line. The input documents are named after the file with the position
+        of the patent. With `settings.perf.uspto_bulk_workers` > 1, the patents are
+        parsed ahead on a process pool, their documents being returned by `convert`.
+        """
+        name = PurePath(filename)
+        num_workers = settings.perf.uspto_bulk_workers
+        executor = ProcessPoolExecutor(num_workers) if num_workers > 1 else None
+
+        # The documents read ahead, bounded to keep the workers busy
+        window: deque[InputDocument] = deque()
+        try:
+            for ix, patent_content in enumerate(split_patents(path_or_stream)):
+                in_doc = InputDocument(
+                    path_or_stream=BytesIO(patent_content.encode("utf-8")),
+                    format=InputFormat.XML_USPTO,
+                    backend=cls,
+                    filename=f"{name.stem}-{ix + 1}{name.suffix}",
+                    limits=limits,
+                )
+                backend = in_doc._backend if in_doc.valid else None
+                if executor is not None and isinstance(backend, cls):
+                    backend.submit_parse(executor)
+                window.append(in_doc)
+                if len(window) > 2 * num_workers:
+                    yield window.popleft()
+            yield from window
+        finally:
+            # The documents already returned may not be converted yet, e.g. when
+            # the whole batch is read first, hence their parses are completed
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+    def submit_parse(self, executor: Executor) -> None:
+        """Parse the patent on an executor, the document being returned by convert."""
+        if self.parser is not None:
+            self.parsed_doc = executor.submit(
+                _parse_patent, type(self.parser), self.patent_content
+            )
+
     def _set_parser(self, doctype: str) -> None:
         doctype_line = doctype.lower()
         if doctype == "PATN\n":
@@ -124,7 +172,10 @@ class PatentUsptoDocumentBackend(DeclarativeDocumentBackend):
     def convert(self) -> DoclingDocument:
 
         if self.parser is not None:
-            doc = self.parser.parse(self.patent_content)
+            if self.parsed_doc is not None and not self.parsed_doc.cancelled():
+                doc = self.parsed_doc.result()
+            else:
+                doc = self.parser.parse(self.patent_content)
             if doc is None:
                 raise RuntimeError(
                     f"Failed to convert doc (hash={self.document_hash}, "
@@ -150,6 +201,47 @@ class PatentUsptoDocumentBackend(DeclarativeDocumentBackend):
             )
 
 
+def _iter_lines(path_or_stream: Union[BytesIO, Path]) -> Iterator[str]:
+    if isinstance(path_or_stream, BytesIO):
+        # The stream may have been read, e.g. to hash its content
+        path_or_stream.seek(0)
+        while line := path_or_stream.readline().decode("utf-8"):
+            # Translate the line endings like a file opened in text mode
+            yield line[:-2] + "\n" if line.endswith("\r\n") else line
+    elif isinstance(path_or_stream, Path):
+        with open(path_or_stream, encoding="utf-8") as file_obj:
+            while line := file_obj.readline():
+                yield line
+
+
+def split_patents(path_or_stream: Union[BytesIO, Path]) -> Iterator[str]:
+    """Split the content of a USPTO bulk file into the contents of its patents.
+
+    Parameters:
+        path_or_stream: A USPTO file, with one or more patents.
+
+    Returns:
+        The content of each patent, from its XML declaration or "PATN" line. The
+        lines before the first patent are skipped.
+    """
+    lines: list[str] = []
+    for line in _iter_lines(path_or_stream):
+        if line.startswith("<?xml") or line == "PATN\n":
+            if lines:
+                yield "".join(lines)
+            lines = [line]
+        elif lines:
+            lines.append(line)
+    if lines:
+        yield "".join(lines)
+
+
+def _parse_patent(
+    parser_cls: type["PatentUspto"], patent_content: str
+) -> Optional[DoclingDocument]:
+    return parser_cls().parse(patent_content)
+
+
 class PatentUspto(ABC):
     """Parser of patent documents from the US Patent Office."""
 
@@ -16,6 +16,7 @@ from pydantic import TypeAdapter
 
 from docling.backend.docling_parse_backend import DoclingParseDocumentBackend
 from docling.backend.docling_parse_v2_backend import DoclingParseV2DocumentBackend
+from docling.backend.image_backend import ImageDocumentBackend
 from docling.backend.pdf_backend import PdfDocumentBackend
 from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
 from docling.datamodel.base_models import (
@@ -425,9 +426,14 @@ def convert(
             pipeline_options=pipeline_options,
             backend=backend,  # pdf_backend
         )
+        # The images are rasterized directly, without a PDF backend
+        image_format_option = PdfFormatOption(
+            pipeline_options=pipeline_options,
+            backend=ImageDocumentBackend,
+        )
         format_options: Dict[InputFormat, FormatOption] = {
             InputFormat.PDF: pdf_format_option,
-            InputFormat.IMAGE: pdf_format_option,
+            InputFormat.IMAGE: image_format_option,
         }
         doc_converter = DocumentConverter(
             allowed_formats=from_formats,
@@ -17,6 +17,7 @@ from pydantic import BaseModel, ConfigDict
 
 if TYPE_CHECKING:
     from docling.backend.pdf_backend import PdfPageBackend
+    from docling.utils.page_store import PageStore
 
 
 class ConversionStatus(str, Enum):
@@ -218,6 +219,7 @@ class ItemAndImageEnrichmentElement(BaseModel):
 
     item: NodeItem
     image: Image
+    document_hash: Optional[str] = None  # Hash of the input document of the item
 
 
 class Page(BaseModel):
@@ -237,10 +239,31 @@ class Page(BaseModel):
     _image_cache: Dict[float, Image] = (
         {}
     )  # Cache of images in different scales. By default it is cleared during assembling.
+    _element_images: Dict[int, Image] = (
+        {}
+    )  # Images of the picture and table elements, by cluster id.
+    _page_store: Optional["PageStore"] = (
+        None  # On-disk store holding the page state in low-memory mode.
+    )
+    _use_vlm: bool = False  # Routed to the VLM model by the hybrid pipeline.
 
     def get_image(
         self, scale: float = 1.0, cropbox: Optional[BoundingBox] = None
     ) -> Optional[Image]:
+        if scale not in self._image_cache and self._page_store is not None:
+            # Read back from the store, without caching it in memory again. The
+            # backend of a spilled page may have been unloaded already.
+            page_im = self._page_store.load_image(self.page_no, scale)
+            if page_im is not None:
+                if cropbox is None:
+                    return page_im
+                assert self.size is not None
+                return page_im.crop(
+                    cropbox.to_top_left_origin(page_height=self.size.height)
+                    .scaled(scale=scale)
+                    .as_tuple()
+                )
+
         if self._backend is None:
             return self._image_cache.get(scale, None)
 
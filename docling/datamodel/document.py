@@ -1,6 +1,7 @@
 import csv
 import logging
 import re
+import tarfile
 from enum import Enum
 from io import BytesIO
 from pathlib import Path, PurePath
@@ -63,7 +64,7 @@ from docling.datamodel.base_models import (
     MimeTypeToFormat,
     Page,
 )
-from docling.datamodel.settings import DocumentLimits
+from docling.datamodel.settings import DocumentLimits, settings
 from docling.utils.profiling import ProfilingItem
 from docling.utils.utils import create_file_hash, create_hash
 
@@ -72,6 +73,9 @@ if TYPE_CHECKING:
 
 _log = logging.getLogger(__name__)
 
+# Suffixes of the tar archives, possibly compressed
+_TAR_ARCHIVE_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz")
+
 layout_label_to_ds_type = {
     DocItemLabel.TITLE: "title",
     DocItemLabel.DOCUMENT_INDEX: "table",
@@ -242,6 +246,14 @@ class _DocumentConversionInput(BaseModel):
                 if isinstance(item, str)
                 else item
             )
+            if (
+                settings.perf.jats_bulk_archives
+                and InputFormat.XML_JATS in format_options
+                and obj.name.endswith(_TAR_ARCHIVE_SUFFIXES)
+            ):
+                yield from self._archive_docs(obj, format_options[InputFormat.XML_JATS])
+                continue
+
             format = self._guess_format(obj)
             backend: Type[AbstractDocumentBackend]
             if format not in format_options.keys():
@@ -252,6 +264,18 @@ class _DocumentConversionInput(BaseModel):
             else:
                 backend = format_options[format].backend
 
+            if format == InputFormat.XML_USPTO and settings.perf.uspto_bulk_split:
+                # Imported here, as the backend depends on this module
+                from docling.backend.xml.uspto_backend import PatentUsptoDocumentBackend
+
+                if issubclass(backend, PatentUsptoDocumentBackend):
+                    yield from backend.iter_bulk_documents(
+                        obj if isinstance(obj, Path) else obj.stream,
+                        filename=obj.name,
+                        limits=self.limits,
+                    )
+                    continue
+
             if isinstance(obj, Path):
                 yield InputDocument(
                     path_or_stream=obj,
@@ -271,6 +295,40 @@ class _DocumentConversionInput(BaseModel):
             else:
                 raise RuntimeError(f"Unexpected obj type in iterator: {type(obj)}")
 
+    def _archive_docs(
+        self, obj: Union[Path, DocumentStream], format_option: "FormatOption"
+    ) -> Iterable[InputDocument]:
+        """The JATS articles of a tar archive, read in one pass.
+
+        The other members, e.g. the PDF and the figures of the article packages, are
+        skipped.
+        """
+        if isinstance(obj, Path):
+            archive = tarfile.open(obj, mode="r|*")
+        else:
+            obj.stream.seek(0)
+            archive = tarfile.open(fileobj=obj.stream, mode="r|*")
+
+        with archive:
+            for member in archive:
+                fileobj = archive.extractfile(member) if member.isfile() else None
+                if fileobj is None:
+                    continue
+                name = PurePath(member.name).name
+                stream = BytesIO(fileobj.read())
+                if self._guess_format(DocumentStream(name=name, stream=stream)) != (
+                    InputFormat.XML_JATS
+                ):
+                    _log.debug(f"Skipping {member.name} of archive {obj.name}.")
+                    continue
+                yield InputDocument(
+                    path_or_stream=stream,
+                    format=InputFormat.XML_JATS,
+                    filename=name,
+                    limits=self.limits,
+                    backend=format_option.backend,
+                )
+
     def _guess_format(self, obj: Union[Path, DocumentStream]) -> Optional[InputFormat]:
         content = b""  # empty binary blob
         formats: list[InputFormat] = []
@@ -210,6 +210,43 @@ class OcrMacOptions(OcrOptions):
     )
 
 
+class CascadeOcrOptions(OcrOptions):
+    """Options for the cascading OCR engine.
+
+    The `fast` engine runs at `fast_scale` on every OCR region. Only the regions
+    around cells recognized with a confidence below `confidence_threshold` are
+    processed again with the `accurate` engine at `accurate_scale`. When `lang` is
+    not empty, it replaces the languages of both engines.
+    """
+
+    kind: Literal["cascade"] = "cascade"
+    lang: List[str] = []
+
+    fast: Union[
+        EasyOcrOptions,
+        TesseractCliOcrOptions,
+        TesseractOcrOptions,
+        OcrMacOptions,
+        RapidOcrOptions,
+    ] = Field(EasyOcrOptions(), discriminator="kind")
+    accurate: Union[
+        EasyOcrOptions,
+        TesseractCliOcrOptions,
+        TesseractOcrOptions,
+        OcrMacOptions,
+        RapidOcrOptions,
+    ] = Field(EasyOcrOptions(), discriminator="kind")
+
+    fast_scale: float = 1.5  # multiplier for 72 dpi == 108 dpi.
+    accurate_scale: float = 3.0  # multiplier for 72 dpi == 216 dpi.
+    confidence_threshold: float = 0.8  # cells below are re-processed, in [0, 1]
+    region_padding: float = 4.0  # padding (in points) around re-processed cells
+
+    model_config = ConfigDict(
+        extra="forbid",
+    )
+
+
 class PictureDescriptionBaseOptions(BaseModel):
     kind: str
     batch_size: int = 8
@@ -314,6 +351,47 @@ class OcrEngine(str, Enum):
     RAPIDOCR = "rapidocr"
 
 
+class ImageFormat(str, Enum):
+    """Encoding of the images written by an image sink."""
+
+    PNG = "png"
+    JPEG = "jpeg"
+    WEBP = "webp"
+
+
+class ImageSinkOptions(BaseModel):
+    """Options for writing the generated images to files.
+
+    The images are stored in `output_path` under a name derived from their content,
+    and the document refers to them by path instead of embedding them. When
+    `output_path` ends with `.zip`, the images are written to a zip archive and the
+    references are the path of the archive followed by the member name, e.g.
+    `/data/images.zip/<name>.png`, which `zipfile.Path(archive, at=name)` opens. A
+    zip archive can only be written by a single process at a time.
+    """
+
+    output_path: Path
+    image_format: ImageFormat = ImageFormat.PNG
+    quality: int = Field(90, ge=1, le=100)  # Used for JPEG and WebP
+    num_threads: int = 4  # Threads encoding and writing the images
+
+
+class PictureDedupOptions(BaseModel):
+    """Options for reusing the picture annotations of identical images.
+
+    Pictures are classified and described once per image content, and the result
+    is attached to every picture with the same content. The results are kept in
+    memory for the last `cache_size` images and only reused within a document,
+    while the sqlite database `store_path`, when set, shares them across documents
+    and runs. Near duplicates are only matched against the images kept in memory.
+    """
+
+    near_duplicates: bool = False  # True: match by perceptual hash, not by pixels
+    max_hash_distance: int = 4  # Differing bits of near duplicates, out of 64
+    cache_size: int = 1024
+    store_path: Optional[Path] = None
+
+
 class PipelineOptions(BaseModel):
     """Base pipeline options."""
 
@@ -329,6 +407,8 @@ class PaginatedPipelineOptions(PipelineOptions):
     images_scale: float = 1.0
     generate_page_images: bool = False
     generate_picture_images: bool = False
+    # Write the generated images to files, instead of embedding them as data URIs
+    image_sink_options: Optional[ImageSinkOptions] = None
 
 
 class VlmPipelineOptions(PaginatedPipelineOptions):
@@ -364,15 +444,21 @@ class PdfPipelineOptions(PaginatedPipelineOptions):
         TesseractOcrOptions,
         OcrMacOptions,
         RapidOcrOptions,
+        CascadeOcrOptions,
     ] = Field(EasyOcrOptions(), discriminator="kind")
     picture_description_options: Annotated[
         Union[PictureDescriptionApiOptions, PictureDescriptionVlmOptions],
         Field(discriminator="kind"),
     ] = smolvlm_picture_description
+    # None: classify and describe every picture independently
+    picture_dedup_options: Optional[PictureDedupOptions] = PictureDedupOptions()
 
     images_scale: float = 1.0
     generate_page_images: bool = False
     generate_picture_images: bool = False
+    # True: spill the page state (cells, predictions, images) to disk after
+    # processing each page, bounding the memory used for long documents.
+    low_memory_mode: bool = False
     generate_table_images: bool = Field(
         default=False,
         deprecated=(
@@ -381,3 +467,24 @@ class PdfPipelineOptions(PaginatedPipelineOptions):
             "before conversion and then use the `TableItem.get_image` function."
         ),
     )
+
+
+class PageRoutingOptions(BaseModel):
+    """Thresholds for converting a page with the VLM instead of the standard models.
+
+    A page is sent to the VLM when it has at most `max_text_cells` programmatic
+    text cells and bitmaps cover at least `min_bitmap_coverage` of its area, e.g.
+    a scan, or when the average confidence of its layout clusters is below
+    `min_layout_confidence`.
+    """
+
+    max_text_cells: int = 5
+    min_bitmap_coverage: float = 0.5
+    min_layout_confidence: float = 0.5
+
+
+class HybridPdfPipelineOptions(PdfPipelineOptions):
+    """Options for the PDF pipeline routing the hard pages to a VLM."""
+
+    vlm_options: Union[HuggingFaceVlmOptions] = smoldocling_vlm_conversion_options
+    page_routing_options: PageRoutingOptions = PageRoutingOptions()
@@ -1,8 +1,9 @@
 import sys
+from enum import Enum
 from pathlib import Path
 from typing import Annotated, Optional, Tuple
 
-from pydantic import BaseModel, PlainValidator
+from pydantic import BaseModel, Field, PlainValidator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -25,6 +26,14 @@ class DocumentLimits(BaseModel):
     page_range: PageRange = DEFAULT_PAGE_RANGE
 
 
+class ImageExtractionMode(str, Enum):
+    """How the declarative backends extract the images embedded in documents."""
+
+    PNG = "png"  # Decoded and embedded as PNG data URIs
+    ORIGINAL = "original"  # The original bytes, only the header is decoded
+    SKIP = "skip"  # Pictures are added without their image
+
+
 class BatchConcurrencySettings(BaseModel):
     doc_batch_size: int = 2
     doc_batch_concurrency: int = 2
@@ -32,6 +41,52 @@ class BatchConcurrencySettings(BaseModel):
     page_batch_concurrency: int = 2
     elements_batch_size: int = 16
 
+    # Models are loaded on first use. After each conversion, the models which
+    # were not used for model_idle_timeout seconds are unloaded, as well as the
+    # least recently used ones while the process RSS exceeds model_max_rss bytes.
+    model_idle_timeout: Optional[float] = None
+    model_max_rss: Optional[int] = None
+
+    # Number of pipelines kept by each converter for the different options
+    pipeline_cache_size: int = 4
+
+    # Enrichment models processing their batches at the same time. Models working
+    # on the same items (e.g. picture classification and description) may then add
+    # their annotations in any order.
+    enrichment_concurrency: int = 1
+    # When set, convert_all forms the enrichment batches of the image-based models
+    # (code/formula, picture classification and description) across documents.
+    # A partial batch is run once its oldest element waited this many seconds, as
+    # checked whenever a document is converted.
+    enrichment_max_wait: Optional[float] = None
+
+    # When set, CSV inputs are streamed into tables of at most this many data
+    # rows, each starting with the header row, instead of one table.
+    csv_chunk_rows: Optional[Annotated[int, Field(ge=1)]] = None
+
+    # Extraction of the images embedded in DOCX and PPTX inputs. Keeping the
+    # original bytes or skipping the images avoids decoding and re-encoding them,
+    # e.g. when only the text is exported.
+    image_extraction_mode: ImageExtractionMode = ImageExtractionMode.PNG
+
+    # Workers converting the slides of a PPTX input, each slide into its own
+    # fragment, merged in order into the document. Threads are used, or processes
+    # with pptx_slide_processes, which open the presentation once per process.
+    pptx_slide_workers: int = 1
+    pptx_slide_processes: bool = False
+
+    # USPTO bulk files, which concatenate many patents, are split into one input
+    # document per patent. The patents are parsed ahead by this many processes.
+    uspto_bulk_split: bool = False
+    uspto_bulk_workers: int = 1
+
+    # JATS articles are converted while being parsed, clearing the elements once
+    # converted, instead of from the whole tree. With jats_bulk_archives, the tar
+    # packages of JATS articles (e.g. the PubMed Central bulk packages) are read as
+    # one input document per article.
+    jats_iterparse: bool = False
+    jats_bulk_archives: bool = False
+
     # doc_batch_size: int = 1
     # doc_batch_concurrency: int = 1
     # page_batch_size: int = 1
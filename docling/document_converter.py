@@ -1,10 +1,13 @@
+import hashlib
+import json
 import logging
 import math
 import sys
 import time
+from collections import OrderedDict, deque
 from functools import partial
 from pathlib import Path
-from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
 
 from pydantic import BaseModel, ConfigDict, model_validator, validate_call
 
@@ -13,6 +16,7 @@ from docling.backend.asciidoc_backend import AsciiDocBackend
 from docling.backend.csv_backend import CsvDocumentBackend
 from docling.backend.docling_parse_v2_backend import DoclingParseV2DocumentBackend
 from docling.backend.html_backend import HTMLDocumentBackend
+from docling.backend.image_backend import ImageDocumentBackend
 from docling.backend.json.docling_json_backend import DoclingJSONBackend
 from docling.backend.md_backend import MarkdownDocumentBackend
 from docling.backend.msexcel_backend import MsExcelDocumentBackend
@@ -43,11 +47,21 @@ from docling.exceptions import ConversionError
 from docling.pipeline.base_pipeline import BasePipeline
 from docling.pipeline.simple_pipeline import SimplePipeline
 from docling.pipeline.standard_pdf_pipeline import StandardPdfPipeline
+from docling.utils.enrichment_batcher import EnrichmentBatcher
 from docling.utils.utils import chunkify
 
 _log = logging.getLogger(__name__)
 
 
+def _get_pipeline_options_hash(pipeline_options: PipelineOptions) -> str:
+    """Canonical hash of the pipeline options, independent of the field order."""
+    options_json = json.dumps(
+        pipeline_options.model_dump(mode="json", serialize_as_any=True),
+        sort_keys=True,
+    )
+    return hashlib.sha256(options_json.encode("utf-8")).hexdigest()
+
+
 class FormatOption(BaseModel):
     pipeline_cls: Type[BasePipeline]
     pipeline_options: Optional[PipelineOptions] = None
@@ -109,7 +123,7 @@ class XMLJatsFormatOption(FormatOption):
 
 class ImageFormatOption(FormatOption):
     pipeline_cls: Type = StandardPdfPipeline
-    backend: Type[AbstractDocumentBackend] = DoclingParseV2DocumentBackend
+    backend: Type[AbstractDocumentBackend] = ImageDocumentBackend
 
 
 class PdfFormatOption(FormatOption):
@@ -147,7 +161,7 @@ def _get_default_option(format: InputFormat) -> FormatOption:
             pipeline_cls=SimplePipeline, backend=JatsDocumentBackend
         ),
         InputFormat.IMAGE: FormatOption(
-            pipeline_cls=StandardPdfPipeline, backend=DoclingParseV2DocumentBackend
+            pipeline_cls=StandardPdfPipeline, backend=ImageDocumentBackend
         ),
         InputFormat.PDF: FormatOption(
             pipeline_cls=StandardPdfPipeline, backend=DoclingParseV2DocumentBackend
@@ -181,7 +195,9 @@ class DocumentConverter:
             )
             for format in self.allowed_formats
         }
-        self.initialized_pipelines: Dict[Type[BasePipeline], BasePipeline] = {}
+        self.initialized_pipelines: OrderedDict[
+            Tuple[Type[BasePipeline], str], BasePipeline
+        ] = OrderedDict()
 
     def initialize_pipeline(self, format: InputFormat):
         """Initialize the conversion pipeline for the selected format."""
@@ -254,6 +270,14 @@ class DocumentConverter:
     ) -> Iterator[ConversionResult]:
         start_time = time.monotonic()
 
+        enrichment_batcher: Optional[EnrichmentBatcher] = None
+        waiting: Deque[ConversionResult] = deque()
+        if settings.perf.enrichment_max_wait is not None:
+            enrichment_batcher = EnrichmentBatcher(
+                max_wait=settings.perf.enrichment_max_wait,
+                raises_on_error=raises_on_error,
+            )
+
         for input_batch in chunkify(
             conv_input.docs(self.format_to_options),
             settings.perf.doc_batch_size,  # pass format_options
@@ -268,7 +292,11 @@ class DocumentConverter:
             # Note: PDF backends are not thread-safe, thread pool usage was disabled.
 
             for item in map(
-                partial(self._process_document, raises_on_error=raises_on_error),
+                partial(
+                    self._process_document,
+                    raises_on_error=raises_on_error,
+                    enrichment_batcher=enrichment_batcher,
+                ),
                 input_batch,
             ):
                 elapsed = time.monotonic() - start_time
@@ -276,7 +304,22 @@ class DocumentConverter:
                 _log.info(
                     f"Finished converting document {item.input.file.name} in {elapsed:.2f} sec."
                 )
-                yield item
+                if enrichment_batcher is None:
+                    yield item
+                    continue
+
+                # The documents are returned in order, once their elements queued
+                # for cross-document enrichment are processed
+                waiting.append(item)
+                enrichment_batcher.flush_expired()
+                while len(waiting) > 0 and not enrichment_batcher.is_pending(
+                    waiting[0]
+                ):
+                    yield waiting.popleft()
+
+        if enrichment_batcher is not None:
+            enrichment_batcher.flush_all()
+            yield from waiting
 
     def _get_pipeline(self, doc_format: InputFormat) -> Optional[BasePipeline]:
         fopt = self.format_to_options.get(doc_format)
@@ -289,26 +332,41 @@ class DocumentConverter:
 
         if pipeline_options is None:
             return None
-        # TODO this will ignore if different options have been defined for the same pipeline class.
-        if (
-            pipeline_class not in self.initialized_pipelines
-            or self.initialized_pipelines[pipeline_class].pipeline_options
-            != pipeline_options
-        ):
-            self.initialized_pipelines[pipeline_class] = pipeline_class(
+
+        # Pipelines are cached per class and options, least recently used first.
+        # The models are shared through the model registry, hence building another
+        # pipeline for different options does not load the weights again.
+        cache_key = (pipeline_class, _get_pipeline_options_hash(pipeline_options))
+        if cache_key in self.initialized_pipelines:
+            self.initialized_pipelines.move_to_end(cache_key)
+        else:
+            start_time = time.monotonic()
+            self.initialized_pipelines[cache_key] = pipeline_class(
                 pipeline_options=pipeline_options
             )
-        return self.initialized_pipelines[pipeline_class]
+            _log.info(
+                f"Initialized pipeline {pipeline_class.__name__} in {time.monotonic() - start_time:.2f} sec."
+            )
+            while len(self.initialized_pipelines) > settings.perf.pipeline_cache_size:
+                self.initialized_pipelines.popitem(last=False)
+        return self.initialized_pipelines[cache_key]
 
     def _process_document(
-        self, in_doc: InputDocument, raises_on_error: bool
+        self,
+        in_doc: InputDocument,
+        raises_on_error: bool,
+        enrichment_batcher: Optional[EnrichmentBatcher] = None,
     ) -> ConversionResult:
 
         valid = (
             self.allowed_formats is not None and in_doc.format in self.allowed_formats
         )
         if valid:
-            conv_res = self._execute_pipeline(in_doc, raises_on_error=raises_on_error)
+            conv_res = self._execute_pipeline(
+                in_doc,
+                raises_on_error=raises_on_error,
+                enrichment_batcher=enrichment_batcher,
+            )
         else:
             error_message = f"File format not allowed: {in_doc.file}"
             if raises_on_error:
@@ -326,12 +384,19 @@ class DocumentConverter:
         return conv_res
 
     def _execute_pipeline(
-        self, in_doc: InputDocument, raises_on_error: bool
+        self,
+        in_doc: InputDocument,
+        raises_on_error: bool,
+        enrichment_batcher: Optional[EnrichmentBatcher] = None,
     ) -> ConversionResult:
         if in_doc.valid:
             pipeline = self._get_pipeline(in_doc.format)
             if pipeline is not None:
-                conv_res = pipeline.execute(in_doc, raises_on_error=raises_on_error)
+                conv_res = pipeline.execute(
+                    in_doc,
+                    raises_on_error=raises_on_error,
+                    enrichment_batcher=enrichment_batcher,
+                )
             else:
                 if raises_on_error:
                     raise ConversionError(
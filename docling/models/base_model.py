@@ -84,4 +84,8 @@ class BaseItemAndImageEnrichmentModel(
         cropped_image = conv_res.pages[page_ix].get_image(
             scale=self.images_scale, cropbox=expanded_bbox
         )
-        return ItemAndImageEnrichmentElement(item=element, image=cropped_image)
+        return ItemAndImageEnrichmentElement(
+            item=element,
+            image=cropped_image,
+            document_hash=conv_res.input.document_hash,
+        )
@@ -97,6 +97,14 @@ class BaseOcrModel(BasePageModel):
         else:  # overall coverage of bitmaps is too low, drop all bitmap rectangles.
             return []
 
+    # Recognizes the text in a single rectangle of the page, rendered at the given scale.
+    # The returned cells are in page coordinates and are not filtered by confidence.
+    @abstractmethod
+    def _ocr_rect(
+        self, page: Page, ocr_rect: BoundingBox, scale: float
+    ) -> List[OcrCell]:
+        pass
+
     # Filters OCR cells by dropping any OCR cell that intersects with an existing programmatic cell.
     def _filter_ocr_cells(self, ocr_cells, programmatic_cells):
         # Create R-tree index for programmatic cells
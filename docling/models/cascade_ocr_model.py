@@ -0,0 +1,201 @@
+import logging
+from typing import Iterable, List
+
+from docling_core.types.doc import BoundingBox, CoordOrigin
+
+from docling.datamodel.base_models import OcrCell, Page
+from docling.datamodel.document import ConversionResult
+from docling.datamodel.pipeline_options import CascadeOcrOptions
+from docling.datamodel.settings import settings
+from docling.models.base_ocr_model import BaseOcrModel
+from docling.utils.profiling import TimeRecorder, record_value
+
+_log = logging.getLogger(__name__)
+
+
+class CascadeOcrModel(BaseOcrModel):
+    """Two-tier OCR model.
+
+    The fast model processes every OCR region of the page. The cells it recognizes
+    with a confidence below `options.confidence_threshold` are grouped in regions,
+    which are processed again by the accurate model. Both tiers may share the same
+    engine instance, in which case they only differ by the rendering scale.
+    """
+
+    def __init__(
+        self,
+        enabled: bool,
+        options: CascadeOcrOptions,
+        fast_model: BaseOcrModel,
+        accurate_model: BaseOcrModel,
+    ):
+        super().__init__(enabled=enabled, options=options)
+        self.options: CascadeOcrOptions
+
+        self.fast_model = fast_model
+        self.accurate_model = accurate_model
+
+    def _get_page_box(self, page: Page) -> BoundingBox:
+        assert page.size is not None
+        return BoundingBox(
+            l=0,
+            t=0,
+            r=page.size.width,
+            b=page.size.height,
+            coord_origin=CoordOrigin.TOPLEFT,
+        )
+
+    # Pads the bounding boxes of the weak cells and merges the overlapping ones.
+    def _get_escalation_rects(
+        self, page: Page, weak_cells: List[OcrCell]
+    ) -> List[BoundingBox]:
+        page_box = self._get_page_box(page)
+        pad = self.options.region_padding
+
+        rects: List[BoundingBox] = []
+        for cell in weak_cells:
+            l, t, r, b = cell.bbox.as_tuple()
+            rects.append(
+                BoundingBox(
+                    l=max(page_box.l, min(l, r) - pad),
+                    t=max(page_box.t, min(t, b) - pad),
+                    r=min(page_box.r, max(l, r) + pad),
+                    b=min(page_box.b, max(t, b) + pad),
+                    coord_origin=CoordOrigin.TOPLEFT,
+                )
+            )
+
+        merged = True
+        while merged:
+            merged = False
+            result: List[BoundingBox] = []
+            for rect in rects:
+                for ix, other in enumerate(result):
+                    if rect.overlaps(other):
+                        result[ix] = BoundingBox(
+                            l=min(rect.l, other.l),
+                            t=min(rect.t, other.t),
+                            r=max(rect.r, other.r),
+                            b=max(rect.b, other.b),
+                            coord_origin=CoordOrigin.TOPLEFT,
+                        )
+                        merged = True
+                        break
+                else:
+                    result.append(rect)
+            rects = result
+
+        return rects
+
+    # Recognizes the regions of the weak cells with the accurate model, keeping the
+    # cells which do not intersect the accepted ones.
+    def _escalate(
+        self, page: Page, weak_cells: List[OcrCell], accepted_cells: List[OcrCell]
+    ) -> List[OcrCell]:
+        accurate_cells: List[OcrCell] = []
+        for rect in self._get_escalation_rects(page, weak_cells):
+            if rect.area() == 0:
+                continue
+            accurate_cells.extend(
+                self.accurate_model._ocr_rect(page, rect, self.options.accurate_scale)
+            )
+        # The padded regions may reach into cells which were already accepted from
+        # the fast tier.
+        return self._filter_ocr_cells(accurate_cells, accepted_cells)
+
+    # Runs the cascade on a single rectangle. Each tier renders it at its own scale,
+    # the given one is not used.
+    def _ocr_rect(
+        self, page: Page, ocr_rect: BoundingBox, scale: float
+    ) -> List[OcrCell]:
+        fast_cells = self.fast_model._ocr_rect(page, ocr_rect, self.options.fast_scale)
+        accepted_cells = [
+            c for c in fast_cells if c.confidence >= self.options.confidence_threshold
+        ]
+        weak_cells = [
+            c for c in fast_cells if c.confidence < self.options.confidence_threshold
+        ]
+        if len(weak_cells) == 0:
+            return accepted_cells
+        return accepted_cells + self._escalate(page, weak_cells, accepted_cells)
+
+    def _record_hit_rate(
+        self, conv_res: ConversionResult, num_accepted: int, num_total: int
+    ):
+        # The per-page fraction of cells accepted from the fast tier is stored as
+        # a profiling sample, such that the usual aggregations (avg, percentile)
+        # can be used on it.
+        if num_total == 0:
+            return
+        record_value(conv_res, "ocr_cascade_hit_rate", num_accepted / num_total)
+
+    def __call__(
+        self, conv_res: ConversionResult, page_batch: Iterable[Page]
+    ) -> Iterable[Page]:
+
+        if not self.enabled:
+            yield from page_batch
+            return
+
+        for page in page_batch:
+            assert page._backend is not None
+            if not page._backend.is_valid():
+                yield page
+            else:
+                with TimeRecorder(conv_res, "ocr"):
+                    ocr_rects = self.get_ocr_rects(page)
+
+                    fast_cells: List[OcrCell] = []
+                    with TimeRecorder(conv_res, "ocr_cascade_fast"):
+                        for ocr_rect in ocr_rects:
+                            # Skip zero area boxes
+                            if ocr_rect.area() == 0:
+                                continue
+                            fast_cells.extend(
+                                self.fast_model._ocr_rect(
+                                    page, ocr_rect, self.options.fast_scale
+                                )
+                            )
+
+                    accepted_cells = [
+                        c
+                        for c in fast_cells
+                        if c.confidence >= self.options.confidence_threshold
+                    ]
+                    weak_cells = [
+                        c
+                        for c in fast_cells
+                        if c.confidence < self.options.confidence_threshold
+                    ]
+
+                    accurate_cells: List[OcrCell] = []
+                    if len(weak_cells) > 0:
+                        with TimeRecorder(conv_res, "ocr_cascade_accurate"):
+                            accurate_cells = self._escalate(
+                                page, weak_cells, accepted_cells
+                            )
+
+                    self._record_hit_rate(
+                        conv_res, len(accepted_cells), len(fast_cells)
+                    )
+                    _log.debug(
+                        f"Page {page.page_no}: {len(accepted_cells)}/{len(fast_cells)} "
+                        f"OCR cells accepted from the fast tier, "
+                        f"{len(accurate_cells)} cells from the accurate tier."
+                    )
+
+                    all_ocr_cells = [
+                        OcrCell(
+                            id=ix, text=c.text, confidence=c.confidence, bbox=c.bbox
+                        )
+                        for ix, c in enumerate(accepted_cells + accurate_cells)
+                    ]
+
+                    # Post-process the cells
+                    page.cells = self.post_process_cells(all_ocr_cells, page.cells)
+
+                # DEBUG code:
+                if settings.debug.visualize_ocr:
+                    self.draw_ocr_rects_and_cells(conv_res, page, ocr_rects)
+
+                yield page
@@ -1,4 +1,6 @@
+import math
 import re
+from functools import partial
 from pathlib import Path
 from typing import Iterable, List, Literal, Optional, Tuple, Union
 
@@ -18,6 +20,7 @@ from docling.datamodel.base_models import ItemAndImageEnrichmentElement
 from docling.datamodel.pipeline_options import AcceleratorOptions
 from docling.models.base_model import BaseItemAndImageEnrichmentModel
 from docling.utils.accelerator_utils import decide_device
+from docling.utils.model_registry import make_model_key, model_registry
 
 
 class CodeFormulaModelOptions(BaseModel):
@@ -63,7 +66,10 @@ class CodeFormulaModel(BaseItemAndImageEnrichmentModel):
     """
 
     _model_repo_folder = "ds4sd--CodeFormula"
-    elements_batch_size = 5
+    # The elements of a pipeline batch are regrouped in predictor batches of
+    # similar inputs, which limits the padding of images and generated tokens
+    elements_batch_size = 40
+    predict_batch_size = 5
     images_scale = 1.66  # = 120 dpi, aligned with training data resolution
     expansion_factor = 0.03
 
@@ -92,22 +98,46 @@ class CodeFormulaModel(BaseItemAndImageEnrichmentModel):
         self.options = options
 
         if self.enabled:
-            device = decide_device(accelerator_options.device)
-
-            from docling_ibm_models.code_formula_model.code_formula_predictor import (
-                CodeFormulaPredictor,
+            # The predictor is shared with the other pipelines using the same
+            # weights and loaded when the first element is enriched
+            self._code_formula_model = model_registry.acquire(
+                owner=self,
+                key=make_model_key(
+                    CodeFormulaModel,
+                    artifacts_path=artifacts_path,
+                    device=accelerator_options.device,
+                    num_threads=accelerator_options.num_threads,
+                ),
+                name="code_formula",
+                loader=partial(
+                    self._load_predictor, artifacts_path, accelerator_options
+                ),
             )
 
-            if artifacts_path is None:
-                artifacts_path = self.download_models()
-            else:
-                artifacts_path = artifacts_path / self._model_repo_folder
+    @classmethod
+    def _load_predictor(
+        cls, artifacts_path: Optional[Path], accelerator_options: AcceleratorOptions
+    ):
+        device = decide_device(accelerator_options.device)
 
-            self.code_formula_model = CodeFormulaPredictor(
-                artifacts_path=str(artifacts_path),
-                device=device,
-                num_threads=accelerator_options.num_threads,
-            )
+        from docling_ibm_models.code_formula_model.code_formula_predictor import (
+            CodeFormulaPredictor,
+        )
+
+        if artifacts_path is None:
+            artifacts_path = cls.download_models()
+        else:
+            artifacts_path = artifacts_path / cls._model_repo_folder
+
+        return CodeFormulaPredictor(
+            artifacts_path=str(artifacts_path),
+            device=device,
+            num_threads=accelerator_options.num_threads,
+        )
+
+    @property
+    def code_formula_model(self):
+        return self._code_formula_model.get()
 
     @staticmethod
     def download_models(
@@ -206,6 +236,49 @@ class CodeFormulaModel(BaseItemAndImageEnrichmentModel):
         except ValueError:
             return CodeLanguageLabel.UNKNOWN
 
+    @staticmethod
+    def _bucket_elements(
+        elements: List[ItemAndImageEnrichmentElement], batch_size: int
+    ) -> List[List[int]]:
+        """
+        Groups the elements in batches of similar inputs and expected outputs.
+
+        The elements are sorted by label, by the aspect ratio of their image (in
+        steps of a factor two), by the length of their parsed text, which is a
+        proxy for the length of the generated output, and by the area of their
+        image. Consecutive elements form the batches, which never mix labels.
+
+        Parameters
+        ----------
+        elements : List[ItemAndImageEnrichmentElement]
+            The elements to group.
+        batch_size : int
+            The maximum number of elements in a batch.
+
+        Returns
+        -------
+        List[List[int]]
+            The batches, as indices into `elements`.
+        """
+
+        def sort_key(ix: int) -> Tuple[str, int, int, int]:
+            el = elements[ix]
+            width, height = el.image.size
+            aspect = round(math.log2(max(width, 1) / max(height, 1)))
+            text = el.item.text if isinstance(el.item, TextItem) else ""
+            return (str(el.item.label), aspect, len(text), width * height)
+
+        batches: List[List[int]] = []
+        for ix in sorted(range(len(elements)), key=sort_key):
+            if (
+                len(batches) == 0
+                or len(batches[-1]) == batch_size
+                or elements[batches[-1][0]].item.label != elements[ix].item.label
+            ):
+                batches.append([])
+            batches[-1].append(ix)
+        return batches
+
     def __call__(
         self,
         doc: DoclingDocument,
@@ -231,18 +304,24 @@ class CodeFormulaModel(BaseItemAndImageEnrichmentModel):
                 yield element.item
             return
 
-        labels: List[str] = []
-        images: List[Union[Image.Image, np.ndarray]] = []
-        elements: List[TextItem] = []
+        elements: List[ItemAndImageEnrichmentElement] = []
+        items: List[TextItem] = []
         for el in element_batch:
             assert isinstance(el.item, TextItem)
-            elements.append(el.item)
-            labels.append(el.item.label)
-            images.append(el.image)
-
-        outputs = self.code_formula_model.predict(images, labels)
-
-        for item, output in zip(elements, outputs):
+            elements.append(el)
+            items.append(el.item)
+
+        outputs: List[str] = [""] * len(elements)
+        for bucket in self._bucket_elements(elements, self.predict_batch_size):
+            labels: List[str] = [items[ix].label for ix in bucket]
+            images: List[Union[Image.Image, np.ndarray]] = [
+                elements[ix].image for ix in bucket
+            ]
+            predictions = self.code_formula_model.predict(images, labels)
+            for ix, output in zip(bucket, predictions):
+                outputs[ix] = output
+
+        for item, output in zip(items, outputs):
             if isinstance(item, CodeItem):
                 output, code_language = self._extract_code_language(output)
                 item.code_language = self._get_code_language_enum(code_language)
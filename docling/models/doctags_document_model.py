@@ -0,0 +1,40 @@
+from typing import Dict, Iterable, Optional
+
+from docling_core.types.doc import DoclingDocument
+
+from docling.datamodel.base_models import Page
+from docling.datamodel.document import ConversionResult
+from docling.models.base_model import BasePageModel
+from docling.utils.doctags import DocTagsDocumentBuilder
+from docling.utils.profiling import TimeRecorder
+
+
+class DocTagsDocumentModel(BasePageModel):
+    """Adds the DocTags of each page to the document of its conversion.
+
+    The pages are parsed as soon as they are predicted, instead of after the whole
+    document is generated. The document is taken with `pop_document()` at assembly.
+    """
+
+    def __init__(self, force_backend_text: bool = False):
+        self.force_backend_text = force_backend_text
+        # Documents in construction, by conversion
+        self._builders: Dict[int, DocTagsDocumentBuilder] = {}
+
+    def __call__(
+        self, conv_res: ConversionResult, page_batch: Iterable[Page]
+    ) -> Iterable[Page]:
+        builder = self._builders.get(id(conv_res))
+        if builder is None:
+            builder = DocTagsDocumentBuilder(force_backend_text=self.force_backend_text)
+            self._builders[id(conv_res)] = builder
+
+        for page in page_batch:
+            with TimeRecorder(conv_res, "doctags_parse"):
+                builder.add_page(page)
+
+            yield page
+
+    def pop_document(self, conv_res: ConversionResult) -> Optional[DoclingDocument]:
+        builder = self._builders.pop(id(conv_res), None)
+        return builder.document if builder is not None else None
@@ -1,3 +1,4 @@
+from functools import partial
 from pathlib import Path
 from typing import Iterable, List, Literal, Optional, Tuple, Union
 
@@ -12,9 +13,13 @@ from docling_core.types.doc import (
 from PIL import Image
 from pydantic import BaseModel
 
-from docling.datamodel.pipeline_options import AcceleratorOptions
-from docling.models.base_model import BaseEnrichmentModel
+from docling.datamodel.base_models import ItemAndImageEnrichmentElement
+from docling.datamodel.document import ConversionResult
+from docling.datamodel.pipeline_options import AcceleratorOptions, PictureDedupOptions
+from docling.models.base_model import GenericEnrichmentModel
 from docling.utils.accelerator_utils import decide_device
+from docling.utils.model_registry import make_model_key, model_registry
+from docling.utils.picture_dedup import PictureResultCache
 
 
 class DocumentPictureClassifierOptions(BaseModel):
@@ -30,7 +35,7 @@ class DocumentPictureClassifierOptions(BaseModel):
     kind: Literal["document_picture_classifier"] = "document_picture_classifier"
 
 
-class DocumentPictureClassifier(BaseEnrichmentModel):
+class DocumentPictureClassifier(GenericEnrichmentModel[ItemAndImageEnrichmentElement]):
     """
     A model for classifying pictures in documents.
 
@@ -65,6 +70,7 @@ class DocumentPictureClassifier(BaseEnrichmentModel):
         artifacts_path: Optional[Path],
         options: DocumentPictureClassifierOptions,
         accelerator_options: AcceleratorOptions,
+        dedup_options: Optional[PictureDedupOptions] = None,
     ):
         """
         Initializes the DocumentPictureClassifier.
@@ -79,26 +85,58 @@ class DocumentPictureClassifier(BaseEnrichmentModel):
             Configuration options for the classifier.
         accelerator_options : AcceleratorOptions
             Options for configuring the device and parallelism.
+        dedup_options : Optional[PictureDedupOptions]
+            Options for classifying identical pictures once, or None to classify
+            every picture.
         """
         self.enabled = enabled
         self.options = options
+        self._result_cache: Optional[PictureResultCache] = None
+        if dedup_options is not None:
+            self._result_cache = PictureResultCache(
+                namespace="document_picture_classifier", options=dedup_options
+            )
 
         if self.enabled:
-            device = decide_device(accelerator_options.device)
-            from docling_ibm_models.document_figure_classifier_model.document_figure_classifier_predictor import (
-                DocumentFigureClassifierPredictor,
+            # The predictor is shared with the other pipelines using the same
+            # weights and loaded when the first picture is classified
+            self._document_picture_classifier = model_registry.acquire(
+                owner=self,
+                key=make_model_key(
+                    DocumentPictureClassifier,
+                    artifacts_path=artifacts_path,
+                    device=accelerator_options.device,
+                    num_threads=accelerator_options.num_threads,
+                ),
+                name="document_picture_classifier",
+                loader=partial(
+                    self._load_predictor, artifacts_path, accelerator_options
+                ),
             )
 
-            if artifacts_path is None:
-                artifacts_path = self.download_models()
-            else:
-                artifacts_path = artifacts_path / self._model_repo_folder
+    @classmethod
+    def _load_predictor(
+        cls, artifacts_path: Optional[Path], accelerator_options: AcceleratorOptions
+    ):
+        device = decide_device(accelerator_options.device)
+        from docling_ibm_models.document_figure_classifier_model.document_figure_classifier_predictor import (
+            DocumentFigureClassifierPredictor,
+        )
 
-            self.document_picture_classifier = DocumentFigureClassifierPredictor(
-                artifacts_path=str(artifacts_path),
-                device=device,
-                num_threads=accelerator_options.num_threads,
-            )
+        if artifacts_path is None:
+            artifacts_path = cls.download_models()
+        else:
+            artifacts_path = artifacts_path / cls._model_repo_folder
+
+        return DocumentFigureClassifierPredictor(
+            artifacts_path=str(artifacts_path),
+            device=device,
+            num_threads=accelerator_options.num_threads,
+        )
+
+    @property
+    def document_picture_classifier(self):
+        return self._document_picture_classifier.get()
 
     @staticmethod
     def download_models(
@@ -136,10 +174,39 @@ class DocumentPictureClassifier(BaseEnrichmentModel):
         """
         return self.enabled and isinstance(element, PictureItem)
 
+    def prepare_element(
+        self, conv_res: ConversionResult, element: NodeItem
+    ) -> Optional[ItemAndImageEnrichmentElement]:
+        """
+        Attaches the image of the picture, such that the element can be processed
+        independently of its document.
+
+        Parameters
+        ----------
+        conv_res : ConversionResult
+            The conversion result holding the document of the element.
+        element : NodeItem
+            The element to be prepared.
+
+        Returns
+        -------
+        Optional[ItemAndImageEnrichmentElement]
+            The picture with its image, or None if the element is not processable.
+        """
+        if not self.is_processable(doc=conv_res.document, element=element):
+            return None
+
+        assert isinstance(element, PictureItem)
+        image = element.get_image(conv_res.document)
+        assert image is not None
+        return ItemAndImageEnrichmentElement(
+            item=element, image=image, document_hash=conv_res.input.document_hash
+        )
+
     def __call__(
         self,
         doc: DoclingDocument,
-        element_batch: Iterable[NodeItem],
+        element_batch: Iterable[ItemAndImageEnrichmentElement],
     ) -> Iterable[NodeItem]:
         """
         Processes a batch of elements and enriches them with classification predictions.
@@ -148,8 +215,8 @@ class DocumentPictureClassifier(BaseEnrichmentModel):
         ----------
         doc : DoclingDocument
             The document containing the elements to be processed.
-        element_batch : Iterable[NodeItem]
-            A batch of pictures to classify.
+        element_batch : Iterable[ItemAndImageEnrichmentElement]
+            A batch of pictures to classify, with their images.
 
         Returns
         -------
@@ -159,19 +226,30 @@ class DocumentPictureClassifier(BaseEnrichmentModel):
         """
         if not self.enabled:
             for element in element_batch:
-                yield element
+                yield element.item
             return
 
         images: List[Union[Image.Image, np.ndarray]] = []
         elements: List[PictureItem] = []
+        # The pictures of a batch may come from several documents
+        scopes: List[Optional[str]] = []
         for el in element_batch:
-            assert isinstance(el, PictureItem)
-            elements.append(el)
-            img = el.get_image(doc)
-            assert img is not None
-            images.append(img)
+            assert isinstance(el.item, PictureItem)
+            elements.append(el.item)
+            images.append(el.image)
+            scopes.append(el.document_hash)
 
-        outputs = self.document_picture_classifier.predict(images)
+        if self._result_cache is None:
+            outputs = self.document_picture_classifier.predict(images)
+        else:
+            outputs = self._result_cache.map(
+                images,
+                lambda unique: [
+                    [[pred[0], pred[1]] for pred in output]
+                    for output in self.document_picture_classifier.predict(unique)
+                ],
+                scopes=scopes,
+            )
 
         for element, output in zip(elements, outputs):
             element.annotations.append(
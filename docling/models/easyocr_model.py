@@ -1,6 +1,7 @@
 import logging
 import warnings
 import zipfile
+from functools import partial
 from pathlib import Path
 from typing import Iterable, List, Optional
 
@@ -17,6 +18,8 @@ from docling.datamodel.pipeline_options import (
 from docling.datamodel.settings import settings
 from docling.models.base_ocr_model import BaseOcrModel
 from docling.utils.accelerator_utils import decide_device
+from docling.utils.lazy_model import LazyModel
+from docling.utils.model_registry import make_model_key, model_registry
 from docling.utils.profiling import TimeRecorder
 from docling.utils.utils import download_url_with_progress
 
@@ -73,14 +76,25 @@ class EasyOcrModel(BaseOcrModel):
                 download_enabled = False
                 model_storage_directory = str(artifacts_path / self._model_repo_folder)
 
-            self.reader = easyocr.Reader(
+            reader_params = dict(
                 lang_list=self.options.lang,
                 gpu=use_gpu,
                 model_storage_directory=model_storage_directory,
                 recog_network=self.options.recog_network,
                 download_enabled=download_enabled,
-                verbose=False,
             )
+            # The reader is shared with the other pipelines using the same
+            # weights and loaded when the first region is recognized
+            self._reader: LazyModel[easyocr.Reader] = model_registry.acquire(
+                owner=self,
+                key=make_model_key(EasyOcrModel, **reader_params),
+                name="easyocr",
+                loader=partial(easyocr.Reader, **reader_params, verbose=False),
+            )
+
+    @property
+    def reader(self):
+        return self._reader.get()
 
     @staticmethod
     def download_models(
@@ -116,6 +130,36 @@ class EasyOcrModel(BaseOcrModel):
 
         return local_dir
 
+    def _ocr_rect(
+        self, page: Page, ocr_rect: BoundingBox, scale: float
+    ) -> List[OcrCell]:
+        assert page._backend is not None
+
+        high_res_image = page._backend.get_page_image(scale=scale, cropbox=ocr_rect)
+        im = numpy.array(high_res_image)
+        result = self.reader.readtext(im)
+
+        del high_res_image
+        del im
+
+        return [
+            OcrCell(
+                id=ix,
+                text=line[1],
+                confidence=line[2],
+                bbox=BoundingBox.from_tuple(
+                    coord=(
+                        (line[0][0][0] / scale) + ocr_rect.l,
+                        (line[0][0][1] / scale) + ocr_rect.t,
+                        (line[0][2][0] / scale) + ocr_rect.l,
+                        (line[0][2][1] / scale) + ocr_rect.t,
+                    ),
+                    origin=CoordOrigin.TOPLEFT,
+                ),
+            )
+            for ix, line in enumerate(result)
+        ]
+
     def __call__(
         self, conv_res: ConversionResult, page_batch: Iterable[Page]
     ) -> Iterable[Page]:
@@ -138,32 +182,10 @@ class EasyOcrModel(BaseOcrModel):
                         # Skip zero area boxes
                         if ocr_rect.area() == 0:
                             continue
-                        high_res_image = page._backend.get_page_image(
-                            scale=self.scale, cropbox=ocr_rect
-                        )
-                        im = numpy.array(high_res_image)
-                        result = self.reader.readtext(im)
-
-                        del high_res_image
-                        del im
-
                         cells = [
-                            OcrCell(
-                                id=ix,
-                                text=line[1],
-                                confidence=line[2],
-                                bbox=BoundingBox.from_tuple(
-                                    coord=(
-                                        (line[0][0][0] / self.scale) + ocr_rect.l,
-                                        (line[0][0][1] / self.scale) + ocr_rect.t,
-                                        (line[0][2][0] / self.scale) + ocr_rect.l,
-                                        (line[0][2][1] / self.scale) + ocr_rect.t,
-                                    ),
-                                    origin=CoordOrigin.TOPLEFT,
-                                ),
-                            )
-                            for ix, line in enumerate(result)
-                            if line[2] >= self.options.confidence_threshold
+                            cell
+                            for cell in self._ocr_rect(page, ocr_rect, self.scale)
+                            if cell.confidence >= self.options.confidence_threshold
                         ]
                         all_ocr_cells.extend(cells)
 
@@ -1,7 +1,9 @@
 import logging
 import time
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Iterable, List, Optional, Set
+
+from PIL import Image
 
 from docling.datamodel.base_models import Page, VlmPrediction
 from docling.datamodel.document import ConversionResult
@@ -13,7 +15,8 @@ from docling.datamodel.pipeline_options import (
 from docling.datamodel.settings import settings
 from docling.models.base_model import BasePageModel
 from docling.utils.accelerator_utils import decide_device
-from docling.utils.profiling import TimeRecorder
+from docling.utils.model_registry import make_model_key, model_registry
+from docling.utils.profiling import TimeRecorder, record_value
 
 _log = logging.getLogger(__name__)
 
@@ -46,12 +49,6 @@ class HuggingFaceVlmModel(BasePageModel):
 
             repo_cache_folder = vlm_options.repo_id.replace("/", "--")
 
-            # PARAMETERS:
-            if artifacts_path is None:
-                artifacts_path = self.download_models(self.vlm_options.repo_id)
-            elif (artifacts_path / repo_cache_folder).exists():
-                artifacts_path = artifacts_path / repo_cache_folder
-
             self.param_question = vlm_options.prompt  # "Perform Layout Analysis."
             self.param_quantization_config = BitsAndBytesConfig(
                 load_in_8bit=vlm_options.load_in_8bit,  # True,
@@ -59,33 +56,70 @@ class HuggingFaceVlmModel(BasePageModel):
             )
             self.param_quantized = vlm_options.quantized  # False
 
-            self.processor = AutoProcessor.from_pretrained(artifacts_path)
-            if not self.param_quantized:
-                self.vlm_model = AutoModelForVision2Seq.from_pretrained(
-                    artifacts_path,
-                    device_map=device,
-                    torch_dtype=torch.bfloat16,
-                    _attn_implementation=(
-                        "flash_attention_2"
-                        if self.device.startswith("cuda")
-                        and accelerator_options.cuda_use_flash_attention2
-                        else "eager"
-                    ),
-                )  # .to(self.device)
-
-            else:
-                self.vlm_model = AutoModelForVision2Seq.from_pretrained(
-                    artifacts_path,
-                    device_map=device,
-                    torch_dtype="auto",
-                    quantization_config=self.param_quantization_config,
-                    _attn_implementation=(
-                        "flash_attention_2"
-                        if self.device.startswith("cuda")
-                        and accelerator_options.cuda_use_flash_attention2
-                        else "eager"
-                    ),
-                )  # .to(self.device)
+            quantization_config = self.param_quantization_config
+            attn_implementation = (
+                "flash_attention_2"
+                if device.startswith("cuda")
+                and accelerator_options.cuda_use_flash_attention2
+                else "eager"
+            )
+
+            # Does not refer to self, the handle is shared through the registry
+            def _load_processor_and_model():
+                # PARAMETERS:
+                model_path = artifacts_path
+                if model_path is None:
+                    model_path = HuggingFaceVlmModel.download_models(
+                        vlm_options.repo_id
+                    )
+                elif (model_path / repo_cache_folder).exists():
+                    model_path = model_path / repo_cache_folder
+
+                processor = AutoProcessor.from_pretrained(model_path)
+                # Generation continues the prompts, which are hence padded on the left
+                processor.tokenizer.padding_side = "left"
+                if not vlm_options.quantized:
+                    vlm_model = AutoModelForVision2Seq.from_pretrained(
+                        model_path,
+                        device_map=device,
+                        torch_dtype=torch.bfloat16,
+                        _attn_implementation=attn_implementation,
+                    )  # .to(self.device)
+                else:
+                    vlm_model = AutoModelForVision2Seq.from_pretrained(
+                        model_path,
+                        device_map=device,
+                        torch_dtype="auto",
+                        quantization_config=quantization_config,
+                        _attn_implementation=attn_implementation,
+                    )  # .to(self.device)
+                return processor, vlm_model
+
+            # Downloaded and loaded when the first page is generated, e.g. only
+            # when a page is routed to the VLM by the hybrid pipeline
+            self._processor_and_model = model_registry.acquire(
+                owner=self,
+                key=make_model_key(
+                    HuggingFaceVlmModel,
+                    artifacts_path=artifacts_path,
+                    repo_id=vlm_options.repo_id,
+                    device=device,
+                    quantized=vlm_options.quantized,
+                    load_in_8bit=vlm_options.load_in_8bit,
+                    llm_int8_threshold=vlm_options.llm_int8_threshold,
+                    flash_attention=attn_implementation,
+                ),
+                name="hf_vlm",
+                loader=_load_processor_and_model,
+            )
+
+    @property
+    def processor(self):
+        return self._processor_and_model.get()[0]
+
+    @property
+    def vlm_model(self):
+        return self._processor_and_model.get()[1]
 
     @staticmethod
     def download_models(
@@ -108,73 +142,110 @@ class HuggingFaceVlmModel(BasePageModel):
 
         return Path(download_path)
 
+    @staticmethod
+    def _get_num_generated_tokens(token_ids: List[int], stop_ids: Set[int]) -> int:
+        """Number of tokens generated for a sequence, up to its first stop token.
+
+        In a batch, the sequences which stopped early are padded until the longest
+        one is complete.
+        """
+        for ix, token_id in enumerate(token_ids):
+            if token_id in stop_ids:
+                return ix + 1
+        return len(token_ids)
+
+    def _get_stop_ids(self) -> Set[int]:
+        stop_ids: Set[int] = set()
+        for token_id in (
+            self.vlm_model.generation_config.eos_token_id,
+            self.processor.tokenizer.pad_token_id,
+        ):
+            if isinstance(token_id, int):
+                stop_ids.add(token_id)
+            elif token_id is not None:
+                stop_ids.update(token_id)
+        return stop_ids
+
     def __call__(
         self, conv_res: ConversionResult, page_batch: Iterable[Page]
     ) -> Iterable[Page]:
-        for page in page_batch:
+        pages = list(page_batch)
+
+        # Pages with an image are generated together, in a single batch
+        batch_pages: List[Page] = []
+        images: List[Image.Image] = []
+        for page in pages:
             assert page._backend is not None
             if not page._backend.is_valid():
-                yield page
-            else:
-                with TimeRecorder(conv_res, "vlm"):
-                    assert page.size is not None
-
-                    hi_res_image = page.get_image(scale=2.0)  # 144dpi
-                    # hi_res_image = page.get_image(scale=1.0)  # 72dpi
-
-                    if hi_res_image is not None:
-                        im_width, im_height = hi_res_image.size
-
-                    # populate page_tags with predicted doc tags
-                    page_tags = ""
-
-                    if hi_res_image:
-                        if hi_res_image.mode != "RGB":
-                            hi_res_image = hi_res_image.convert("RGB")
-
-                    messages = [
-                        {
-                            "role": "user",
-                            "content": [
-                                {
-                                    "type": "text",
-                                    "text": "This is a page from a document.",
-                                },
-                                {"type": "image"},
-                                {"type": "text", "text": self.param_question},
-                            ],
-                        }
-                    ]
-                    prompt = self.processor.apply_chat_template(
-                        messages, add_generation_prompt=False
-                    )
-                    inputs = self.processor(
-                        text=prompt, images=[hi_res_image], return_tensors="pt"
+                continue
+            assert page.size is not None
+
+            hi_res_image = page.get_image(scale=2.0)  # 144dpi
+            # hi_res_image = page.get_image(scale=1.0)  # 72dpi
+            if hi_res_image is None:
+                continue
+            if hi_res_image.mode != "RGB":
+                hi_res_image = hi_res_image.convert("RGB")
+
+            batch_pages.append(page)
+            images.append(hi_res_image)
+
+        if len(batch_pages) > 0:
+            with TimeRecorder(conv_res, "vlm"):
+                messages = [
+                    {
+                        "role": "user",
+                        "content": [
+                            {
+                                "type": "text",
+                                "text": "This is a page from a document.",
+                            },
+                            {"type": "image"},
+                            {"type": "text", "text": self.param_question},
+                        ],
+                    }
+                ]
+                prompt = self.processor.apply_chat_template(
+                    messages, add_generation_prompt=False
+                )
+                # The prompts are left-padded to the longest one
+                inputs = self.processor(
+                    text=[prompt] * len(images),
+                    images=[[image] for image in images],
+                    padding=True,
+                    return_tensors="pt",
+                )
+                inputs = {k: v.to(self.device) for k, v in inputs.items()}
+
+                start_time = time.time()
+                # Call model to generate, each sequence stops at its own EOS:
+                generated_ids = self.vlm_model.generate(
+                    **inputs, max_new_tokens=4096, use_cache=True
+                )
+                generation_time = time.time() - start_time
+
+                stop_ids = self._get_stop_ids()
+                new_ids = generated_ids[:, inputs["input_ids"].shape[1] :].tolist()
+                batch_tokens = 0
+                for page, token_ids in zip(batch_pages, new_ids):
+                    num_tokens = self._get_num_generated_tokens(token_ids, stop_ids)
+                    page_tags = self.processor.decode(
+                        token_ids[:num_tokens], skip_special_tokens=False
                     )
-                    inputs = {k: v.to(self.device) for k, v in inputs.items()}
+                    page.predictions.vlm_response = VlmPrediction(text=page_tags)
+
+                    record_value(conv_res, "vlm_tokens", num_tokens)
+                    batch_tokens += num_tokens
 
-                    start_time = time.time()
-                    # Call model to generate:
-                    generated_ids = self.vlm_model.generate(
-                        **inputs, max_new_tokens=4096, use_cache=True
+                # The pages of the batch are generated together, so the
+                # throughput is measured over the whole batch
+                if generation_time > 0:
+                    record_value(
+                        conv_res, "vlm_tokens_per_sec", batch_tokens / generation_time
                     )
 
-                    generation_time = time.time() - start_time
-                    generated_texts = self.processor.batch_decode(
-                        generated_ids[:, inputs["input_ids"].shape[1] :],
-                        skip_special_tokens=False,
-                    )[0]
-
-                    num_tokens = len(generated_ids[0])
-                    page_tags = generated_texts
-
-                    # inference_time = time.time() - start_time
-                    # tokens_per_second = num_tokens / generation_time
-                    # print("")
-                    # print(f"Page Inference Time: {inference_time:.2f} seconds")
-                    # print(f"Total tokens on page: {num_tokens:.2f}")
-                    # print(f"Tokens/sec: {tokens_per_second:.2f}")
-                    # print("")
-                    page.predictions.vlm_response = VlmPrediction(text=page_tags)
+            _log.debug(
+                f"Generated {len(batch_pages)} pages in {generation_time:.2f} sec."
+            )
 
-                yield page
+        yield from pages
@@ -1,6 +1,7 @@
 import copy
 import logging
 import warnings
+from functools import partial
 from pathlib import Path
 from typing import Iterable, Optional, Union
 
@@ -15,6 +16,8 @@ from docling.datamodel.settings import settings
 from docling.models.base_model import BasePageModel
 from docling.utils.accelerator_utils import decide_device
 from docling.utils.layout_postprocessor import LayoutPostprocessor
+from docling.utils.lazy_model import LazyModel
+from docling.utils.model_registry import make_model_key, model_registry
 from docling.utils.profiling import TimeRecorder
 from docling.utils.visualization import draw_clusters
 
@@ -48,33 +51,58 @@ class LayoutModel(BasePageModel):
     def __init__(
         self, artifacts_path: Optional[Path], accelerator_options: AcceleratorOptions
     ):
+        self.artifacts_path = artifacts_path
+        self.accelerator_options = accelerator_options
+
+        # The predictor is shared with the other pipelines using the same weights
+        # and loaded when the first page is processed
+        self._layout_predictor: LazyModel[LayoutPredictor] = model_registry.acquire(
+            owner=self,
+            key=make_model_key(
+                LayoutModel,
+                artifacts_path=artifacts_path,
+                device=accelerator_options.device,
+                num_threads=accelerator_options.num_threads,
+            ),
+            name="layout",
+            loader=partial(self._load_predictor, artifacts_path, accelerator_options),
+        )
+
+    @classmethod
+    def _load_predictor(
+        cls, artifacts_path: Optional[Path], accelerator_options: AcceleratorOptions
+    ) -> LayoutPredictor:
         device = decide_device(accelerator_options.device)
 
         if artifacts_path is None:
-            artifacts_path = self.download_models() / self._model_path
+            artifacts_path = cls.download_models() / cls._model_path
         else:
             # will become the default in the future
-            if (artifacts_path / self._model_repo_folder).exists():
+            if (artifacts_path / cls._model_repo_folder).exists():
                 artifacts_path = (
-                    artifacts_path / self._model_repo_folder / self._model_path
+                    artifacts_path / cls._model_repo_folder / cls._model_path
                 )
-            elif (artifacts_path / self._model_path).exists():
+            elif (artifacts_path / cls._model_path).exists():
                 warnings.warn(
                     "The usage of artifacts_path containing directly "
-                    f"{self._model_path} is deprecated. Please point "
+                    f"{cls._model_path} is deprecated. Please point "
                     "the artifacts_path to the parent containing "
-                    f"the {self._model_repo_folder} folder.",
+                    f"the {cls._model_repo_folder} folder.",
                     DeprecationWarning,
                     stacklevel=3,
                 )
-                artifacts_path = artifacts_path / self._model_path
+                artifacts_path = artifacts_path / cls._model_path
 
-        self.layout_predictor = LayoutPredictor(
+        return LayoutPredictor(
             artifact_path=str(artifacts_path),
             device=device,
             num_threads=accelerator_options.num_threads,
         )
 
+    @property
+    def layout_predictor(self) -> LayoutPredictor:
+        return self._layout_predictor.get()
+
     @staticmethod
     def download_models(
         local_dir: Optional[Path] = None,
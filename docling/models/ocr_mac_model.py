@@ -1,6 +1,6 @@
 import logging
 import tempfile
-from typing import Iterable, Optional, Tuple
+from typing import Iterable, List, Optional, Tuple
 
 from docling_core.types.doc import BoundingBox, CoordOrigin
 
@@ -35,6 +35,58 @@ class OcrMacModel(BaseOcrModel):
 
             self.reader_RIL = ocrmac.OCR
 
+    def _ocr_rect(
+        self, page: Page, ocr_rect: BoundingBox, scale: float
+    ) -> List[OcrCell]:
+        assert page._backend is not None
+
+        high_res_image = page._backend.get_page_image(scale=scale, cropbox=ocr_rect)
+
+        with tempfile.NamedTemporaryFile(suffix=".png", mode="w") as image_file:
+            fname = image_file.name
+            high_res_image.save(fname)
+
+            boxes = self.reader_RIL(
+                fname,
+                recognition_level=self.options.recognition,
+                framework=self.options.framework,
+                language_preference=self.options.lang,
+            ).recognize()
+
+        im_width, im_height = high_res_image.size
+        cells = []
+        for ix, (text, confidence, box) in enumerate(boxes):
+            x = float(box[0])
+            y = float(box[1])
+            w = float(box[2])
+            h = float(box[3])
+
+            x1 = x * im_width
+            y2 = (1 - y) * im_height
+
+            x2 = x1 + w * im_width
+            y1 = y2 - h * im_height
+
+            left = x1 / scale + ocr_rect.l
+            top = y1 / scale + ocr_rect.t
+            right = x2 / scale + ocr_rect.l
+            bottom = y2 / scale + ocr_rect.t
+
+            cells.append(
+                OcrCell(
+                    id=ix,
+                    text=text,
+                    confidence=confidence,
+                    bbox=BoundingBox.from_tuple(
+                        coord=(left, top, right, bottom),
+                        origin=CoordOrigin.TOPLEFT,
+                    ),
+                )
+            )
+
+        # del high_res_image
+        return cells
+
     def __call__(
         self, conv_res: ConversionResult, page_batch: Iterable[Page]
     ) -> Iterable[Page]:
@@ -57,56 +109,7 @@ class OcrMacModel(BaseOcrModel):
                         # Skip zero area boxes
                         if ocr_rect.area() == 0:
                             continue
-                        high_res_image = page._backend.get_page_image(
-                            scale=self.scale, cropbox=ocr_rect
-                        )
-
-                        with tempfile.NamedTemporaryFile(
-                            suffix=".png", mode="w"
-                        ) as image_file:
-                            fname = image_file.name
-                            high_res_image.save(fname)
-
-                            boxes = self.reader_RIL(
-                                fname,
-                                recognition_level=self.options.recognition,
-                                framework=self.options.framework,
-                                language_preference=self.options.lang,
-                            ).recognize()
-
-                        im_width, im_height = high_res_image.size
-                        cells = []
-                        for ix, (text, confidence, box) in enumerate(boxes):
-                            x = float(box[0])
-                            y = float(box[1])
-                            w = float(box[2])
-                            h = float(box[3])
-
-                            x1 = x * im_width
-                            y2 = (1 - y) * im_height
-
-                            x2 = x1 + w * im_width
-                            y1 = y2 - h * im_height
-
-                            left = x1 / self.scale
-                            top = y1 / self.scale
-                            right = x2 / self.scale
-                            bottom = y2 / self.scale
-
-                            cells.append(
-                                OcrCell(
-                                    id=ix,
-                                    text=text,
-                                    confidence=confidence,
-                                    bbox=BoundingBox.from_tuple(
-                                        coord=(left, top, right, bottom),
-                                        origin=CoordOrigin.TOPLEFT,
-                                    ),
-                                )
-                            )
-
-                        # del high_res_image
-                        all_ocr_cells.extend(cells)
+                        all_ocr_cells.extend(self._ocr_rect(page, ocr_rect, self.scale))
 
                     # Post-process the cells
                     page.cells = self.post_process_cells(all_ocr_cells, page.cells)
@@ -0,0 +1,65 @@
+from typing import Iterable
+
+from pydantic import BaseModel
+
+from docling.datamodel.base_models import FigureElement, Page, Table
+from docling.datamodel.document import ConversionResult
+from docling.models.base_model import BasePageModel
+from docling.utils.profiling import TimeRecorder
+
+
+class PageElementCropOptions(BaseModel):
+    images_scale: float = 1.0
+    crop_pictures: bool = False
+    crop_tables: bool = False
+
+
+class PageElementCropModel(BasePageModel):
+    """Crops the images of the picture and table elements of each page.
+
+    The crops are stored on the page by cluster id, such that the page raster can
+    be released as soon as the page leaves the pipeline. The crop boxes are computed
+    like the ones of the document items built by the reading order, hence the
+    images are identical to the ones cropped from the full page at assembly.
+    """
+
+    def __init__(self, options: PageElementCropOptions):
+        self.options = options
+        self.enabled = self.options.crop_pictures or self.options.crop_tables
+
+    def __call__(
+        self, conv_res: ConversionResult, page_batch: Iterable[Page]
+    ) -> Iterable[Page]:
+        for page in page_batch:
+            if not self.enabled or page.assembled is None or page.size is None:
+                yield page
+                continue
+
+            with TimeRecorder(conv_res, "page_element_crop"):
+                scale = self.options.images_scale
+                page_image = None
+                for element in page.assembled.elements:
+                    if not (
+                        (
+                            isinstance(element, FigureElement)
+                            and self.options.crop_pictures
+                        )
+                        or (isinstance(element, Table) and self.options.crop_tables)
+                    ):
+                        continue
+
+                    if page_image is None:
+                        page_image = page.get_image(scale=scale)
+                        if page_image is None:
+                            break
+
+                    crop_bbox = (
+                        element.cluster.bbox.to_bottom_left_origin(page.size.height)
+                        .scaled(scale=scale)
+                        .to_top_left_origin(page_height=page.size.height * scale)
+                    )
+                    page._element_images[element.cluster.id] = page_image.crop(
+                        crop_bbox.as_tuple()
+                    )
+
+            yield page
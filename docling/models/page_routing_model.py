@@ -0,0 +1,89 @@
+import logging
+from typing import Iterable, List
+
+from docling.datamodel.base_models import Page
+from docling.datamodel.document import ConversionResult
+from docling.datamodel.pipeline_options import PageRoutingOptions
+from docling.models.base_model import BasePageModel
+from docling.utils.profiling import TimeRecorder
+
+_log = logging.getLogger(__name__)
+
+
+class PageRoutingModel(BasePageModel):
+    """Marks the pages which are converted by the VLM instead of the standard models.
+
+    Before the layout analysis (`use_layout=False`), the pages are routed on their
+    programmatic text cells and bitmap coverage. After it, the remaining pages are
+    routed on the confidence of their layout clusters.
+    """
+
+    def __init__(self, options: PageRoutingOptions, use_layout: bool):
+        self.options = options
+        self.use_layout = use_layout
+
+    def _get_bitmap_coverage(self, page: Page) -> float:
+        assert page._backend is not None
+        assert page.size is not None
+        page_area = page.size.width * page.size.height
+        if page_area <= 0:
+            return 0.0
+        # Overlapping bitmaps are counted multiple times, hence the cap
+        bitmap_area = sum(rect.area() for rect in page._backend.get_bitmap_rects())
+        return min(bitmap_area / page_area, 1.0)
+
+    def _is_hard_page(self, page: Page) -> bool:
+        if not self.use_layout:
+            return (
+                len(page.cells) <= self.options.max_text_cells
+                and self._get_bitmap_coverage(page) >= self.options.min_bitmap_coverage
+            )
+
+        if page.predictions.layout is None:
+            return False
+        clusters = page.predictions.layout.clusters
+        if len(clusters) == 0:
+            return False
+        confidence = sum(c.confidence for c in clusters) / len(clusters)
+        return confidence < self.options.min_layout_confidence
+
+    def __call__(
+        self, conv_res: ConversionResult, page_batch: Iterable[Page]
+    ) -> Iterable[Page]:
+        for page in page_batch:
+            assert page._backend is not None
+            if page._use_vlm or not page._backend.is_valid():
+                yield page
+                continue
+
+            with TimeRecorder(conv_res, "page_routing"):
+                page._use_vlm = self._is_hard_page(page)
+                if page._use_vlm:
+                    _log.debug(f"Page {page.page_no + 1} is converted with the VLM.")
+
+            yield page
+
+
+class RoutedPageModel(BasePageModel):
+    """Applies a page model only to the pages routed to the VLM, or only to the others.
+
+    The other pages are passed through, in their original order.
+    """
+
+    def __init__(self, model: BasePageModel, use_vlm: bool):
+        self.model = model
+        self.use_vlm = use_vlm
+
+    def __call__(
+        self, conv_res: ConversionResult, page_batch: Iterable[Page]
+    ) -> Iterable[Page]:
+        # The routing of the whole batch must be known before
+        pages: List[Page] = list(page_batch)
+        routed_pages = iter(
+            self.model(conv_res, [p for p in pages if p._use_vlm == self.use_vlm])
+        )
+        for page in pages:
+            if page._use_vlm == self.use_vlm:
+                yield next(routed_pages)
+            else:
+                yield page
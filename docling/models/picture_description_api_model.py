@@ -7,7 +7,10 @@ import requests
 from PIL import Image
 from pydantic import BaseModel, ConfigDict
 
-from docling.datamodel.pipeline_options import PictureDescriptionApiOptions
+from docling.datamodel.pipeline_options import (
+    PictureDedupOptions,
+    PictureDescriptionApiOptions,
+)
 from docling.exceptions import OperationNotAllowed
 from docling.models.picture_description_base_model import PictureDescriptionBaseModel
 
@@ -51,8 +54,9 @@ class PictureDescriptionApiModel(PictureDescriptionBaseModel):
         enabled: bool,
         enable_remote_services: bool,
         options: PictureDescriptionApiOptions,
+        dedup_options: Optional[PictureDedupOptions] = None,
     ):
-        super().__init__(enabled=enabled, options=options)
+        super().__init__(enabled=enabled, options=options, dedup_options=dedup_options)
         self.options: PictureDescriptionApiOptions
 
         if self.enabled:
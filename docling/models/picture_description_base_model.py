@@ -1,3 +1,4 @@
+import hashlib
 import logging
 from pathlib import Path
 from typing import Any, Iterable, List, Optional, Union
@@ -13,11 +14,15 @@ from docling_core.types.doc.document import (  # TODO: move import to docling_co
 )
 from PIL import Image
 
-from docling.datamodel.pipeline_options import PictureDescriptionBaseOptions
+from docling.datamodel.pipeline_options import (
+    PictureDedupOptions,
+    PictureDescriptionBaseOptions,
+)
 from docling.models.base_model import (
     BaseItemAndImageEnrichmentModel,
     ItemAndImageEnrichmentElement,
 )
+from docling.utils.picture_dedup import PictureResultCache
 
 
 class PictureDescriptionBaseModel(BaseItemAndImageEnrichmentModel):
@@ -27,11 +32,23 @@ class PictureDescriptionBaseModel(BaseItemAndImageEnrichmentModel):
         self,
         enabled: bool,
         options: PictureDescriptionBaseOptions,
+        dedup_options: Optional[PictureDedupOptions] = None,
     ):
         self.enabled = enabled
         self.options = options
         self.provenance = "not-implemented"
 
+        # Descriptions are reused for the same model and options only
+        self._result_cache: Optional[PictureResultCache] = None
+        if dedup_options is not None:
+            options_hash = hashlib.sha256(
+                options.model_dump_json().encode("utf-8")
+            ).hexdigest()
+            self._result_cache = PictureResultCache(
+                namespace=f"{type(self).__name__}:{options_hash}",
+                options=dedup_options,
+            )
+
     def is_processable(self, doc: DoclingDocument, element: NodeItem) -> bool:
         return self.enabled and isinstance(element, PictureItem)
 
@@ -50,12 +67,22 @@ class PictureDescriptionBaseModel(BaseItemAndImageEnrichmentModel):
 
         images: List[Image.Image] = []
         elements: List[PictureItem] = []
+        scopes: List[Optional[str]] = []
         for el in element_batch:
             assert isinstance(el.item, PictureItem)
             elements.append(el.item)
             images.append(el.image)
+            scopes.append(el.document_hash)
 
-        outputs = self._annotate_images(images)
+        outputs: Iterable[str]
+        if self._result_cache is None:
+            outputs = self._annotate_images(images)
+        else:
+            outputs = self._result_cache.map(
+                images,
+                lambda unique: list(self._annotate_images(unique)),
+                scopes=scopes,
+            )
 
         for item, output in zip(elements, outputs):
             item.annotations.append(
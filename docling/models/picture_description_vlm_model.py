@@ -5,10 +5,12 @@ from PIL import Image
 
 from docling.datamodel.pipeline_options import (
     AcceleratorOptions,
+    PictureDedupOptions,
     PictureDescriptionVlmOptions,
 )
 from docling.models.picture_description_base_model import PictureDescriptionBaseModel
 from docling.utils.accelerator_utils import decide_device
+from docling.utils.model_registry import make_model_key, model_registry
 
 
 class PictureDescriptionVlmModel(PictureDescriptionBaseModel):
@@ -19,8 +21,9 @@ class PictureDescriptionVlmModel(PictureDescriptionBaseModel):
         artifacts_path: Optional[Union[Path, str]],
         options: PictureDescriptionVlmOptions,
         accelerator_options: AcceleratorOptions,
+        dedup_options: Optional[PictureDedupOptions] = None,
     ):
-        super().__init__(enabled=enabled, options=options)
+        super().__init__(enabled=enabled, options=options, dedup_options=dedup_options)
         self.options: PictureDescriptionVlmOptions
 
         if self.enabled:
@@ -30,7 +33,7 @@ class PictureDescriptionVlmModel(PictureDescriptionBaseModel):
             else:
                 artifacts_path = Path(artifacts_path) / self.options.repo_cache_folder
 
-            self.device = decide_device(accelerator_options.device)
+            self.device = device = decide_device(accelerator_options.device)
 
             try:
                 import torch
@@ -40,18 +43,41 @@ class PictureDescriptionVlmModel(PictureDescriptionBaseModel):
                     "transformers >=4.46 is not installed. Please install Docling with the required extras `pip install docling[vlm]`."
                 )
 
-            # Initialize processor and model
-            self.processor = AutoProcessor.from_pretrained(artifacts_path)
-            self.model = AutoModelForVision2Seq.from_pretrained(
-                artifacts_path,
-                torch_dtype=torch.bfloat16,
-                _attn_implementation=(
-                    "flash_attention_2" if self.device.startswith("cuda") else "eager"
+            # Does not refer to self, the handle is shared through the registry
+            def _load_processor_and_model():
+                processor = AutoProcessor.from_pretrained(artifacts_path)
+                model = AutoModelForVision2Seq.from_pretrained(
+                    artifacts_path,
+                    torch_dtype=torch.bfloat16,
+                    _attn_implementation=(
+                        "flash_attention_2" if device.startswith("cuda") else "eager"
+                    ),
+                ).to(device)
+                return processor, model
+
+            # Processor and model are shared with the other pipelines using the
+            # same weights and loaded when the first picture is described
+            self._processor_and_model = model_registry.acquire(
+                owner=self,
+                key=make_model_key(
+                    PictureDescriptionVlmModel,
+                    artifacts_path=artifacts_path,
+                    device=device,
                 ),
-            ).to(self.device)
+                name="picture_description_vlm",
+                loader=_load_processor_and_model,
+            )
 
             self.provenance = f"{self.options.repo_id}"
 
+    @property
+    def processor(self):
+        return self._processor_and_model.get()[0]
+
+    @property
+    def model(self):
+        return self._processor_and_model.get()[1]
+
     @staticmethod
     def download_models(
         repo_id: str,
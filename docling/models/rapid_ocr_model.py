@@ -1,5 +1,6 @@
 import logging
-from typing import Iterable
+from functools import partial
+from typing import Iterable, List
 
 import numpy
 from docling_core.types.doc import BoundingBox, CoordOrigin
@@ -14,6 +15,8 @@ from docling.datamodel.pipeline_options import (
 from docling.datamodel.settings import settings
 from docling.models.base_ocr_model import BaseOcrModel
 from docling.utils.accelerator_utils import decide_device
+from docling.utils.lazy_model import LazyModel
+from docling.utils.model_registry import make_model_key, model_registry
 from docling.utils.profiling import TimeRecorder
 
 _log = logging.getLogger(__name__)
@@ -46,7 +49,7 @@ class RapidOcrModel(BaseOcrModel):
             use_dml = accelerator_options.device == AcceleratorDevice.AUTO
             intra_op_num_threads = accelerator_options.num_threads
 
-            self.reader = RapidOCR(
+            reader_params = dict(
                 text_score=self.options.text_score,
                 cls_use_cuda=use_cuda,
                 rec_use_cuda=use_cuda,
@@ -61,6 +64,56 @@ class RapidOcrModel(BaseOcrModel):
                 rec_model_path=self.options.rec_model_path,
                 rec_keys_path=self.options.rec_keys_path,
             )
+            # The reader is shared with the other pipelines using the same
+            # weights and loaded when the first region is recognized
+            self._reader: LazyModel[RapidOCR] = model_registry.acquire(
+                owner=self,
+                key=make_model_key(RapidOcrModel, **reader_params),
+                name="rapidocr",
+                loader=partial(RapidOCR, **reader_params),
+            )
+
+    @property
+    def reader(self):
+        return self._reader.get()
+
+    def _ocr_rect(
+        self, page: Page, ocr_rect: BoundingBox, scale: float
+    ) -> List[OcrCell]:
+        assert page._backend is not None
+
+        high_res_image = page._backend.get_page_image(scale=scale, cropbox=ocr_rect)
+        im = numpy.array(high_res_image)
+        result, _ = self.reader(
+            im,
+            use_det=self.options.use_det,
+            use_cls=self.options.use_cls,
+            use_rec=self.options.use_rec,
+        )
+
+        del high_res_image
+        del im
+
+        if result is None:
+            return []
+
+        return [
+            OcrCell(
+                id=ix,
+                text=line[1],
+                confidence=line[2],
+                bbox=BoundingBox.from_tuple(
+                    coord=(
+                        (line[0][0][0] / scale) + ocr_rect.l,
+                        (line[0][0][1] / scale) + ocr_rect.t,
+                        (line[0][2][0] / scale) + ocr_rect.l,
+                        (line[0][2][1] / scale) + ocr_rect.t,
+                    ),
+                    origin=CoordOrigin.TOPLEFT,
+                ),
+            )
+            for ix, line in enumerate(result)
+        ]
 
     def __call__(
         self, conv_res: ConversionResult, page_batch: Iterable[Page]
@@ -84,39 +137,7 @@ class RapidOcrModel(BaseOcrModel):
                         # Skip zero area boxes
                         if ocr_rect.area() == 0:
                             continue
-                        high_res_image = page._backend.get_page_image(
-                            scale=self.scale, cropbox=ocr_rect
-                        )
-                        im = numpy.array(high_res_image)
-                        result, _ = self.reader(
-                            im,
-                            use_det=self.options.use_det,
-                            use_cls=self.options.use_cls,
-                            use_rec=self.options.use_rec,
-                        )
-
-                        del high_res_image
-                        del im
-
-                        if result is not None:
-                            cells = [
-                                OcrCell(
-                                    id=ix,
-                                    text=line[1],
-                                    confidence=line[2],
-                                    bbox=BoundingBox.from_tuple(
-                                        coord=(
-                                            (line[0][0][0] / self.scale) + ocr_rect.l,
-                                            (line[0][0][1] / self.scale) + ocr_rect.t,
-                                            (line[0][2][0] / self.scale) + ocr_rect.l,
-                                            (line[0][2][1] / self.scale) + ocr_rect.t,
-                                        ),
-                                        origin=CoordOrigin.TOPLEFT,
-                                    ),
-                                )
-                                for ix, line in enumerate(result)
-                            ]
-                            all_ocr_cells.extend(cells)
+                        all_ocr_cells.extend(self._ocr_rect(page, ocr_rect, self.scale))
 
                     # Post-process the cells
                     page.cells = self.post_process_cells(all_ocr_cells, page.cells)
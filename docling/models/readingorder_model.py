@@ -1,7 +1,7 @@
 import copy
 import random
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 from docling_core.types.doc import (
     BoundingBox,
@@ -117,6 +117,7 @@ class ReadingOrderModel:
         el_to_captions_mapping: Dict[int, List[int]],
         el_to_footnotes_mapping: Dict[int, List[int]],
         el_merges_mapping: Dict[int, List[int]],
+        item_clusters: Optional[Dict[str, Tuple[int, int]]] = None,
     ) -> DoclingDocument:
 
         id_to_elem = {
@@ -222,6 +223,8 @@ class ReadingOrderModel:
                 tbl = out_doc.add_table(
                     data=tbl_data, prov=prov, label=element.cluster.label
                 )
+                if item_clusters is not None:
+                    item_clusters[tbl.self_ref] = (element.page_no, element.cluster.id)
 
                 if rel.cid in el_to_captions_mapping.keys():
                     for caption_cid in el_to_captions_mapping[rel.cid]:
@@ -251,6 +254,8 @@ class ReadingOrderModel:
                     bbox=element.cluster.bbox.to_bottom_left_origin(page_height),
                 )
                 pic = out_doc.add_picture(prov=prov)
+                if item_clusters is not None:
+                    item_clusters[pic.self_ref] = (element.page_no, element.cluster.id)
 
                 if rel.cid in el_to_captions_mapping.keys():
                     for caption_cid in el_to_captions_mapping[rel.cid]:
@@ -360,7 +365,16 @@ class ReadingOrderModel:
         new_item.orig += f" {merged_elem.text}"  # TODO: This is incomplete, we don't have the `orig` field of the merged element.
         new_item.prov.append(prov)
 
-    def __call__(self, conv_res: ConversionResult) -> DoclingDocument:
+    def __call__(
+        self,
+        conv_res: ConversionResult,
+        item_clusters: Optional[Dict[str, Tuple[int, int]]] = None,
+    ) -> DoclingDocument:
+        """Build the document from the assembled elements, in reading order.
+
+        When `item_clusters` is given, the page number and cluster id of the
+        elements of the tables and pictures are added to it, by item reference.
+        """
         with TimeRecorder(conv_res, "glm", scope=ProfilingScope.DOCUMENT):
             page_elements = self._assembled_to_readingorder_elements(conv_res)
 
@@ -384,6 +398,7 @@ class ReadingOrderModel:
                 el_to_captions_mapping,
                 el_to_footnotes_mapping,
                 el_merges_mapping,
+                item_clusters,
             )
 
         return docling_doc
@@ -1,5 +1,6 @@
 import copy
 import warnings
+from functools import partial
 from pathlib import Path
 from typing import Iterable, Optional, Union
 
@@ -19,6 +20,8 @@ from docling.datamodel.pipeline_options import (
 from docling.datamodel.settings import settings
 from docling.models.base_model import BasePageModel
 from docling.utils.accelerator_utils import decide_device
+from docling.utils.lazy_model import LazyModel
+from docling.utils.model_registry import make_model_key, model_registry
 from docling.utils.profiling import TimeRecorder
 
 
@@ -38,49 +41,79 @@ class TableStructureModel(BasePageModel):
         self.mode = self.options.mode
 
         self.enabled = enabled
+        self.artifacts_path = artifacts_path
+        self.accelerator_options = accelerator_options
+        self.scale = 2.0  # Scale up table input images to 144 dpi
+
         if self.enabled:
+            # The predictor is shared with the other pipelines using the same
+            # weights and loaded when the first table is processed
+            self._tf_predictor: LazyModel[TFPredictor] = model_registry.acquire(
+                owner=self,
+                key=make_model_key(
+                    TableStructureModel,
+                    artifacts_path=artifacts_path,
+                    device=accelerator_options.device,
+                    num_threads=accelerator_options.num_threads,
+                    mode=self.mode,
+                ),
+                name="table_structure",
+                loader=partial(
+                    self._load_predictor,
+                    artifacts_path,
+                    self.mode,
+                    accelerator_options,
+                ),
+            )
 
-            if artifacts_path is None:
-                artifacts_path = self.download_models() / self._model_path
-            else:
-                # will become the default in the future
-                if (artifacts_path / self._model_repo_folder).exists():
-                    artifacts_path = (
-                        artifacts_path / self._model_repo_folder / self._model_path
-                    )
-                elif (artifacts_path / self._model_path).exists():
-                    warnings.warn(
-                        "The usage of artifacts_path containing directly "
-                        f"{self._model_path} is deprecated. Please point "
-                        "the artifacts_path to the parent containing "
-                        f"the {self._model_repo_folder} folder.",
-                        DeprecationWarning,
-                        stacklevel=3,
-                    )
-                    artifacts_path = artifacts_path / self._model_path
+    @classmethod
+    def _load_predictor(
+        cls,
+        artifacts_path: Optional[Path],
+        mode: TableFormerMode,
+        accelerator_options: AcceleratorOptions,
+    ) -> TFPredictor:
+        if artifacts_path is None:
+            artifacts_path = cls.download_models() / cls._model_path
+        else:
+            # will become the default in the future
+            if (artifacts_path / cls._model_repo_folder).exists():
+                artifacts_path = (
+                    artifacts_path / cls._model_repo_folder / cls._model_path
+                )
+            elif (artifacts_path / cls._model_path).exists():
+                warnings.warn(
+                    "The usage of artifacts_path containing directly "
+                    f"{cls._model_path} is deprecated. Please point "
+                    "the artifacts_path to the parent containing "
+                    f"the {cls._model_repo_folder} folder.",
+                    DeprecationWarning,
+                    stacklevel=3,
+                )
+                artifacts_path = artifacts_path / cls._model_path
+
+        if mode == TableFormerMode.ACCURATE:
+            artifacts_path = artifacts_path / "accurate"
+        else:
+            artifacts_path = artifacts_path / "fast"
 
-            if self.mode == TableFormerMode.ACCURATE:
-                artifacts_path = artifacts_path / "accurate"
-            else:
-                artifacts_path = artifacts_path / "fast"
+        # Third Party
+        import docling_ibm_models.tableformer.common as c
 
-            # Third Party
-            import docling_ibm_models.tableformer.common as c
+        device = decide_device(accelerator_options.device)
 
-            device = decide_device(accelerator_options.device)
+        # Disable MPS here, until we know why it makes things slower.
+        if device == AcceleratorDevice.MPS.value:
+            device = AcceleratorDevice.CPU.value
 
-            # Disable MPS here, until we know why it makes things slower.
-            if device == AcceleratorDevice.MPS.value:
-                device = AcceleratorDevice.CPU.value
+        tm_config = c.read_config(f"{artifacts_path}/tm_config.json")
+        tm_config["model"]["save_dir"] = artifacts_path
 
-            self.tm_config = c.read_config(f"{artifacts_path}/tm_config.json")
-            self.tm_config["model"]["save_dir"] = artifacts_path
-            self.tm_model_type = self.tm_config["model"]["type"]
+        return TFPredictor(tm_config, device, accelerator_options.num_threads)
 
-            self.tf_predictor = TFPredictor(
-                self.tm_config, device, accelerator_options.num_threads
-            )
-            self.scale = 2.0  # Scale up table input images to 144 dpi
+    @property
+    def tf_predictor(self) -> TFPredictor:
+        return self._tf_predictor.get()
 
     @staticmethod
     def download_models(
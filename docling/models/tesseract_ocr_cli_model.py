@@ -177,6 +177,58 @@ class TesseractOcrCliModel(BaseOcrModel):
 
         self._script_prefix = script_prefix
 
+    def _ocr_rect(
+        self, page: Page, ocr_rect: BoundingBox, scale: float
+    ) -> List[OcrCell]:
+        assert page._backend is not None
+
+        high_res_image = page._backend.get_page_image(scale=scale, cropbox=ocr_rect)
+        try:
+            with tempfile.NamedTemporaryFile(
+                suffix=".png", mode="w+b", delete=False
+            ) as image_file:
+                fname = image_file.name
+                high_res_image.save(image_file)
+
+            df = self._run_tesseract(fname)
+        finally:
+            if os.path.exists(fname):
+                os.remove(fname)
+
+        # _log.info(df)
+
+        # Print relevant columns (bounding box and text)
+        cells = []
+        for ix, row in df.iterrows():
+            text = row["text"]
+            conf = row["conf"]
+
+            l = float(row["left"])
+            b = float(row["top"])
+            w = float(row["width"])
+            h = float(row["height"])
+
+            t = b + h
+            r = l + w
+
+            cell = OcrCell(
+                id=ix,
+                text=text,
+                confidence=conf / 100.0,
+                bbox=BoundingBox.from_tuple(
+                    coord=(
+                        (l / scale) + ocr_rect.l,
+                        (b / scale) + ocr_rect.t,
+                        (r / scale) + ocr_rect.l,
+                        (t / scale) + ocr_rect.t,
+                    ),
+                    origin=CoordOrigin.TOPLEFT,
+                ),
+            )
+            cells.append(cell)
+
+        return cells
+
     def __call__(
         self, conv_res: ConversionResult, page_batch: Iterable[Page]
     ) -> Iterable[Page]:
@@ -198,51 +250,7 @@ class TesseractOcrCliModel(BaseOcrModel):
                         # Skip zero area boxes
                         if ocr_rect.area() == 0:
                             continue
-                        high_res_image = page._backend.get_page_image(
-                            scale=self.scale, cropbox=ocr_rect
-                        )
-                        try:
-                            with tempfile.NamedTemporaryFile(
-                                suffix=".png", mode="w+b", delete=False
-                            ) as image_file:
-                                fname = image_file.name
-                                high_res_image.save(image_file)
-
-                            df = self._run_tesseract(fname)
-                        finally:
-                            if os.path.exists(fname):
-                                os.remove(fname)
-
-                        # _log.info(df)
-
-                        # Print relevant columns (bounding box and text)
-                        for ix, row in df.iterrows():
-                            text = row["text"]
-                            conf = row["conf"]
-
-                            l = float(row["left"])
-                            b = float(row["top"])
-                            w = float(row["width"])
-                            h = float(row["height"])
-
-                            t = b + h
-                            r = l + w
-
-                            cell = OcrCell(
-                                id=ix,
-                                text=text,
-                                confidence=conf / 100.0,
-                                bbox=BoundingBox.from_tuple(
-                                    coord=(
-                                        (l / self.scale) + ocr_rect.l,
-                                        (b / self.scale) + ocr_rect.t,
-                                        (r / self.scale) + ocr_rect.l,
-                                        (t / self.scale) + ocr_rect.t,
-                                    ),
-                                    origin=CoordOrigin.TOPLEFT,
-                                ),
-                            )
-                            all_ocr_cells.append(cell)
+                        all_ocr_cells.extend(self._ocr_rect(page, ocr_rect, self.scale))
 
                     # Post-process the cells
                     page.cells = self.post_process_cells(all_ocr_cells, page.cells)
@@ -1,5 +1,5 @@
 import logging
-from typing import Iterable
+from typing import Iterable, List
 
 from docling_core.types.doc import BoundingBox, CoordOrigin
 
@@ -90,6 +90,79 @@ class TesseractOcrModel(BaseOcrModel):
         for script in self.script_readers:
             self.script_readers[script].End()
 
+    def _ocr_rect(
+        self, page: Page, ocr_rect: BoundingBox, scale: float
+    ) -> List[OcrCell]:
+        assert page._backend is not None
+        assert self.reader is not None
+        assert self._tesserocr_languages is not None
+
+        high_res_image = page._backend.get_page_image(scale=scale, cropbox=ocr_rect)
+
+        local_reader = self.reader
+        if "auto" in self.options.lang:
+            assert self.osd_reader is not None
+
+            self.osd_reader.SetImage(high_res_image)
+            osd = self.osd_reader.DetectOrientationScript()
+
+            # No text, probably
+            if osd is None:
+                return []
+
+            script = osd["script_name"]
+            script = map_tesseract_script(script)
+            lang = f"{self.script_prefix}{script}"
+
+            # Check if the detected languge is present in the system
+            if lang not in self._tesserocr_languages:
+                msg = f"Tesseract detected the script '{script}' and language '{lang}'."
+                msg += " However this language is not installed in your system and will be ignored."
+                _log.warning(msg)
+            else:
+                if script not in self.script_readers:
+                    import tesserocr
+
+                    self.script_readers[script] = tesserocr.PyTessBaseAPI(
+                        path=self.reader.GetDatapath(),
+                        lang=lang,
+                        psm=tesserocr.PSM.AUTO,
+                        init=True,
+                        oem=tesserocr.OEM.DEFAULT,
+                    )
+                local_reader = self.script_readers[script]
+
+        local_reader.SetImage(high_res_image)
+        boxes = local_reader.GetComponentImages(self.reader_RIL.TEXTLINE, True)
+
+        cells = []
+        for ix, (im, box, _, _) in enumerate(boxes):
+            # Set the area of interest. Tesseract uses Bottom-Left for the origin
+            local_reader.SetRectangle(box["x"], box["y"], box["w"], box["h"])
+
+            # Extract text within the bounding box
+            text = local_reader.GetUTF8Text().strip()
+            confidence = local_reader.MeanTextConf()
+            left = box["x"] / scale + ocr_rect.l
+            bottom = box["y"] / scale + ocr_rect.t
+            right = (box["x"] + box["w"]) / scale + ocr_rect.l
+            top = (box["y"] + box["h"]) / scale + ocr_rect.t
+
+            cells.append(
+                OcrCell(
+                    id=ix,
+                    text=text,
+                    confidence=confidence / 100.0,
+                    bbox=BoundingBox.from_tuple(
+                        coord=(left, top, right, bottom),
+                        origin=CoordOrigin.TOPLEFT,
+                    ),
+                )
+            )
+
+        # del high_res_image
+        return cells
+
     def __call__(
         self, conv_res: ConversionResult, page_batch: Iterable[Page]
     ) -> Iterable[Page]:
@@ -103,9 +176,6 @@ class TesseractOcrModel(BaseOcrModel):
                 yield page
             else:
                 with TimeRecorder(conv_res, "ocr"):
-                    assert self.reader is not None
-                    assert self._tesserocr_languages is not None
-
                     ocr_rects = self.get_ocr_rects(page)
 
                     all_ocr_cells = []
@@ -113,79 +183,7 @@ class TesseractOcrModel(BaseOcrModel):
                         # Skip zero area boxes
                         if ocr_rect.area() == 0:
                             continue
-                        high_res_image = page._backend.get_page_image(
-                            scale=self.scale, cropbox=ocr_rect
-                        )
-
-                        local_reader = self.reader
-                        if "auto" in self.options.lang:
-                            assert self.osd_reader is not None
-
-                            self.osd_reader.SetImage(high_res_image)
-                            osd = self.osd_reader.DetectOrientationScript()
-
-                            # No text, probably
-                            if osd is None:
-                                continue
-
-                            script = osd["script_name"]
-                            script = map_tesseract_script(script)
-                            lang = f"{self.script_prefix}{script}"
-
-                            # Check if the detected languge is present in the system
-                            if lang not in self._tesserocr_languages:
-                                msg = f"Tesseract detected the script '{script}' and language '{lang}'."
-                                msg += " However this language is not installed in your system and will be ignored."
-                                _log.warning(msg)
-                            else:
-                                if script not in self.script_readers:
-                                    import tesserocr
-
-                                    self.script_readers[script] = (
-                                        tesserocr.PyTessBaseAPI(
-                                            path=self.reader.GetDatapath(),
-                                            lang=lang,
-                                            psm=tesserocr.PSM.AUTO,
-                                            init=True,
-                                            oem=tesserocr.OEM.DEFAULT,
-                                        )
-                                    )
-                                local_reader = self.script_readers[script]
-
-                        local_reader.SetImage(high_res_image)
-                        boxes = local_reader.GetComponentImages(
-                            self.reader_RIL.TEXTLINE, True
-                        )
-
-                        cells = []
-                        for ix, (im, box, _, _) in enumerate(boxes):
-                            # Set the area of interest. Tesseract uses Bottom-Left for the origin
-                            local_reader.SetRectangle(
-                                box["x"], box["y"], box["w"], box["h"]
-                            )
-
-                            # Extract text within the bounding box
-                            text = local_reader.GetUTF8Text().strip()
-                            confidence = local_reader.MeanTextConf()
-                            left = box["x"] / self.scale
-                            bottom = box["y"] / self.scale
-                            right = (box["x"] + box["w"]) / self.scale
-                            top = (box["y"] + box["h"]) / self.scale
-
-                            cells.append(
-                                OcrCell(
-                                    id=ix,
-                                    text=text,
-                                    confidence=confidence,
-                                    bbox=BoundingBox.from_tuple(
-                                        coord=(left, top, right, bottom),
-                                        origin=CoordOrigin.TOPLEFT,
-                                    ),
-                                )
-                            )
-
-                        # del high_res_image
-                        all_ocr_cells.extend(cells)
+                        all_ocr_cells.extend(self._ocr_rect(page, ocr_rect, self.scale))
 
                     # Post-process the cells
                     page.cells = self.post_process_cells(all_ocr_cells, page.cells)
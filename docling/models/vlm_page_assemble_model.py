@@ -0,0 +1,118 @@
+import logging
+from typing import Iterable, List, Optional
+
+from docling_core.types.doc import (
+    BoundingBox,
+    DocItemLabel,
+    PictureItem,
+    TableItem,
+    TextItem,
+)
+from pydantic import BaseModel
+
+from docling.datamodel.base_models import (
+    AssembledUnit,
+    Cluster,
+    FigureElement,
+    Page,
+    PageElement,
+    Table,
+    TextElement,
+)
+from docling.datamodel.document import ConversionResult
+from docling.models.base_model import BasePageModel
+from docling.models.layout_model import LayoutModel
+from docling.utils.doctags import doctags_to_document
+from docling.utils.profiling import TimeRecorder
+
+_log = logging.getLogger(__name__)
+
+
+class VlmPageAssembleOptions(BaseModel):
+    force_backend_text: bool = False
+
+
+class VlmPageAssembleModel(BasePageModel):
+    """Assembles the page elements from the DocTags predicted by the VLM.
+
+    The elements are the same as the ones assembled from the layout and table
+    structure predictions, such that the reading order model merges the pages
+    converted by the VLM with the other pages of the document.
+    """
+
+    def __init__(self, options: VlmPageAssembleOptions):
+        self.options = options
+
+    def _assemble_page(self, page: Page) -> AssembledUnit:
+        page_doc = doctags_to_document(
+            [page], force_backend_text=self.options.force_backend_text
+        )
+
+        elements: List[PageElement] = []
+        headers: List[PageElement] = []
+        body: List[PageElement] = []
+        picture_bbox: Optional[BoundingBox] = None
+        for item, _ in page_doc.iterate_items():
+            if len(item.prov) > 0:
+                bbox = item.prov[0].bbox
+            elif item.label == DocItemLabel.CAPTION and picture_bbox is not None:
+                # The captions of the pictures are predicted without location
+                bbox = picture_bbox
+            else:
+                _log.debug(f"Skipping {item.label} without location.")
+                continue
+
+            cluster = Cluster(id=len(elements), label=item.label, bbox=bbox)
+            element: PageElement
+            if isinstance(item, TableItem):
+                element = Table(
+                    label=item.label,
+                    id=cluster.id,
+                    page_no=page.page_no,
+                    cluster=cluster,
+                    text="",
+                    otsl_seq=[],
+                    num_rows=item.data.num_rows,
+                    num_cols=item.data.num_cols,
+                    table_cells=item.data.table_cells,
+                )
+            elif isinstance(item, PictureItem):
+                picture_bbox = bbox
+                element = FigureElement(
+                    label=item.label,
+                    id=cluster.id,
+                    page_no=page.page_no,
+                    cluster=cluster,
+                    text="",
+                )
+            elif isinstance(item, TextItem):
+                element = TextElement(
+                    label=item.label,
+                    id=cluster.id,
+                    page_no=page.page_no,
+                    cluster=cluster,
+                    text=item.text,
+                )
+            else:
+                continue
+
+            elements.append(element)
+            if item.label in LayoutModel.PAGE_HEADER_LABELS:
+                headers.append(element)
+            else:
+                body.append(element)
+
+        return AssembledUnit(elements=elements, headers=headers, body=body)
+
+    def __call__(
+        self, conv_res: ConversionResult, page_batch: Iterable[Page]
+    ) -> Iterable[Page]:
+        for page in page_batch:
+            if page.predictions.vlm_response is None or page.size is None:
+                yield page
+                continue
+
+            with TimeRecorder(conv_res, "vlm_page_assemble"):
+                page.assembled = self._assemble_page(page)
+
+            yield page
@@ -3,9 +3,10 @@ import logging
 import time
 import traceback
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Iterable, List
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
 
-from docling_core.types.doc import DoclingDocument, NodeItem
+from docling_core.types.doc import DocItem, DoclingDocument, NodeItem
 
 from docling.backend.abstract_backend import AbstractDocumentBackend
 from docling.backend.pdf_backend import PdfDocumentBackend
@@ -13,12 +14,19 @@ from docling.datamodel.base_models import (
     ConversionStatus,
     DoclingComponentType,
     ErrorItem,
+    ItemAndImageEnrichmentElement,
     Page,
 )
 from docling.datamodel.document import ConversionResult, InputDocument
 from docling.datamodel.pipeline_options import PipelineOptions
 from docling.datamodel.settings import settings
-from docling.models.base_model import GenericEnrichmentModel
+from docling.models.base_model import (
+    BaseItemAndImageEnrichmentModel,
+    GenericEnrichmentModel,
+)
+from docling.utils.enrichment_batcher import EnrichmentBatcher
+from docling.utils.lazy_model import record_model_loads, unload_idle_models
+from docling.utils.page_store import PageStore
 from docling.utils.profiling import ProfilingScope, TimeRecorder
 from docling.utils.utils import chunkify
 
@@ -32,7 +40,12 @@ class BasePipeline(ABC):
         self.build_pipe: List[Callable] = []
         self.enrichment_pipe: List[GenericEnrichmentModel[Any]] = []
 
-    def execute(self, in_doc: InputDocument, raises_on_error: bool) -> ConversionResult:
+    def execute(
+        self,
+        in_doc: InputDocument,
+        raises_on_error: bool,
+        enrichment_batcher: Optional[EnrichmentBatcher] = None,
+    ) -> ConversionResult:
         conv_res = ConversionResult(input=in_doc)
 
         _log.info(f"Processing document {in_doc.file.name}")
@@ -40,19 +53,28 @@ class BasePipeline(ABC):
             with TimeRecorder(
                 conv_res, "pipeline_total", scope=ProfilingScope.DOCUMENT
             ):
-                # These steps are building and assembling the structure of the
-                # output DoclingDocument.
-                conv_res = self._build_document(conv_res)
-                conv_res = self._assemble_document(conv_res)
-                # From this stage, all operations should rely only on conv_res.output
-                conv_res = self._enrich_document(conv_res)
-                conv_res.status = self._determine_status(conv_res)
+                with record_model_loads(conv_res):
+                    # These steps are building and assembling the structure of the
+                    # output DoclingDocument.
+                    conv_res = self._build_document(conv_res)
+                    conv_res = self._assemble_document(conv_res)
+                    # From this stage, all operations should rely only on conv_res.output
+                    conv_res = self._enrich_document(conv_res, enrichment_batcher)
+                    conv_res.status = self._determine_status(conv_res)
         except Exception as e:
             conv_res.status = ConversionStatus.FAILURE
             if raises_on_error:
                 raise e
         finally:
             self._unload(conv_res)
+            if (
+                settings.perf.model_idle_timeout is not None
+                or settings.perf.model_max_rss is not None
+            ):
+                unload_idle_models(
+                    idle_timeout=settings.perf.model_idle_timeout,
+                    max_rss=settings.perf.model_max_rss,
+                )
 
         return conv_res
 
@@ -63,28 +85,78 @@ class BasePipeline(ABC):
     def _assemble_document(self, conv_res: ConversionResult) -> ConversionResult:
         return conv_res
 
-    def _enrich_document(self, conv_res: ConversionResult) -> ConversionResult:
-
-        def _prepare_elements(
-            conv_res: ConversionResult, model: GenericEnrichmentModel[Any]
-        ) -> Iterable[NodeItem]:
-            for doc_element, _level in conv_res.document.iterate_items():
-                prepared_element = model.prepare_element(
-                    conv_res=conv_res, element=doc_element
-                )
-                if prepared_element is not None:
-                    yield prepared_element
+    def _enrich_document(
+        self,
+        conv_res: ConversionResult,
+        enrichment_batcher: Optional[EnrichmentBatcher] = None,
+    ) -> ConversionResult:
+        # The document is traversed once, each element being prepared for all the
+        # models interested in it. The models process their batches in order, and
+        # independent models run concurrently when enabled in the settings.
+        # With an enrichment batcher, the self-contained elements (item and image)
+        # are instead batched together with the ones of other documents.
+        concurrent = settings.perf.enrichment_concurrency > 1
+        executors: Dict[int, ThreadPoolExecutor] = {}
+        pending: Dict[int, Future] = {}
+        batches: Dict[int, List[Any]] = {
+            ix: [] for ix in range(len(self.enrichment_pipe))
+        }
+        page_images = _EnrichmentPageImages(conv_res)
+
+        def _run_batch(model: GenericEnrichmentModel[Any], element_batch: List[Any]):
+            for element in model(
+                doc=conv_res.document, element_batch=element_batch
+            ):  # Must exhaust!
+                pass
+
+        def _submit(ix: int):
+            model = self.enrichment_pipe[ix]
+            element_batch, batches[ix] = batches[ix], []
+            if not concurrent:
+                _run_batch(model, element_batch)
+                return
+            # One batch in flight per model, which bounds the prepared elements
+            # held in memory
+            if ix in pending:
+                pending.pop(ix).result()
+            if ix not in executors:
+                executors[ix] = ThreadPoolExecutor(max_workers=1)
+            pending[ix] = executors[ix].submit(_run_batch, model, element_batch)
 
         with TimeRecorder(conv_res, "doc_enrich", scope=ProfilingScope.DOCUMENT):
-            for model in self.enrichment_pipe:
-                for element_batch in chunkify(
-                    _prepare_elements(conv_res, model),
-                    model.elements_batch_size,
-                ):
-                    for element in model(
-                        doc=conv_res.document, element_batch=element_batch
-                    ):  # Must exhaust!
-                        pass
+            try:
+                for doc_element, _level in conv_res.document.iterate_items():
+                    for ix, model in enumerate(self.enrichment_pipe):
+                        if isinstance(
+                            model, BaseItemAndImageEnrichmentModel
+                        ) and model.is_processable(
+                            doc=conv_res.document, element=doc_element
+                        ):
+                            page_images.prepare(doc_element, model.images_scale)
+
+                        prepared_element = model.prepare_element(
+                            conv_res=conv_res, element=doc_element
+                        )
+                        if prepared_element is None:
+                            continue
+                        if enrichment_batcher is not None and isinstance(
+                            prepared_element, ItemAndImageEnrichmentElement
+                        ):
+                            enrichment_batcher.add(model, conv_res, prepared_element)
+                            continue
+                        batches[ix].append(prepared_element)
+                        if len(batches[ix]) >= model.elements_batch_size:
+                            _submit(ix)
+
+                for ix in range(len(self.enrichment_pipe)):
+                    if len(batches[ix]) > 0:
+                        _submit(ix)
+                for future in pending.values():
+                    future.result()
+            finally:
+                for executor in executors.values():
+                    executor.shutdown(wait=True)
+                page_images.clear()
 
         return conv_res
 
@@ -117,6 +189,7 @@ class PaginatedPipeline(BasePipeline):  # TODO this is a bad name.
     def __init__(self, pipeline_options: PipelineOptions):
         super().__init__(pipeline_options)
         self.keep_backend = False
+        self.spill_pages = False
 
     def _apply_on_pages(
         self, conv_res: ConversionResult, page_batch: Iterable[Page]
@@ -145,6 +218,8 @@ class PaginatedPipeline(BasePipeline):  # TODO this is a bad name.
                 if (start_page - 1) <= i <= (end_page - 1):
                     conv_res.pages.append(Page(page_no=i))
 
+            page_store = PageStore() if self.spill_pages else None
+
             try:
                 # Iterate batches of pages (page_batch_size) in the doc
                 for page_batch in chunkify(
@@ -170,6 +245,11 @@ class PaginatedPipeline(BasePipeline):  # TODO this is a bad name.
                         if not self.keep_backend and p._backend is not None:
                             p._backend.unload()
 
+                        # Move the page state out of memory
+                        if page_store is not None:
+                            with TimeRecorder(conv_res, "page_spill"):
+                                page_store.spill(p)
+
                     end_batch_time = time.monotonic()
                     total_elapsed_time += end_batch_time - start_batch_time
                     if (
@@ -228,3 +308,42 @@ class PaginatedPipeline(BasePipeline):  # TODO this is a bad name.
     @abstractmethod
     def initialize_page(self, conv_res: ConversionResult, page: Page) -> Page:
         pass
+
+
+class _EnrichmentPageImages:
+    """Page images shared by the enrichment models cropping elements.
+
+    The image of the page of the current element is rendered once per scale and
+    put in the page image cache, from which `Page.get_image` crops the elements of
+    all models using that scale. The images added for a page are dropped when the
+    traversal moves to another page.
+    """
+
+    def __init__(self, conv_res: ConversionResult):
+        self.conv_res = conv_res
+        self._page_ix: Optional[int] = None
+        self._scales: Set[float] = set()
+
+    def prepare(self, element: NodeItem, scale: float):
+        if not isinstance(element, DocItem) or len(element.prov) == 0:
+            return
+        page_ix = element.prov[0].page_no - 1
+        if not (0 <= page_ix < len(self.conv_res.pages)):
+            return
+
+        if page_ix != self._page_ix:
+            self.clear()
+            self._page_ix = page_ix
+
+        page = self.conv_res.pages[page_ix]
+        if scale not in page._image_cache and page._backend is not None:
+            page.get_image(scale=scale)
+            self._scales.add(scale)
+
+    def clear(self):
+        if self._page_ix is not None:
+            page = self.conv_res.pages[self._page_ix]
+            for scale in self._scales:
+                page._image_cache.pop(scale, None)
+        self._page_ix = None
+        self._scales = set()
@@ -0,0 +1,92 @@
+import logging
+import warnings
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from docling.datamodel.pipeline_options import HybridPdfPipelineOptions, ResponseFormat
+from docling.datamodel.settings import settings
+from docling.models.hf_vlm_model import HuggingFaceVlmModel
+from docling.models.layout_model import LayoutModel
+from docling.models.page_element_crop_model import PageElementCropModel
+from docling.models.page_preprocessing_model import PagePreprocessingModel
+from docling.models.page_routing_model import PageRoutingModel, RoutedPageModel
+from docling.models.vlm_page_assemble_model import (
+    VlmPageAssembleModel,
+    VlmPageAssembleOptions,
+)
+from docling.pipeline.standard_pdf_pipeline import StandardPdfPipeline
+
+_log = logging.getLogger(__name__)
+
+
+class HybridPdfPipeline(StandardPdfPipeline):
+    """PDF pipeline converting only the hard pages with a VLM.
+
+    Each page is routed after the pre-processing, on its text cells and bitmaps,
+    and after the layout analysis, on the layout confidence. The pages routed to
+    the VLM skip the remaining standard models, and the elements of all pages are
+    merged by the reading order model into one document.
+    """
+
+    def __init__(self, pipeline_options: HybridPdfPipelineOptions):
+        super().__init__(pipeline_options)
+        self.pipeline_options: HybridPdfPipelineOptions
+
+        warnings.warn(
+            "The HybridPdfPipeline is currently experimental and may change in upcoming versions without notice.",
+            category=UserWarning,
+            stacklevel=2,
+        )
+
+        if pipeline_options.vlm_options.response_format != ResponseFormat.DOCTAGS:
+            raise RuntimeError(
+                f"The hybrid pipeline requires a VLM predicting DocTags, not {pipeline_options.vlm_options.response_format}."
+            )
+
+        artifacts_path: Optional[Path] = None
+        if pipeline_options.artifacts_path is not None:
+            artifacts_path = Path(pipeline_options.artifacts_path).expanduser()
+        elif settings.artifacts_path is not None:
+            artifacts_path = Path(settings.artifacts_path).expanduser()
+
+        # The VLM is only loaded when the first page is routed to it
+        vlm_model = HuggingFaceVlmModel(
+            enabled=True,
+            artifacts_path=artifacts_path,
+            accelerator_options=pipeline_options.accelerator_options,
+            vlm_options=pipeline_options.vlm_options,
+        )
+        vlm_page_assemble_model = VlmPageAssembleModel(
+            options=VlmPageAssembleOptions(
+                force_backend_text=pipeline_options.force_backend_text
+            )
+        )
+
+        routing_options = pipeline_options.page_routing_options
+        build_pipe: List[Callable] = []
+        for model in self.build_pipe:
+            if isinstance(model, PagePreprocessingModel):
+                build_pipe.append(model)
+                build_pipe.append(
+                    PageRoutingModel(options=routing_options, use_layout=False)
+                )
+            elif isinstance(model, LayoutModel):
+                build_pipe.append(RoutedPageModel(model, use_vlm=False))
+                build_pipe.append(
+                    PageRoutingModel(options=routing_options, use_layout=True)
+                )
+            elif isinstance(model, PageElementCropModel):
+                # The VLM pages are assembled before the images of their
+                # elements are cropped, like the other pages
+                build_pipe.append(RoutedPageModel(vlm_model, use_vlm=True))
+                build_pipe.append(
+                    RoutedPageModel(vlm_page_assemble_model, use_vlm=True)
+                )
+                build_pipe.append(model)
+            else:
+                build_pipe.append(RoutedPageModel(model, use_vlm=False))
+        self.build_pipe = build_pipe
+
+    @classmethod
+    def get_default_options(cls) -> HybridPdfPipelineOptions:
+        return HybridPdfPipelineOptions()
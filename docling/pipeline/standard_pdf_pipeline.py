@@ -2,17 +2,20 @@ import logging
 import sys
 import warnings
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
-from docling_core.types.doc import DocItem, ImageRef, PictureItem, TableItem
+from docling_core.types.doc import DocItem, PictureItem, TableItem
+from PIL import Image
 
 from docling.backend.abstract_backend import AbstractDocumentBackend
 from docling.backend.pdf_backend import PdfDocumentBackend
 from docling.datamodel.base_models import AssembledUnit, Page
 from docling.datamodel.document import ConversionResult
 from docling.datamodel.pipeline_options import (
+    CascadeOcrOptions,
     EasyOcrOptions,
     OcrMacOptions,
+    OcrOptions,
     PdfPipelineOptions,
     PictureDescriptionApiOptions,
     PictureDescriptionVlmOptions,
@@ -22,6 +25,7 @@ from docling.datamodel.pipeline_options import (
 )
 from docling.datamodel.settings import settings
 from docling.models.base_ocr_model import BaseOcrModel
+from docling.models.cascade_ocr_model import CascadeOcrModel
 from docling.models.code_formula_model import CodeFormulaModel, CodeFormulaModelOptions
 from docling.models.document_picture_classifier import (
     DocumentPictureClassifier,
@@ -31,6 +35,10 @@ from docling.models.easyocr_model import EasyOcrModel
 from docling.models.layout_model import LayoutModel
 from docling.models.ocr_mac_model import OcrMacModel
 from docling.models.page_assemble_model import PageAssembleModel, PageAssembleOptions
+from docling.models.page_element_crop_model import (
+    PageElementCropModel,
+    PageElementCropOptions,
+)
 from docling.models.page_preprocessing_model import (
     PagePreprocessingModel,
     PagePreprocessingOptions,
@@ -44,7 +52,9 @@ from docling.models.table_structure_model import TableStructureModel
 from docling.models.tesseract_ocr_cli_model import TesseractOcrCliModel
 from docling.models.tesseract_ocr_model import TesseractOcrModel
 from docling.pipeline.base_pipeline import PaginatedPipeline
+from docling.utils.image_sink import ImageSink, create_image_sink
 from docling.utils.model_downloader import download_models
+from docling.utils.page_store import restored_page
 from docling.utils.profiling import ProfilingScope, TimeRecorder
 
 _log = logging.getLogger(__name__)
@@ -70,11 +80,10 @@ class StandardPdfPipeline(PaginatedPipeline):
                 "When defined, it must point to a folder containing all models required by the pipeline."
             )
 
-        self.keep_images = (
-            self.pipeline_options.generate_page_images
-            or self.pipeline_options.generate_picture_images
-            or self.pipeline_options.generate_table_images
-        )
+        # The picture and table images are cropped in the page pipeline, only the
+        # page images require to keep the page rasters until the assembly
+        self.keep_images = self.pipeline_options.generate_page_images
+        self.spill_pages = self.pipeline_options.low_memory_mode
 
         self.glm_model = ReadingOrderModel(options=ReadingOrderOptions())
 
@@ -106,6 +115,14 @@ class StandardPdfPipeline(PaginatedPipeline):
             ),
             # Page assemble
             PageAssembleModel(options=PageAssembleOptions()),
+            # Picture and table images
+            PageElementCropModel(
+                options=PageElementCropOptions(
+                    images_scale=pipeline_options.images_scale,
+                    crop_pictures=pipeline_options.generate_picture_images,
+                    crop_tables=pipeline_options.generate_table_images,
+                )
+            ),
         ]
 
         # Picture description model
@@ -136,6 +153,7 @@ class StandardPdfPipeline(PaginatedPipeline):
                 artifacts_path=artifacts_path,
                 options=DocumentPictureClassifierOptions(),
                 accelerator_options=pipeline_options.accelerator_options,
+                dedup_options=pipeline_options.picture_dedup_options,
             ),
             # Document Picture description
             picture_description_model,
@@ -166,37 +184,73 @@ class StandardPdfPipeline(PaginatedPipeline):
     def get_ocr_model(
         self, artifacts_path: Optional[Path] = None
     ) -> Optional[BaseOcrModel]:
-        if isinstance(self.pipeline_options.ocr_options, EasyOcrOptions):
+        ocr_options = self.pipeline_options.ocr_options
+        if isinstance(ocr_options, CascadeOcrOptions):
+            fast_options = ocr_options.fast
+            accurate_options = ocr_options.accurate
+            if ocr_options.lang:
+                fast_options = fast_options.model_copy(
+                    update={"lang": ocr_options.lang}
+                )
+                accurate_options = accurate_options.model_copy(
+                    update={"lang": ocr_options.lang}
+                )
+
+            fast_model = self._create_ocr_model(
+                fast_options, artifacts_path=artifacts_path
+            )
+            # Reuse the same engine when both tiers only differ by the scale
+            accurate_model = (
+                fast_model
+                if accurate_options == fast_options
+                else self._create_ocr_model(
+                    accurate_options, artifacts_path=artifacts_path
+                )
+            )
+            if fast_model is None or accurate_model is None:
+                return None
+            return CascadeOcrModel(
+                enabled=self.pipeline_options.do_ocr,
+                options=ocr_options,
+                fast_model=fast_model,
+                accurate_model=accurate_model,
+            )
+        return self._create_ocr_model(ocr_options, artifacts_path=artifacts_path)
+
+    def _create_ocr_model(
+        self, ocr_options: OcrOptions, artifacts_path: Optional[Path] = None
+    ) -> Optional[BaseOcrModel]:
+        if isinstance(ocr_options, EasyOcrOptions):
             return EasyOcrModel(
                 enabled=self.pipeline_options.do_ocr,
                 artifacts_path=artifacts_path,
-                options=self.pipeline_options.ocr_options,
+                options=ocr_options,
                 accelerator_options=self.pipeline_options.accelerator_options,
             )
-        elif isinstance(self.pipeline_options.ocr_options, TesseractCliOcrOptions):
+        elif isinstance(ocr_options, TesseractCliOcrOptions):
             return TesseractOcrCliModel(
                 enabled=self.pipeline_options.do_ocr,
-                options=self.pipeline_options.ocr_options,
+                options=ocr_options,
             )
-        elif isinstance(self.pipeline_options.ocr_options, TesseractOcrOptions):
+        elif isinstance(ocr_options, TesseractOcrOptions):
             return TesseractOcrModel(
                 enabled=self.pipeline_options.do_ocr,
-                options=self.pipeline_options.ocr_options,
+                options=ocr_options,
             )
-        elif isinstance(self.pipeline_options.ocr_options, RapidOcrOptions):
+        elif isinstance(ocr_options, RapidOcrOptions):
             return RapidOcrModel(
                 enabled=self.pipeline_options.do_ocr,
-                options=self.pipeline_options.ocr_options,
+                options=ocr_options,
                 accelerator_options=self.pipeline_options.accelerator_options,
             )
-        elif isinstance(self.pipeline_options.ocr_options, OcrMacOptions):
+        elif isinstance(ocr_options, OcrMacOptions):
             if "darwin" != sys.platform:
                 raise RuntimeError(
-                    f"The specified OCR type is only supported on Mac: {self.pipeline_options.ocr_options.kind}."
+                    f"The specified OCR type is only supported on Mac: {ocr_options.kind}."
                 )
             return OcrMacModel(
                 enabled=self.pipeline_options.do_ocr,
-                options=self.pipeline_options.ocr_options,
+                options=ocr_options,
             )
         return None
 
@@ -211,6 +265,7 @@ class StandardPdfPipeline(PaginatedPipeline):
                 enabled=self.pipeline_options.do_picture_description,
                 enable_remote_services=self.pipeline_options.enable_remote_services,
                 options=self.pipeline_options.picture_description_options,
+                dedup_options=self.pipeline_options.picture_dedup_options,
             )
         elif isinstance(
             self.pipeline_options.picture_description_options,
@@ -221,6 +276,7 @@ class StandardPdfPipeline(PaginatedPipeline):
                 artifacts_path=artifacts_path,
                 options=self.pipeline_options.picture_description_options,
                 accelerator_options=self.pipeline_options.accelerator_options,
+                dedup_options=self.pipeline_options.picture_dedup_options,
             )
         return None
 
@@ -239,63 +295,95 @@ class StandardPdfPipeline(PaginatedPipeline):
 
         with TimeRecorder(conv_res, "doc_assemble", scope=ProfilingScope.DOCUMENT):
             for p in conv_res.pages:
-                if p.assembled is not None:
-                    for el in p.assembled.body:
-                        all_body.append(el)
-                    for el in p.assembled.headers:
-                        all_headers.append(el)
-                    for el in p.assembled.elements:
-                        all_elements.append(el)
+                with restored_page(p):
+                    if p.assembled is not None:
+                        for el in p.assembled.body:
+                            all_body.append(el)
+                        for el in p.assembled.headers:
+                            all_headers.append(el)
+                        for el in p.assembled.elements:
+                            all_elements.append(el)
 
             conv_res.assembled = AssembledUnit(
                 elements=all_elements, headers=all_headers, body=all_body
             )
 
-            conv_res.document = self.glm_model(conv_res)
+            item_clusters: Dict[str, Tuple[int, int]] = {}
+            conv_res.document = self.glm_model(conv_res, item_clusters=item_clusters)
 
-            # Generate page images in the output
-            if self.pipeline_options.generate_page_images:
-                for page in conv_res.pages:
-                    assert page.image is not None
-                    page_no = page.page_no + 1
-                    conv_res.document.pages[page_no].image = ImageRef.from_pil(
-                        page.image, dpi=int(72 * self.pipeline_options.images_scale)
-                    )
-
-            # Generate images of the requested element types
-            if (
-                self.pipeline_options.generate_picture_images
-                or self.pipeline_options.generate_table_images
-            ):
-                scale = self.pipeline_options.images_scale
-                for element, _level in conv_res.document.iterate_items():
-                    if not isinstance(element, DocItem) or len(element.prov) == 0:
-                        continue
-                    if (
-                        isinstance(element, PictureItem)
-                        and self.pipeline_options.generate_picture_images
-                    ) or (
-                        isinstance(element, TableItem)
-                        and self.pipeline_options.generate_table_images
-                    ):
-                        page_ix = element.prov[0].page_no - 1
-                        page = conv_res.pages[page_ix]
-                        assert page.size is not None
+            with create_image_sink(
+                self.pipeline_options.image_sink_options
+            ) as image_sink:
+                # Generate page images in the output
+                if self.pipeline_options.generate_page_images:
+                    for page in conv_res.pages:
                         assert page.image is not None
-
-                        crop_bbox = (
-                            element.prov[0]
-                            .bbox.scaled(scale=scale)
-                            .to_top_left_origin(page_height=page.size.height * scale)
+                        page_no = page.page_no + 1
+                        conv_res.document.pages[page_no].image = image_sink.add(
+                            page.image, dpi=int(72 * self.pipeline_options.images_scale)
                         )
 
-                        cropped_im = page.image.crop(crop_bbox.as_tuple())
-                        element.image = ImageRef.from_pil(
-                            cropped_im, dpi=int(72 * scale)
-                        )
+                # Attach the images of the requested element types
+                if (
+                    self.pipeline_options.generate_picture_images
+                    or self.pipeline_options.generate_table_images
+                ):
+                    self._attach_element_images(conv_res, image_sink, item_clusters)
 
         return conv_res
 
+    def _attach_element_images(
+        self,
+        conv_res: ConversionResult,
+        image_sink: ImageSink,
+        item_clusters: Dict[str, Tuple[int, int]],
+    ):
+        # The items are matched to the crops of their page elements by the cluster
+        # ids recorded by the reading order model.
+        page_no_to_pages = {p.page_no: p for p in conv_res.pages}
+
+        scale = self.pipeline_options.images_scale
+        for element, _level in conv_res.document.iterate_items():
+            if not isinstance(element, DocItem) or len(element.prov) == 0:
+                continue
+            if not (
+                (
+                    isinstance(element, PictureItem)
+                    and self.pipeline_options.generate_picture_images
+                )
+                or (
+                    isinstance(element, TableItem)
+                    and self.pipeline_options.generate_table_images
+                )
+            ):
+                continue
+
+            prov = element.prov[0]
+            page = page_no_to_pages[prov.page_no - 1]
+            cropped_im: Optional[Image.Image] = None
+            if element.self_ref in item_clusters:
+                _, cluster_id = item_clusters[element.self_ref]
+                cropped_im = page._element_images.get(cluster_id)
+            if cropped_im is None and self.keep_images and page.size is not None:
+                # Not cropped in the page pipeline, fall back to the kept page image
+                page_image = page.image
+                if page_image is not None:
+                    crop_bbox = prov.bbox.scaled(scale=scale).to_top_left_origin(
+                        page_height=page.size.height * scale
+                    )
+                    cropped_im = page_image.crop(crop_bbox.as_tuple())
+            if cropped_im is None:
+                _log.warning(
+                    f"No image of {element.self_ref} on page {prov.page_no}, "
+                    "the item is added without it."
+                )
+                continue
+
+            element.image = image_sink.add(cropped_im, dpi=int(72 * scale))
+
+        for page in conv_res.pages:
+            page._element_images = {}
+
     @classmethod
     def get_default_options(cls) -> PdfPipelineOptions:
         return PdfPipelineOptions()
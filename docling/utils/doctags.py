@@ -0,0 +1,273 @@
+import re
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from docling_core.types.doc import (
+    BoundingBox,
+    DocItemLabel,
+    DoclingDocument,
+    ImageRef,
+    ProvenanceItem,
+    TableCell,
+    TableData,
+)
+from docling_core.types.doc.tokens import DocumentToken, TableToken
+
+from docling.datamodel.base_models import Page
+
+# Maps the recognized tags to a Docling label
+_TAG_TO_LABEL: Dict[str, DocItemLabel] = {
+    "title": DocItemLabel.TITLE,
+    "document_index": DocItemLabel.DOCUMENT_INDEX,
+    DocumentToken.OTSL.value: DocItemLabel.TABLE,
+    "section_header_level_1": DocItemLabel.SECTION_HEADER,
+    "checkbox_selected": DocItemLabel.CHECKBOX_SELECTED,
+    "checkbox_unselected": DocItemLabel.CHECKBOX_UNSELECTED,
+    "text": DocItemLabel.TEXT,
+    "page_header": DocItemLabel.PAGE_HEADER,
+    "page_footer": DocItemLabel.PAGE_FOOTER,
+    "formula": DocItemLabel.FORMULA,
+    "caption": DocItemLabel.CAPTION,
+    "picture": DocItemLabel.PICTURE,
+    "list_item": DocItemLabel.LIST_ITEM,
+    "footnote": DocItemLabel.FOOTNOTE,
+    "code": DocItemLabel.CODE,
+}
+_OPEN_TO_CLOSE = {f"<{tag}>": f"</{tag}>" for tag in _TAG_TO_LABEL}
+
+# A token is a tag without nested angle brackets, a text run, or a stray "<"
+_TOKEN_PATTERN = re.compile(r"<[^<>]*>|[^<]+|<")
+_LOC_PATTERN = re.compile(rf"<{DocumentToken.LOC.value}(\d+)>")
+_LOC_SCALE = 500
+
+_CELL_TOKENS = {
+    TableToken.OTSL_FCEL.value,
+    TableToken.OTSL_ECEL.value,
+    TableToken.OTSL_CHED.value,
+    TableToken.OTSL_RHED.value,
+    TableToken.OTSL_SROW.value,
+}
+_COL_SPAN_TOKENS = {TableToken.OTSL_LCEL.value, TableToken.OTSL_XCEL.value}
+_ROW_SPAN_TOKENS = {TableToken.OTSL_UCEL.value, TableToken.OTSL_XCEL.value}
+
+
+def _is_tag(token: str) -> bool:
+    return len(token) > 1 and token[0] == "<" and token[-1] == ">"
+
+
+def _iter_blocks(tokens: List[str]) -> Iterator[Tuple[str, List[str]]]:
+    """The top-level blocks of recognized tags, with their inner tokens.
+
+    A block ends at the first closing tag of its kind; an opening tag without
+    closing tag is skipped, and the scan continues with the tokens following it.
+    """
+    # Index of the next closing tag of each opening tag, from a backward scan
+    next_close: List[int] = [-1] * len(tokens)
+    last_close: Dict[str, int] = {}
+    for ix in range(len(tokens) - 1, -1, -1):
+        token = tokens[ix]
+        if token in _OPEN_TO_CLOSE:
+            next_close[ix] = last_close.get(_OPEN_TO_CLOSE[token], -1)
+        elif token.startswith("</"):
+            last_close[token] = ix
+
+    ix = 0
+    while ix < len(tokens):
+        end = next_close[ix]
+        if end < 0:
+            ix += 1
+            continue
+        yield tokens[ix][1:-1], tokens[ix + 1 : end]
+        ix = end + 1
+
+
+def _parse_block(tokens: List[str]) -> Tuple[Optional[BoundingBox], str]:
+    """The normalized bounding box and the text of a block."""
+    locs: List[float] = []
+    text_parts: List[str] = []
+    for token in tokens:
+        if _is_tag(token):
+            if (match := _LOC_PATTERN.fullmatch(token)) is not None:
+                locs.append(float(match.group(1)) / _LOC_SCALE)
+        else:
+            text_parts.append(token)
+
+    bbox = None
+    if len(locs) == 4:
+        bbox = BoundingBox(l=locs[0], t=locs[1], r=locs[2], b=locs[3])
+    return bbox, "".join(text_parts).strip()
+
+
+def _parse_table(tokens: List[str]) -> TableData:
+    """Table data from the OTSL tokens of a table block.
+
+    The grid of OTSL tokens is collected in one pass, the spans are then read from
+    the runs of merge tokens on the right and below of each cell.
+    """
+    rows: List[List[str]] = [[]]
+    # Cells, by their row and column, with their text
+    cells: List[Tuple[int, int, str]] = []
+    # The text of a cell is the next non-blank text, before any other OTSL token
+    pending_text = False
+    for token in tokens:
+        if not _is_tag(token):
+            if pending_text and token.strip():
+                row_ix, col_ix, _ = cells[-1]
+                cells[-1] = (row_ix, col_ix, token.strip())
+                pending_text = False
+            continue
+
+        if _LOC_PATTERN.fullmatch(token):
+            continue
+        pending_text = False
+        if token == TableToken.OTSL_NL.value:
+            if len(rows[-1]) > 0:
+                rows.append([])
+            continue
+
+        if token in _CELL_TOKENS:
+            cells.append((len(rows) - 1, len(rows[-1]), ""))
+            pending_text = token != TableToken.OTSL_ECEL.value
+        rows[-1].append(token)
+
+    if len(rows[-1]) == 0:
+        rows.pop()
+
+    table_cells: List[TableCell] = []
+    for row_ix, col_ix, text in cells:
+        row = rows[row_ix]
+        col_span = 1
+        while (
+            col_ix + col_span < len(row) and row[col_ix + col_span] in _COL_SPAN_TOKENS
+        ):
+            col_span += 1
+        row_span = 1
+        while (
+            row_ix + row_span < len(rows)
+            and col_ix < len(rows[row_ix + row_span])
+            and rows[row_ix + row_span][col_ix] in _ROW_SPAN_TOKENS
+        ):
+            row_span += 1
+
+        table_cells.append(
+            TableCell(
+                text=text,
+                row_span=row_span,
+                col_span=col_span,
+                start_row_offset_idx=row_ix,
+                end_row_offset_idx=row_ix + row_span,
+                start_col_offset_idx=col_ix,
+                end_col_offset_idx=col_ix + col_span,
+            )
+        )
+
+    return TableData(
+        num_rows=len(rows),
+        num_cols=max((len(row) for row in rows), default=0),
+        table_cells=table_cells,
+    )
+
+
+class DocTagsDocumentBuilder:
+    """Builds a document from the DocTags predicted by the VLM, page by page.
+
+    The pages are added as they are predicted, in the order of the document. With
+    `force_backend_text`, the text of the elements is read from the page backend
+    within their predicted bounding box, instead of the predicted text.
+    """
+
+    def __init__(self, name: str = "Document", force_backend_text: bool = False):
+        self.document = DoclingDocument(name=name)
+        self.force_backend_text = force_backend_text
+
+    def add_page(self, page: Page):
+        if page.size is None:
+            return
+
+        doc = self.document
+        page_no = page.page_no + 1
+        doc.add_page(page_no=page_no, size=page.size)
+        if page.predictions.vlm_response is None:
+            return
+
+        width, height = page.size.width, page.size.height
+        tokens = _TOKEN_PATTERN.findall(page.predictions.vlm_response.text)
+        for tag, block_tokens in _iter_blocks(tokens):
+            norm_bbox, text = _parse_block(block_tokens)
+            bbox = (
+                norm_bbox.resize_by_scale(width, height)
+                if norm_bbox is not None
+                else None
+            )
+
+            if tag == DocumentToken.OTSL.value:
+                table_data = _parse_table(block_tokens)
+                doc.add_table(
+                    data=table_data,
+                    prov=(
+                        ProvenanceItem(bbox=bbox, charspan=(0, 0), page_no=page_no)
+                        if bbox is not None
+                        else None
+                    ),
+                )
+
+            elif tag == "picture":
+                if bbox is None:
+                    continue
+                assert norm_bbox is not None
+                image_ref = None
+                if (image := page.image) is not None:
+                    im_width, im_height = image.size
+                    crop_box = (
+                        int(norm_bbox.l * im_width),
+                        int(norm_bbox.t * im_height),
+                        int(norm_bbox.r * im_width),
+                        int(norm_bbox.b * im_height),
+                    )
+                    # Malformed locations are kept in the provenance only
+                    if 0 <= crop_box[0] < crop_box[2] <= im_width and (
+                        0 <= crop_box[1] < crop_box[3] <= im_height
+                    ):
+                        cropped_image = image.crop(crop_box)
+                        image_ref = ImageRef.from_pil(image=cropped_image, dpi=72)
+                pic = doc.add_picture(
+                    parent=None,
+                    image=image_ref,
+                    prov=ProvenanceItem(bbox=bbox, charspan=(0, 0), page_no=page_no),
+                )
+                # The text of a picture is its caption
+                if len(text) > 0:
+                    caption_item = doc.add_text(
+                        label=DocItemLabel.CAPTION, text=text, parent=None
+                    )
+                    pic.captions.append(caption_item.get_ref())
+
+            else:
+                if self.force_backend_text:
+                    text = ""
+                    if bbox is not None and page._backend is not None:
+                        text = page._backend.get_text_in_rect(bbox)
+                label = _TAG_TO_LABEL[tag]
+                if label == DocItemLabel.DOCUMENT_INDEX:
+                    # Not a valid label of the text items, the index is kept as text
+                    label = DocItemLabel.TEXT
+                doc.add_text(
+                    label=label,
+                    text=text,
+                    prov=(
+                        ProvenanceItem(
+                            bbox=bbox, charspan=(0, len(text)), page_no=page_no
+                        )
+                        if bbox is not None
+                        else None
+                    ),
+                )
+
+
+def doctags_to_document(
+    pages: List[Page], force_backend_text: bool = False
+) -> DoclingDocument:
+    """Build a document from the DocTags predicted by the VLM for each page."""
+    builder = DocTagsDocumentBuilder(force_backend_text=force_backend_text)
+    for page in pages:
+        builder.add_page(page)
+    return builder.document
@@ -0,0 +1,49 @@
+from typing import Final
+
+from docling_core.types.doc import DoclingDocument
+from docling_core.types.doc.document import FloatingItem, RefItem
+
+# The lists of the items of a document, as they appear in their references
+_ITEM_LISTS: Final = (
+    "groups",
+    "texts",
+    "pictures",
+    "tables",
+    "key_value_items",
+    "form_items",
+)
+
+
+def append_document_fragment(doc: DoclingDocument, fragment: DoclingDocument) -> None:
+    """Appends the items and the pages of a fragment to a document.
+
+    The items of the fragment are moved, with their references renumbered after the
+    items of the same kind in the document. The children of the body and of the
+    furniture of the fragment are appended to the ones of the document, and the
+    pages are added with their numbers. The fragment can not be used afterwards.
+    """
+    offsets = {name: len(getattr(doc, name)) for name in _ITEM_LISTS}
+
+    def remap(ref: RefItem) -> RefItem:
+        # The references are "#/body", "#/furniture" or "#/<list>/<index>"
+        parts = ref.cref.split("/")
+        if len(parts) != 3:
+            return ref
+        return RefItem(cref=f"#/{parts[1]}/{int(parts[2]) + offsets[parts[1]]}")
+
+    for name in _ITEM_LISTS:
+        items = getattr(fragment, name)
+        for item in items:
+            item.self_ref = remap(RefItem(cref=item.self_ref)).cref
+            if item.parent is not None:
+                item.parent = remap(item.parent)
+            item.children = [remap(ref) for ref in item.children]
+            if isinstance(item, FloatingItem):
+                item.captions = [remap(ref) for ref in item.captions]
+                item.references = [remap(ref) for ref in item.references]
+                item.footnotes = [remap(ref) for ref in item.footnotes]
+        getattr(doc, name).extend(items)
+
+    doc.body.children.extend(remap(ref) for ref in fragment.body.children)
+    doc.furniture.children.extend(remap(ref) for ref in fragment.furniture.children)
+    doc.pages.update(fragment.pages)
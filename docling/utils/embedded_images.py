@@ -0,0 +1,38 @@
+import base64
+import mimetypes
+from io import BytesIO
+from typing import Optional
+
+from docling_core.types.doc import ImageRef, Size
+from PIL import Image
+
+from docling.datamodel.settings import ImageExtractionMode
+
+
+def get_embedded_image_ref(
+    image_bytes: bytes, dpi: int, mode: ImageExtractionMode
+) -> Optional[ImageRef]:
+    """The reference to an image embedded in a document, None when it is skipped.
+
+    With `ImageExtractionMode.ORIGINAL`, the image is kept as it is stored when its
+    mimetype can be referenced, only its header being read for the size. The other
+    images are decoded and re-encoded as PNG. The errors of PIL are raised when the
+    image cannot be identified.
+    """
+    if mode == ImageExtractionMode.SKIP:
+        return None
+
+    # Opening the image only reads its header, the pixels are decoded on use
+    pil_image = Image.open(BytesIO(image_bytes))
+    if mode == ImageExtractionMode.ORIGINAL:
+        mimetype = Image.MIME.get(pil_image.format or "")
+        if mimetype in mimetypes.types_map.values():
+            img_str = base64.b64encode(image_bytes).decode("utf-8")
+            return ImageRef(
+                mimetype=mimetype,
+                dpi=dpi,
+                size=Size(width=pil_image.width, height=pil_image.height),
+                uri=f"data:{mimetype};base64,{img_str}",
+            )
+
+    return ImageRef.from_pil(image=pil_image, dpi=dpi)
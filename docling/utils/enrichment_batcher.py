@@ -0,0 +1,108 @@
+import logging
+import time
+from typing import Any, Dict, List, Tuple
+
+from docling.datamodel.base_models import (
+    ConversionStatus,
+    DoclingComponentType,
+    ErrorItem,
+    ItemAndImageEnrichmentElement,
+)
+from docling.datamodel.document import ConversionResult
+from docling.models.base_model import GenericEnrichmentModel
+
+_log = logging.getLogger(__name__)
+
+
+class EnrichmentBatcher:
+    """Forms enrichment batches across the documents of a conversion.
+
+    The prepared elements carry their item and image, hence elements of different
+    documents can be processed in the same batch; the models write their results on
+    the items, i.e. in the right document. A model batch is run when it reaches the
+    batch size of the model, or when its oldest element waited more than `max_wait`
+    seconds at one of the `flush_expired()` calls.
+    """
+
+    def __init__(self, max_wait: float, raises_on_error: bool):
+        self.max_wait = max_wait
+        self.raises_on_error = raises_on_error
+
+        # Per model: the queued elements with their conversion result
+        self._queues: Dict[
+            int,
+            List[Tuple[ConversionResult, ItemAndImageEnrichmentElement]],
+        ] = {}
+        self._models: Dict[int, GenericEnrichmentModel[Any]] = {}
+        self._first_queued: Dict[int, float] = {}
+        # Number of queued elements of each conversion result
+        self._pending: Dict[int, int] = {}
+
+    def add(
+        self,
+        model: GenericEnrichmentModel[Any],
+        conv_res: ConversionResult,
+        element: ItemAndImageEnrichmentElement,
+    ):
+        key = id(model)
+        self._models[key] = model
+        queue = self._queues.setdefault(key, [])
+        if len(queue) == 0:
+            self._first_queued[key] = time.monotonic()
+        queue.append((conv_res, element))
+        self._pending[id(conv_res)] = self._pending.get(id(conv_res), 0) + 1
+
+        if len(queue) >= model.elements_batch_size:
+            self._run(key)
+
+    def is_pending(self, conv_res: ConversionResult) -> bool:
+        return self._pending.get(id(conv_res), 0) > 0
+
+    def flush_expired(self):
+        now = time.monotonic()
+        for key in list(self._queues.keys()):
+            if (
+                len(self._queues[key]) > 0
+                and now - self._first_queued[key] >= self.max_wait
+            ):
+                self._run(key)
+
+    def flush_all(self):
+        for key in list(self._queues.keys()):
+            if len(self._queues[key]) > 0:
+                self._run(key)
+
+    def _run(self, key: int):
+        model = self._models[key]
+        queued, self._queues[key] = self._queues[key], []
+        conv_results = {id(conv_res): conv_res for conv_res, _ in queued}
+        _log.debug(
+            f"Running {type(model).__name__} on {len(queued)} elements "
+            f"from {len(conv_results)} documents."
+        )
+
+        try:
+            # The document argument is only meaningful for single-document
+            # batches, the prepared elements are self-contained.
+            for _ in model(
+                doc=queued[0][0].document,
+                element_batch=[element for _, element in queued],
+            ):  # Must exhaust!
+                pass
+        except Exception as e:
+            if self.raises_on_error:
+                raise e
+            for conv_res in conv_results.values():
+                conv_res.status = ConversionStatus.FAILURE
+                conv_res.errors.append(
+                    ErrorItem(
+                        component_type=DoclingComponentType.MODEL,
+                        module_name=type(model).__name__,
+                        error_message=str(e),
+                    )
+                )
+        finally:
+            for conv_res, _ in queued:
+                self._pending[id(conv_res)] -= 1
+                if self._pending[id(conv_res)] == 0:
+                    del self._pending[id(conv_res)]
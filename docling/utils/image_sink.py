@@ -0,0 +1,199 @@
+import hashlib
+import logging
+import mimetypes
+import threading
+import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from io import BytesIO
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from docling_core.types.doc import ImageRef, Size
+from PIL import Image
+
+from docling.datamodel.pipeline_options import ImageFormat, ImageSinkOptions
+
+_log = logging.getLogger(__name__)
+
+# Not registered by default on all platforms, required by the ImageRef validation
+mimetypes.add_type("image/webp", ".webp")
+
+_FORMAT_TO_PIL: Dict[ImageFormat, str] = {
+    ImageFormat.PNG: "PNG",
+    ImageFormat.JPEG: "JPEG",
+    ImageFormat.WEBP: "WEBP",
+}
+_FORMAT_TO_MIMETYPE: Dict[ImageFormat, str] = {
+    ImageFormat.PNG: "image/png",
+    ImageFormat.JPEG: "image/jpeg",
+    ImageFormat.WEBP: "image/webp",
+}
+_FORMAT_TO_EXTENSION: Dict[ImageFormat, str] = {
+    ImageFormat.PNG: "png",
+    ImageFormat.JPEG: "jpg",
+    ImageFormat.WEBP: "webp",
+}
+
+
+class _ZipArchive:
+    """A zip archive opened in append mode, shared by the sinks of a process.
+
+    Each `ZipFile` writes its own central directory when closed, so the sinks of
+    concurrent conversions must write through the same one. The archive is closed
+    when the last sink using it is closed.
+    """
+
+    def __init__(self, path: Path):
+        self.zip = zipfile.ZipFile(path, mode="a")
+        self.names: Set[str] = set(self.zip.namelist())
+        self.lock = threading.Lock()
+        self.num_sinks = 0
+
+
+_zip_archives: Dict[Path, _ZipArchive] = {}
+_zip_archives_lock = threading.Lock()
+
+
+def _acquire_zip_archive(path: Path) -> _ZipArchive:
+    with _zip_archives_lock:
+        archive = _zip_archives.get(path)
+        if archive is None:
+            archive = _zip_archives[path] = _ZipArchive(path)
+        archive.num_sinks += 1
+        return archive
+
+
+def _release_zip_archive(path: Path):
+    with _zip_archives_lock:
+        archive = _zip_archives[path]
+        archive.num_sinks -= 1
+        if archive.num_sinks == 0:
+            del _zip_archives[path]
+            archive.zip.close()
+
+
+class ImageSink:
+    """Produces the `ImageRef` of the images generated by the pipelines.
+
+    The base sink embeds the images as PNG data URIs in the document.
+    """
+
+    def add(self, image: Image.Image, dpi: int) -> ImageRef:
+        return ImageRef.from_pil(image, dpi=dpi)
+
+    def close(self):
+        pass
+
+    def __enter__(self) -> "ImageSink":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class FileImageSink(ImageSink):
+    """Writes the images to a content-addressed directory or zip archive.
+
+    The name of each image is the hash of its pixels and encoding parameters, so
+    identical images are only written once. Encoding and writing happen in a thread
+    pool; `close()` waits for all the pending images.
+
+    The sinks of the same process share the zip archive they write to. Separate
+    processes must not write to the same archive.
+    """
+
+    def __init__(self, options: ImageSinkOptions):
+        self.options = options
+        self.output_path = options.output_path.absolute()
+        self.is_zip = self.output_path.suffix.lower() == ".zip"
+
+        self._zip_archive: Optional[_ZipArchive] = None
+        self._written: Set[str] = set()
+        self._lock = threading.Lock()
+        if self.is_zip:
+            self.output_path.parent.mkdir(parents=True, exist_ok=True)
+            self._zip_archive = _acquire_zip_archive(self.output_path.resolve())
+            # Shared with the other sinks writing to the archive
+            self._written = self._zip_archive.names
+            self._lock = self._zip_archive.lock
+        else:
+            self.output_path.mkdir(parents=True, exist_ok=True)
+
+        self._executor = ThreadPoolExecutor(max_workers=options.num_threads)
+        self._futures: List[Future] = []
+
+    def _get_name(self, image: Image.Image) -> str:
+        fmt = self.options.image_format
+        h = hashlib.sha256()
+        h.update(
+            f"{image.mode}:{image.size}:{fmt.value}:{self.options.quality}".encode()
+        )
+        h.update(image.tobytes())
+        return f"{h.hexdigest()}.{_FORMAT_TO_EXTENSION[fmt]}"
+
+    def _encode(self, image: Image.Image) -> bytes:
+        fmt = self.options.image_format
+        if fmt == ImageFormat.JPEG and image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+
+        buf = BytesIO()
+        if fmt == ImageFormat.PNG:
+            image.save(buf, format="PNG")
+        else:
+            image.save(buf, format=_FORMAT_TO_PIL[fmt], quality=self.options.quality)
+        return buf.getvalue()
+
+    def _write(self, name: str, image: Image.Image):
+        data = self._encode(image)
+        if self._zip_archive is not None:
+            with self._lock:
+                self._zip_archive.zip.writestr(name, data)
+        else:
+            # Written under a temporary name, such that concurrent conversions
+            # never expose a partially written image
+            image_path = self.output_path / name
+            tmp_path = image_path.with_name(f"{name}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(data)
+            tmp_path.replace(image_path)
+
+    def add(self, image: Image.Image, dpi: int) -> ImageRef:
+        name = self._get_name(image)
+
+        with self._lock:
+            is_new = name not in self._written and (
+                self.is_zip or not (self.output_path / name).exists()
+            )
+            self._written.add(name)
+        if is_new:
+            self._futures.append(self._executor.submit(self._write, name, image))
+
+        # The members of a zip archive are referred to as <archive path>/<name>
+        image_ref = ImageRef(
+            mimetype=_FORMAT_TO_MIMETYPE[self.options.image_format],
+            dpi=dpi,
+            size=Size(width=image.width, height=image.height),
+            uri=self.output_path / name,
+        )
+        if self.is_zip:
+            # The member cannot be opened by its path, the image stays attached
+            # for the enrichment models reading it back
+            image_ref._pil = image
+        return image_ref
+
+    def close(self):
+        try:
+            for future in self._futures:
+                # Raises the errors of the writes
+                future.result()
+        finally:
+            self._futures = []
+            self._executor.shutdown(wait=True)
+            if self._zip_archive is not None:
+                _release_zip_archive(self.output_path.resolve())
+                self._zip_archive = None
+
+
+def create_image_sink(options: Optional[ImageSinkOptions]) -> ImageSink:
+    if options is None:
+        return ImageSink()
+    return FileImageSink(options)
@@ -0,0 +1,138 @@
+import gc
+import logging
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Callable, Generic, List, Optional, TypeVar
+
+from docling.datamodel.settings import settings
+from docling.utils.profiling import ProfilingItem, ProfilingScope
+
+if TYPE_CHECKING:
+    from docling.datamodel.document import ConversionResult
+
+_log = logging.getLogger(__name__)
+
+ModelT = TypeVar("ModelT")
+
+# All handles which currently hold a loaded model
+_loaded_models: "weakref.WeakSet[LazyModel]" = weakref.WeakSet()
+
+# Conversion in progress, used for attributing model load times
+_current_conv_res: ContextVar[Optional["ConversionResult"]] = ContextVar(
+    "_current_conv_res", default=None
+)
+
+
+class LazyModel(Generic[ModelT]):
+    """Handle to a model which is loaded on first use.
+
+    The `loader` is only invoked by the first call of `get()`. The model can be
+    released with `unload()`, in which case the next `get()` loads it again.
+    """
+
+    def __init__(self, name: str, loader: Callable[[], ModelT]):
+        self.name = name
+        self._loader = loader
+        self._model: Optional[ModelT] = None
+        self._lock = threading.Lock()
+
+        self.load_times: List[float] = []
+        self.last_used: float = 0.0
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._model is not None
+
+    def get(self) -> ModelT:
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    start_time = time.monotonic()
+                    self._model = self._loader()
+                    elapsed = time.monotonic() - start_time
+
+                    self.load_times.append(elapsed)
+                    _loaded_models.add(self)
+                    _log.info(f"Loaded model {self.name} in {elapsed:.2f} sec.")
+                    _record_load_time(self.name, elapsed)
+
+        self.last_used = time.monotonic()
+        return self._model
+
+    def unload(self):
+        with self._lock:
+            if self._model is None:
+                return
+            self._model = None
+            _loaded_models.discard(self)
+        gc.collect()
+        _log.info(f"Unloaded model {self.name}.")
+
+
+def _record_load_time(name: str, elapsed: float):
+    conv_res = _current_conv_res.get()
+    if conv_res is None or not settings.debug.profile_pipeline_timings:
+        return
+    key = f"model_load_{name}"
+    if key not in conv_res.timings:
+        conv_res.timings[key] = ProfilingItem(scope=ProfilingScope.DOCUMENT)
+    conv_res.timings[key].times.append(elapsed)
+    conv_res.timings[key].count += 1
+
+
+@contextmanager
+def record_model_loads(conv_res: "ConversionResult"):
+    """Attribute the time of the models loaded in this context to `conv_res`."""
+    token = _current_conv_res.set(conv_res)
+    try:
+        yield
+    finally:
+        _current_conv_res.reset(token)
+
+
+def _get_rss_bytes() -> Optional[int]:
+    try:
+        import resource
+
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * resource.getpagesize()
+    except (ImportError, OSError, ValueError, IndexError):
+        return None
+
+
+def unload_idle_models(
+    idle_timeout: Optional[float] = None, max_rss: Optional[int] = None
+) -> int:
+    """Unload the models which have not been used recently.
+
+    Args:
+        idle_timeout: Models not used for this many seconds are unloaded.
+        max_rss: When the resident memory of the process exceeds this many bytes,
+            the least recently used models are unloaded until it drops below.
+
+    Returns:
+        The number of unloaded models.
+    """
+    now = time.monotonic()
+    candidates = sorted(_loaded_models, key=lambda m: m.last_used)
+    num_unloaded = 0
+
+    if idle_timeout is not None:
+        for model in list(candidates):
+            if now - model.last_used > idle_timeout:
+                model.unload()
+                candidates.remove(model)
+                num_unloaded += 1
+
+    if max_rss is not None:
+        while candidates:
+            rss = _get_rss_bytes()
+            if rss is None or rss <= max_rss:
+                break
+            candidates.pop(0).unload()
+            num_unloaded += 1
+
+    return num_unloaded
@@ -0,0 +1,97 @@
+import enum
+import logging
+import threading
+import weakref
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Tuple, Type, TypeVar
+
+from docling.utils.lazy_model import LazyModel
+
+_log = logging.getLogger(__name__)
+
+ModelT = TypeVar("ModelT")
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, Path):
+        return str(value)
+    return value
+
+
+def make_model_key(model_cls: Type, **params: Any) -> Tuple[Hashable, ...]:
+    """Build the registry key of a model from the parameters defining its weights.
+
+    Only the parameters which influence the loaded model should be passed, e.g. the
+    artifacts path, device, number of threads and mode. Options which only affect
+    the post-processing must be left out, such that they can differ between
+    pipelines sharing the same model instance.
+    """
+    return (model_cls.__module__, model_cls.__qualname__, _freeze(params))
+
+
+class ModelRegistry:
+    """Process-wide registry of model handles with reference counting.
+
+    Models borrow their `LazyModel` handle from the registry, hence all the
+    pipelines (of any converter) requiring the same model share a single instance.
+    The handle is released when its owner is garbage collected and the model is
+    unloaded once no owner is left.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._models: Dict[Hashable, LazyModel] = {}
+        self._refcounts: Dict[Hashable, int] = {}
+
+    def acquire(
+        self,
+        owner: object,
+        key: Hashable,
+        name: str,
+        loader: Callable[[], ModelT],
+    ) -> LazyModel[ModelT]:
+        """Borrow the handle registered for `key`, creating it when missing.
+
+        The `loader` must not hold references to `owner`, otherwise the owner
+        is kept alive by the registry and the handle is never released.
+        """
+        with self._lock:
+            model = self._models.get(key)
+            if model is None:
+                model = LazyModel(name, loader)
+                self._models[key] = model
+                self._refcounts[key] = 0
+            else:
+                _log.debug(f"Reusing registered model {name}.")
+            self._refcounts[key] += 1
+
+        weakref.finalize(owner, self.release, key)
+        return model
+
+    def release(self, key: Hashable):
+        with self._lock:
+            if key not in self._refcounts:
+                return
+            self._refcounts[key] -= 1
+            if self._refcounts[key] > 0:
+                return
+            del self._refcounts[key]
+            model = self._models.pop(key)
+        model.unload()
+
+    def refcount(self, key: Hashable) -> int:
+        with self._lock:
+            return self._refcounts.get(key, 0)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._models)
+
+
+model_registry = ModelRegistry()
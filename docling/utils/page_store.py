@@ -0,0 +1,120 @@
+import logging
+import mmap
+import pickle
+import shutil
+import tempfile
+import threading
+import weakref
+import zlib
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterator, Optional, Tuple
+
+from PIL import Image
+
+from docling.datamodel.base_models import PagePredictions
+
+if TYPE_CHECKING:
+    from docling.datamodel.base_models import Page
+
+_log = logging.getLogger(__name__)
+
+
+class PageStore:
+    """On-disk store for the state of the pages of a document.
+
+    Spilling a page moves its cells, predictions, assembled unit and cached images
+    out of memory. The state is appended as a compressed record to a single file,
+    which is memory-mapped for reading; the images are stored as PNG files. The
+    directory is removed when the store is garbage collected, i.e. when the last
+    page referring to it is gone.
+    """
+
+    def __init__(self, directory: Optional[Path] = None):
+        self.directory = Path(tempfile.mkdtemp(prefix="docling_pages_", dir=directory))
+        self._records_path = self.directory / "pages.bin"
+        self._records_path.touch()
+        self._records: Dict[int, Tuple[int, int]] = {}  # page_no -> (offset, length)
+        self._images: Dict[Tuple[int, float], Path] = {}
+        self._mmap: Optional[mmap.mmap] = None
+        self._lock = threading.Lock()
+
+        self._finalizer = weakref.finalize(
+            self, shutil.rmtree, self.directory, ignore_errors=True
+        )
+
+    def spill(self, page: "Page"):
+        record = zlib.compress(
+            pickle.dumps(
+                (page.cells, page.predictions, page.assembled),
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        )
+        with self._lock:
+            with open(self._records_path, "ab") as f:
+                offset = f.tell()
+                f.write(record)
+            self._records[page.page_no] = (offset, len(record))
+            # The file grew, it is mapped again on the next read
+            self._close_mmap()
+
+        for scale, image in page._image_cache.items():
+            image_path = self.directory / f"page_{page.page_no}_{scale}.png"
+            image.save(image_path, format="PNG")
+            self._images[(page.page_no, scale)] = image_path
+
+        page._page_store = self
+        self.release(page)
+
+    def restore(self, page: "Page"):
+        """Load the spilled state back into the page."""
+        if page.page_no not in self._records:
+            return
+        with self._lock:
+            if self._mmap is None:
+                with open(self._records_path, "rb") as f:
+                    self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            offset, length = self._records[page.page_no]
+            record = self._mmap[offset : offset + length]
+        page.cells, page.predictions, page.assembled = pickle.loads(
+            zlib.decompress(record)
+        )
+
+    def release(self, page: "Page"):
+        """Drop the in-memory state of a spilled page."""
+        page.cells = []
+        page.predictions = PagePredictions()
+        page.assembled = None
+        page._image_cache = {}
+
+    def load_image(self, page_no: int, scale: float) -> Optional[Image.Image]:
+        image_path = self._images.get((page_no, scale))
+        if image_path is None:
+            return None
+        with Image.open(image_path) as image:
+            image.load()
+            return image
+
+    def _close_mmap(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def close(self):
+        self._close_mmap()
+        self._finalizer()
+
+
+@contextmanager
+def restored_page(page: "Page") -> Iterator["Page"]:
+    """Temporarily load the state of a spilled page, no-op for in-memory pages."""
+    page_store = page._page_store
+    if page_store is None:
+        yield page
+        return
+
+    page_store.restore(page)
+    try:
+        yield page
+    finally:
+        page_store.release(page)
@@ -0,0 +1,181 @@
+import hashlib
+import json
+import logging
+import math
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from PIL import Image
+
+from docling.datamodel.pipeline_options import PictureDedupOptions
+
+_log = logging.getLogger(__name__)
+
+_DHASH_MARGIN = 8
+
+
+def get_image_hash(image: Image.Image, near_duplicates: bool = False) -> str:
+    """Hash of the image content.
+
+    By default, the hash covers the exact pixels. With `near_duplicates`, it is a
+    difference hash of the downscaled grayscale image, together with the aspect
+    ratio, which also matches re-encoded or slightly resampled copies.
+    """
+    if not near_duplicates:
+        h = hashlib.sha256()
+        h.update(f"{image.mode}:{image.size}:".encode())
+        h.update(image.tobytes())
+        return h.hexdigest()
+
+    width, height = image.size
+    aspect = round(4 * math.log2(max(width, 1) / max(height, 1)))
+    pixels = list(
+        image.convert("L").resize((9, 8), Image.Resampling.BILINEAR).getdata()
+    )
+    bits = 0
+    for row in range(8):
+        for col in range(8):
+            # Flat regions are compared with a margin, against compression noise
+            left, right = pixels[row * 9 + col], pixels[row * 9 + col + 1]
+            bits = (bits << 1) | int(left > right + _DHASH_MARGIN)
+    return f"d{aspect}:{bits:016x}"
+
+
+class PictureResultCache:
+    """Results of a picture model, by image hash.
+
+    The results must be JSON-serializable. The `namespace` identifies the model
+    and its options in the persistent store, which can be shared by models. The
+    results kept in memory are only reused within the same `scope`, i.e. the same
+    document, while the persistent store shares them across documents.
+    """
+
+    def __init__(self, namespace: str, options: PictureDedupOptions):
+        self.namespace = namespace
+        self.options = options
+
+        self._memory: "OrderedDict[Tuple[Optional[str], str], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+
+    def _get_connection(self) -> Optional[sqlite3.Connection]:
+        if self.options.store_path is None:
+            return None
+        # Connections are not carried over to forked workers
+        if self._conn is None or self._conn_pid != os.getpid():
+            self.options.store_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                self.options.store_path, timeout=30, check_same_thread=False
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS picture_results "
+                "(namespace TEXT, key TEXT, value TEXT, PRIMARY KEY (namespace, key))"
+            )
+            self._conn.commit()
+            self._conn_pid = os.getpid()
+        return self._conn
+
+    def get(self, key: str, scope: Optional[str] = None) -> Optional[Any]:
+        with self._lock:
+            if (scope, key) in self._memory:
+                self._memory.move_to_end((scope, key))
+                return self._memory[(scope, key)]
+
+            conn = self._get_connection()
+            if conn is None:
+                return None
+            row = conn.execute(
+                "SELECT value FROM picture_results WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            ).fetchone()
+            if row is None:
+                return None
+            value = json.loads(row[0])
+            self._remember(scope, key, value)
+            return value
+
+    def put(self, key: str, value: Any, scope: Optional[str] = None):
+        with self._lock:
+            self._remember(scope, key, value)
+
+            conn = self._get_connection()
+            if conn is not None:
+                conn.execute(
+                    "INSERT OR REPLACE INTO picture_results VALUES (?, ?, ?)",
+                    (self.namespace, key, json.dumps(value)),
+                )
+                conn.commit()
+
+    def _remember(self, scope: Optional[str], key: str, value: Any):
+        self._memory[(scope, key)] = value
+        self._memory.move_to_end((scope, key))
+        while len(self._memory) > self.options.cache_size:
+            self._memory.popitem(last=False)
+
+    def _get_similar(self, key: str, scope: Optional[str] = None) -> Optional[Any]:
+        """Result of a remembered image whose perceptual hash is close to `key`."""
+        aspect, bits = key.split(":")
+        with self._lock:
+            for (other_scope, other_key), value in reversed(self._memory.items()):
+                if other_scope != scope:
+                    continue
+                other_aspect, other_bits = other_key.split(":")
+                if other_aspect != aspect:
+                    continue
+                distance = bin(int(bits, 16) ^ int(other_bits, 16)).count("1")
+                if distance <= self.options.max_hash_distance:
+                    return value
+        return None
+
+    def map(
+        self,
+        images: List[Image.Image],
+        predict: Callable[[List[Image.Image]], List[Any]],
+        scopes: Optional[List[Optional[str]]] = None,
+    ) -> List[Any]:
+        """Results for `images`, running `predict` once per unknown content.
+
+        `scopes` gives the scope of each image, by default they share the same one.
+        """
+        keys = [
+            (
+                scopes[ix] if scopes is not None else None,
+                get_image_hash(image, near_duplicates=self.options.near_duplicates),
+            )
+            for ix, image in enumerate(images)
+        ]
+
+        results: Dict[Tuple[Optional[str], str], Any] = {}
+        missing: Dict[Tuple[Optional[str], str], Image.Image] = {}
+        for (scope, key), image in zip(keys, images):
+            if (scope, key) in results or (scope, key) in missing:
+                continue
+            value = self.get(key, scope=scope)
+            if value is None and self.options.near_duplicates:
+                value = self._get_similar(key, scope=scope)
+            if value is None:
+                missing[(scope, key)] = image
+            else:
+                results[(scope, key)] = value
+
+        if len(missing) > 0:
+            for (scope, key), value in zip(
+                missing.keys(), predict(list(missing.values()))
+            ):
+                self.put(key, value, scope=scope)
+                results[(scope, key)] = value
+
+        _log.debug(
+            f"Processed {len(missing)} of {len(images)} pictures in {self.namespace}."
+        )
+        return [results[key] for key in keys]
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None and self._conn_pid == os.getpid():
+                self._conn.close()
+            self._conn = None
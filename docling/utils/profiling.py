@@ -60,3 +60,21 @@ class TimeRecorder:
             elapsed = time.monotonic() - self.start
             self.conv_res.timings[self.key].times.append(elapsed)
             self.conv_res.timings[self.key].count += 1
+
+
+def record_value(
+    conv_res: "ConversionResult",
+    key: str,
+    value: float,
+    scope: ProfilingScope = ProfilingScope.PAGE,
+):
+    """Record a measurement other than a duration, e.g. a number of tokens.
+
+    The values are stored like the times of the `TimeRecorder`, such that the same
+    statistics are available.
+    """
+    if settings.debug.profile_pipeline_timings:
+        if key not in conv_res.timings.keys():
+            conv_res.timings[key] = ProfilingItem(scope=scope)
+        conv_res.timings[key].times.append(value)
+        conv_res.timings[key].count += 1
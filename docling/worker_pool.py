@@ -0,0 +1,233 @@
+import gc
+import logging
+import multiprocessing
+import os
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from docling.datamodel.base_models import DocumentStream, InputFormat
+from docling.datamodel.document import ConversionResult
+from docling.datamodel.pipeline_options import AcceleratorOptions
+from docling.datamodel.settings import DEFAULT_PAGE_RANGE, PageRange
+from docling.document_converter import DocumentConverter
+from docling.models.base_model import BasePageModel, GenericEnrichmentModel
+from docling.pipeline.base_pipeline import BasePipeline
+from docling.utils.lazy_model import LazyModel
+
+_log = logging.getLogger(__name__)
+
+SourceType = Union[Path, str, DocumentStream]
+
+# Converter inherited by the forked workers
+_worker_converter: Optional[DocumentConverter] = None
+
+
+def get_unique_rss_bytes(pid: Optional[int] = None) -> Optional[int]:
+    """Memory which is private to the process (USS), in bytes.
+
+    The pages shared copy-on-write with the parent are not included. Returns None
+    when the information is not available on the platform.
+    """
+    path = f"/proc/{pid if pid is not None else 'self'}/smaps_rollup"
+    try:
+        with open(path) as f:
+            private_kb = 0
+            for line in f:
+                if line.startswith(("Private_Clean:", "Private_Dirty:")):
+                    private_kb += int(line.split()[1])
+        return private_kb * 1024
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _iter_lazy_models(pipeline: BasePipeline) -> Iterable[LazyModel]:
+    models: List[object] = [*pipeline.build_pipe, *pipeline.enrichment_pipe]
+    while models:
+        model = models.pop()
+        for value in vars(model).values():
+            if isinstance(value, LazyModel):
+                yield value
+            elif isinstance(value, (BasePageModel, GenericEnrichmentModel)):
+                # e.g. the engines of the cascade OCR model
+                models.append(value)
+
+
+def _init_worker(num_threads: int):
+    os.environ["OMP_NUM_THREADS"] = str(num_threads)
+    try:
+        import torch
+
+        torch.set_num_threads(num_threads)
+    except ImportError:
+        pass
+
+
+def _convert_in_worker(
+    args: Tuple[SourceType, dict],
+) -> Tuple[ConversionResult, int, Optional[int]]:
+    source, convert_kwargs = args
+    assert _worker_converter is not None
+
+    conv_res = _worker_converter.convert(source, **convert_kwargs)
+
+    # The backends hold file handles, which cannot be sent back to the parent.
+    # Same for the store of the pages spilled in low-memory mode.
+    conv_res.input._backend = None
+    for page in conv_res.pages:
+        page._backend = None
+        if page._page_store is not None:
+            page._page_store.restore(page)
+            page._page_store = None
+
+    return conv_res, os.getpid(), get_unique_rss_bytes()
+
+
+class ConverterWorkerPool:
+    """Pool of forked worker processes sharing the models of a converter.
+
+    The pipelines of `formats` are built and their models are loaded once in the
+    parent process, optionally followed by the conversion of `warmup_source`. The
+    workers are forked afterwards and inherit the read-only weights copy-on-write,
+    instead of loading their own copies. Each worker limits the torch threads to
+    `num_threads`, which defaults to the `accelerator_options.num_threads` of the
+    PDF pipeline options.
+
+    Only available on platforms supporting the `fork` start method. Since the
+    parent holds the loaded models, it should not run conversions itself while
+    the workers are alive. Several workers cannot write the images to the same zip
+    archive, a directory must be used instead.
+
+    Example:
+        with ConverterWorkerPool(converter, num_workers=4) as pool:
+            for conv_res in pool.convert_all(sources):
+                ...
+            print(pool.worker_unique_rss)
+    """
+
+    def __init__(
+        self,
+        converter: DocumentConverter,
+        num_workers: int,
+        formats: Optional[List[InputFormat]] = None,
+        warmup_source: Optional[SourceType] = None,
+        num_threads: Optional[int] = None,
+    ):
+        if "fork" not in multiprocessing.get_all_start_methods():
+            raise RuntimeError(
+                f"ConverterWorkerPool requires the fork start method, which is not available on {sys.platform}."
+            )
+
+        if num_workers > 1:
+            for fopt in converter.format_to_options.values():
+                sink_options = getattr(
+                    fopt.pipeline_options, "image_sink_options", None
+                )
+                if (
+                    sink_options is not None
+                    and sink_options.output_path.suffix.lower() == ".zip"
+                ):
+                    raise ValueError(
+                        f"The images cannot be written to the zip archive {sink_options.output_path} by several workers, use a directory instead."
+                    )
+
+        self.converter = converter
+        self.num_workers = num_workers
+        self.formats = (
+            formats
+            if formats is not None
+            else [f for f in converter.allowed_formats if f == InputFormat.PDF]
+        )
+        self.warmup_source = warmup_source
+        self.num_threads = (
+            num_threads if num_threads is not None else self._get_default_num_threads()
+        )
+
+        # Latest unique RSS reported by each worker, by pid
+        self.worker_unique_rss: Dict[int, Optional[int]] = {}
+        self._pool = None
+
+    def _get_default_num_threads(self) -> int:
+        fopt = self.converter.format_to_options.get(InputFormat.PDF)
+        accelerator_options = getattr(
+            fopt.pipeline_options if fopt is not None else None,
+            "accelerator_options",
+            None,
+        )
+        if accelerator_options is None:
+            accelerator_options = AcceleratorOptions()
+        return accelerator_options.num_threads
+
+    def start(self):
+        global _worker_converter
+
+        for format in self.formats:
+            self.converter.initialize_pipeline(format)
+            for model in _iter_lazy_models(self.converter._get_pipeline(format)):
+                model.get()
+
+        if self.warmup_source is not None:
+            self.converter.convert(self.warmup_source, raises_on_error=False)
+
+        _log.info(
+            f"Forking {self.num_workers} workers, parent unique RSS: {get_unique_rss_bytes()} bytes."
+        )
+
+        # Objects surviving until now are moved out of the reach of the garbage
+        # collector, which would otherwise touch (and copy) their pages in the workers.
+        gc.collect()
+        gc.freeze()
+
+        _worker_converter = self.converter
+        ctx = multiprocessing.get_context("fork")
+        self._pool = ctx.Pool(
+            processes=self.num_workers,
+            initializer=_init_worker,
+            initargs=(self.num_threads,),
+        )
+
+    def convert_all(
+        self,
+        source: Iterable[SourceType],
+        headers: Optional[Dict[str, str]] = None,
+        raises_on_error: bool = True,
+        max_num_pages: int = sys.maxsize,
+        max_file_size: int = sys.maxsize,
+        page_range: PageRange = DEFAULT_PAGE_RANGE,
+    ) -> Iterator[ConversionResult]:
+        """Convert the sources in the workers, yielding the results in order."""
+        if self._pool is None:
+            raise RuntimeError("The worker pool is not started.")
+
+        convert_kwargs = dict(
+            headers=headers,
+            raises_on_error=raises_on_error,
+            max_num_pages=max_num_pages,
+            max_file_size=max_file_size,
+            page_range=page_range,
+        )
+        for conv_res, pid, unique_rss in self._pool.imap(
+            _convert_in_worker, ((s, convert_kwargs) for s in source)
+        ):
+            self.worker_unique_rss[pid] = unique_rss
+            yield conv_res
+
+    def close(self):
+        global _worker_converter
+
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        _worker_converter = None
+        gc.unfreeze()
+
+        for pid, unique_rss in self.worker_unique_rss.items():
+            _log.info(f"Worker {pid} unique RSS: {unique_rss} bytes.")
+
+    def __enter__(self) -> "ConverterWorkerPool":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,68 @@
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+from docling_core.types.doc import CodeItem, DocItemLabel, TextItem
+
+from docling.datamodel.base_models import InputFormat
+from docling.datamodel.pipeline_options import PdfPipelineOptions
+from docling.document_converter import DocumentConverter, PdfFormatOption
+from docling.models.code_formula_model import CodeFormulaModel
+
+_log = logging.getLogger(__name__)
+
+
+def run(input_doc_paths: List[Path], elements_batch_size: int) -> float:
+    # The enrichment batch is the window in which the model regroups the
+    # elements. With a window of one predictor batch, no regrouping happens.
+    CodeFormulaModel.elements_batch_size = elements_batch_size
+
+    pipeline_options = PdfPipelineOptions()
+    pipeline_options.do_ocr = False
+    pipeline_options.do_table_structure = False
+    pipeline_options.do_code_enrichment = True
+    pipeline_options.do_formula_enrichment = True
+
+    doc_converter = DocumentConverter(
+        format_options={
+            InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)
+        }
+    )
+    # Load the models before timing
+    doc_converter.convert(input_doc_paths[0])
+
+    num_elements = 0
+    start_time = time.time()
+    for conv_res in doc_converter.convert_all(input_doc_paths):
+        for item, _ in conv_res.document.iterate_items():
+            if isinstance(item, CodeItem) or (
+                isinstance(item, TextItem) and item.label == DocItemLabel.FORMULA
+            ):
+                num_elements += 1
+    elapsed = time.time() - start_time
+
+    _log.info(
+        f"Window of {elements_batch_size} elements: {num_elements} code and formula "
+        f"elements in {elapsed:.2f} sec ({num_elements / elapsed:.2f} elements/sec)."
+    )
+    return num_elements / elapsed
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+
+    # Pass a directory of formula-heavy PDFs, e.g. papers from arXiv
+    data_folder = Path(__file__).parent / "../../tests/data"
+    input_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else data_folder / "pdf"
+    input_doc_paths = sorted(input_dir.glob("*.pdf"))
+
+    window = CodeFormulaModel.elements_batch_size
+    baseline = run(input_doc_paths, CodeFormulaModel.predict_batch_size)
+    bucketed = run(input_doc_paths, window)
+    _log.info(f"Speedup of the size-bucketed batches: {bucketed / baseline:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
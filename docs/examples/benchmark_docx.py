@@ -0,0 +1,71 @@
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from docx import Document
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+
+from docling.datamodel.base_models import InputFormat
+from docling.document_converter import DocumentConverter
+
+_log = logging.getLogger(__name__)
+
+
+def generate_document(path: Path, num_rows: int, num_cols: int = 6):
+    # A contract-like table: one clause per row, the first column merged vertically
+    # over groups of 10 rows and a title cell spanning the other columns.
+    doc = Document()
+    doc.add_paragraph("Schedule of obligations")
+    table = doc.add_table(rows=num_rows, cols=num_cols)
+    for ri, row in enumerate(table.rows):
+        # Reading the cells of each row once keeps the generation linear
+        cells = row.cells
+        if ri % 10 == 0:
+            cells[0].text = f"Section {ri // 10}"
+        else:
+            tcPr = cells[0]._tc.get_or_add_tcPr()
+            tcPr.append(OxmlElement("w:vMerge"))
+        if ri % 10 == 0:
+            cells[1].text = f"Obligations of section {ri // 10}"
+            cells[1].merge(cells[num_cols - 1])
+        else:
+            for ci in range(1, num_cols):
+                cells[ci].text = f"Clause {ri}.{ci}"
+    for ri, tr in enumerate(table._tbl.tr_lst):
+        if ri % 10 == 0 and ri + 1 < num_rows:
+            vMerge = OxmlElement("w:vMerge")
+            vMerge.set(qn("w:val"), "restart")
+            tr.tc_lst[0].get_or_add_tcPr().append(vMerge)
+    doc.save(str(path))
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+
+    num_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    doc_converter = DocumentConverter(allowed_formats=[InputFormat.DOCX])
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Doubling the rows should about double the time
+        for rows in [num_rows // 4, num_rows // 2, num_rows]:
+            path = Path(tmp_dir) / f"contract_{rows}.docx"
+            generate_document(path, rows)
+
+            start_time = time.time()
+            conv_res = doc_converter.convert(path)
+            elapsed = time.time() - start_time
+
+            num_cells = sum(
+                len(table.data.table_cells) for table in conv_res.document.tables
+            )
+            _log.info(
+                f"{rows} rows: {num_cells} table cells "
+                f"in {elapsed:.2f} sec ({rows / elapsed:.0f} rows/sec)."
+            )
+
+
+if __name__ == "__main__":
+    main()
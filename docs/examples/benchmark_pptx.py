@@ -0,0 +1,76 @@
+import logging
+import sys
+import tempfile
+import time
+from io import BytesIO
+from pathlib import Path
+
+from PIL import Image
+from pptx import Presentation
+from pptx.util import Inches
+
+from docling.datamodel.base_models import InputFormat
+from docling.datamodel.settings import settings
+from docling.document_converter import DocumentConverter
+
+_log = logging.getLogger(__name__)
+
+
+def generate_presentation(path: Path, num_slides: int):
+    # A report-like deck: each slide has a title, a bullet list, a table and a
+    # picture, which are all converted.
+    image = BytesIO()
+    Image.new("RGB", (320, 240), color=(30, 120, 200)).save(image, format="PNG")
+
+    prs = Presentation()
+    layout = prs.slide_layouts[1]  # Title and Content
+    for si in range(num_slides):
+        slide = prs.slides.add_slide(layout)
+        slide.shapes.title.text = f"Quarterly review {si}"
+        body = slide.placeholders[1].text_frame
+        body.text = f"Highlights of part {si}"
+        for pi in range(3):
+            body.add_paragraph().text = f"Point {si}.{pi}"
+
+        table = slide.shapes.add_table(
+            4, 3, Inches(0.5), Inches(4.5), Inches(5), Inches(1.5)
+        ).table
+        for ri in range(4):
+            for ci in range(3):
+                table.cell(ri, ci).text = f"Cell {si}.{ri}.{ci}"
+
+        image.seek(0)
+        slide.shapes.add_picture(image, Inches(6), Inches(4.5), width=Inches(3))
+    prs.save(str(path))
+
+
+def main():
+    logging.basicConfig(level=logging.INFO)
+
+    num_slides = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000
+    doc_converter = DocumentConverter(allowed_formats=[InputFormat.PPTX])
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / f"deck_{num_slides}.pptx"
+        generate_presentation(path, num_slides)
+
+        for workers, processes in [(1, False), (4, False), (4, True)]:
+            settings.perf.pptx_slide_workers = workers
+            settings.perf.pptx_slide_processes = processes
+
+            start_time = time.time()
+            conv_res = doc_converter.convert(path)
+            elapsed = time.time() - start_time
+
+            kind = "processes" if processes else "threads"
+            _log.info(
+                f"{num_slides} slides with {workers} {kind}: "
+                f"{len(conv_res.document.texts)} texts, "
+                f"{len(conv_res.document.tables)} tables, "
+                f"{len(conv_res.document.pictures)} pictures "
+                f"in {elapsed:.2f} sec ({num_slides / elapsed:.0f} slides/sec)."
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ from pytest import warns
 
 from docling.datamodel.base_models import InputFormat
 from docling.datamodel.document import ConversionResult, DoclingDocument
+from docling.datamodel.settings import settings
 from docling.document_converter import DocumentConverter
 
 from .verify_utils import verify_document, verify_export
@@ -78,3 +79,37 @@ def test_e2e_invalid_csv_conversions():
     print(f"converting {csv_inconsistent_header}")
     with warns(UserWarning, match="Inconsistent column lengths"):
         converter.convert(csv_inconsistent_header)
+
+
+def test_e2e_chunked_csv_conversion():
+    csv_path = get_csv_path("csv-comma")
+    converter = get_converter()
+    doc = converter.convert(csv_path).document
+    (table,) = doc.tables
+
+    settings.perf.csv_chunk_rows = 2
+    try:
+        chunked_doc = converter.convert(csv_path).document
+    finally:
+        settings.perf.csv_chunk_rows = None
+
+    num_data_rows = table.data.num_rows - 1
+    assert len(chunked_doc.tables) == -(-num_data_rows // 2)
+
+    # Each chunk repeats the header, followed by the next rows of the table
+    grid = table.data.grid
+    data_rows = []
+    for chunk in chunked_doc.tables:
+        chunk_grid = chunk.data.grid
+        assert [c.text for c in chunk_grid[0]] == [c.text for c in grid[0]]
+        assert 1 < chunk.data.num_rows <= 3
+        data_rows.extend([c.text for c in row] for row in chunk_grid[1:])
+    assert data_rows == [[c.text for c in row] for row in grid[1:]]
+
+
+def test_csv_quoted_line_breaks(tmp_path: Path):
+    csv_path = tmp_path / "quoted.csv"
+    csv_path.write_bytes(b'name,note\r\nfoo,"first\r\nsecond"\r\nbar,baz\r\n')
+    doc = get_converter().convert(csv_path).document
+    (table,) = doc.tables
+    assert table.data.grid[1][1].text == "first\r\nsecond"
@@ -2,14 +2,15 @@ from io import BytesIO
 from pathlib import Path
 
 from docling.backend.html_backend import HTMLDocumentBackend
-from docling.datamodel.base_models import InputFormat
+from docling.backend.html_lxml_backend import LxmlHTMLDocumentBackend
+from docling.datamodel.base_models import DocumentStream, InputFormat
 from docling.datamodel.document import (
     ConversionResult,
     DoclingDocument,
     InputDocument,
     SectionHeaderItem,
 )
-from docling.document_converter import DocumentConverter
+from docling.document_converter import DocumentConverter, HTMLFormatOption
 
 from .verify_utils import verify_document, verify_export
 
@@ -141,3 +142,47 @@ def test_e2e_html_conversions():
         ), "export to indented-text"
 
         assert verify_document(doc, str(gt_path) + ".json", GENERATE)
+
+
+def test_lxml_engine_same_as_soup():
+    # Both engines give the same document on well-formed HTML
+    extra_html = (
+        b"<html><body><div>floating<br>text<p>para<script>x()</script></p>tail</div>"
+        b"<ul><li>item <b>one</b><!-- c --><ol start='3'><li>nested</li></ol></li>"
+        b"<li>  </li></ul><pre>  code\n  block</pre>"
+        b"<table><tr><th>h</th><th colspan='2'>h2</th></tr>"
+        b"<tr><td rowspan='2'>a<br>b</td><td>"
+        b"<inline-formula>f $$x^2$$ g</inline-formula></td><td>c</td></tr>"
+        b"<tr><td>d</td><td>e</td></tr></table>"
+        b"<figure><img src='a.png'><figcaption>cap <i>tion</i></figcaption></figure>"
+        b"</body></html>"
+    )
+    contents = [path.read_bytes() for path in get_html_paths()] + [extra_html]
+
+    for content in contents:
+        docs = []
+        for backend in [HTMLDocumentBackend, LxmlHTMLDocumentBackend]:
+            in_doc = InputDocument(
+                path_or_stream=BytesIO(content),
+                format=InputFormat.HTML,
+                backend=backend,
+                filename="test.html",
+            )
+            docs.append(in_doc._backend.convert().export_to_dict())
+        assert docs[0] == docs[1]
+
+
+def test_lxml_engine_deep_nesting():
+    # The traversal of the lxml engine is not limited by the recursion limit
+    depth = 5000
+    content = ("<div>" * depth + "<p>deep</p>" + "</div>" * depth).encode()
+
+    converter = DocumentConverter(
+        allowed_formats=[InputFormat.HTML],
+        format_options={
+            InputFormat.HTML: HTMLFormatOption(backend=LxmlHTMLDocumentBackend)
+        },
+    )
+    stream = DocumentStream(name="deep.html", stream=BytesIO(content))
+    doc = converter.convert(stream).document
+    assert [item.text for item in doc.texts] == ["deep"]
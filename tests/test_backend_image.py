@@ -0,0 +1,91 @@
+from io import BytesIO
+from pathlib import Path
+
+from docling_core.types.doc import BoundingBox, CoordOrigin
+from PIL import Image
+
+from docling.backend.image_backend import ImageDocumentBackend, ImagePageBackend
+from docling.datamodel.base_models import DocumentStream, InputFormat
+from docling.datamodel.document import InputDocument
+
+
+def _get_backend(path_or_stream, filename: str = "image.tiff") -> ImageDocumentBackend:
+    in_doc = InputDocument(
+        path_or_stream=path_or_stream,
+        format=InputFormat.IMAGE,
+        backend=ImageDocumentBackend,
+        filename=filename,
+    )
+
+    doc_backend = in_doc._backend
+    assert isinstance(doc_backend, ImageDocumentBackend)
+    return doc_backend
+
+
+def _multipage_tiff(num_pages: int, dpi: int = 144) -> BytesIO:
+    frames = [
+        Image.new("RGB", (288, 144), (i * 40, 255 - i * 40, 0))
+        for i in range(num_pages)
+    ]
+    buf = BytesIO()
+    frames[0].save(buf, "TIFF", save_all=True, append_images=frames[1:], dpi=(dpi, dpi))
+    buf.seek(0)
+    return buf
+
+
+def test_single_image():
+    doc_backend = _get_backend(Path("./tests/data/2305.03393v1-pg9-img.png"))
+
+    assert doc_backend.is_valid()
+    assert doc_backend.page_count() == 1
+
+    page_backend: ImagePageBackend = doc_backend.load_page(0)
+    assert page_backend.is_valid()
+    assert list(page_backend.get_text_cells()) == []
+
+    size = page_backend.get_size()
+    bitmap_rects = list(page_backend.get_bitmap_rects())
+    assert len(bitmap_rects) == 1
+    assert bitmap_rects[0].area() == size.width * size.height
+
+    im = page_backend.get_page_image(scale=2)
+    assert im.size == (round(size.width * 2), round(size.height * 2))
+
+    page_backend.unload()
+    doc_backend.unload()
+
+
+def test_multipage_tiff_frames():
+    doc_backend = _get_backend(_multipage_tiff(num_pages=3))
+    assert doc_backend.page_count() == 3
+
+    for page_no in range(3):
+        page_backend = doc_backend.load_page(page_no)
+
+        # 288x144 pixels at 144 dpi is 144x72 points
+        size = page_backend.get_size()
+        assert (size.width, size.height) == (144, 72)
+
+        im = page_backend.get_page_image(scale=1)
+        assert im.size == (144, 72)
+        assert im.getpixel((10, 10)) == (page_no * 40, 255 - page_no * 40, 0)
+
+        cropbox = BoundingBox(l=0, t=0, r=72, b=36, coord_origin=CoordOrigin.TOPLEFT)
+        crop = page_backend.get_page_image(scale=3, cropbox=cropbox)
+        assert crop.size == (216, 108)
+
+        page_backend.unload()
+
+    doc_backend.unload()
+
+
+def test_image_input_document_stream():
+    stream = DocumentStream(name="scan.tiff", stream=_multipage_tiff(num_pages=2))
+    in_doc = InputDocument(
+        path_or_stream=stream.stream,
+        format=InputFormat.IMAGE,
+        backend=ImageDocumentBackend,
+        filename=stream.name,
+    )
+    assert in_doc.valid
+    assert in_doc.page_count == 2
@@ -1,11 +1,13 @@
 import os
+import tarfile
 from io import BytesIO
 from pathlib import Path
 
 from docling_core.types.doc import DoclingDocument
 
-from docling.datamodel.base_models import DocumentStream, InputFormat
+from docling.datamodel.base_models import ConversionStatus, DocumentStream, InputFormat
 from docling.datamodel.document import ConversionResult
+from docling.datamodel.settings import settings
 from docling.document_converter import DocumentConverter
 
 from .verify_utils import verify_document, verify_export
@@ -59,3 +61,69 @@ def test_e2e_pubmed_conversions_stream():
 
 def test_e2e_pubmed_conversions_no_stream():
     test_e2e_pubmed_conversions(use_stream=False)
+
+
+def get_jats_paths():
+    directory = Path(os.path.dirname(__file__) + "/data/jats/")
+    return sorted(directory.glob("*.xml"))
+
+
+def test_jats_iterparse():
+    converter = get_converter()
+
+    for jats_path in get_jats_paths():
+        expected = converter.convert(jats_path).document.export_to_dict()
+
+        settings.perf.jats_iterparse = True
+        try:
+            conv_result = converter.convert(jats_path)
+        finally:
+            settings.perf.jats_iterparse = False
+
+        assert conv_result.document.export_to_dict() == expected
+
+
+def test_jats_iterparse_malformed(tmp_path: Path):
+    converter = get_converter()
+    jats_path = get_jats_paths()[0]
+    # The content is well-formed up to the end of the body
+    content = jats_path.read_text(encoding="utf-8").replace("</body>", "</bdy>", 1)
+    malformed_path = tmp_path / jats_path.name
+    malformed_path.write_text(content, encoding="utf-8")
+
+    settings.perf.jats_iterparse = True
+    try:
+        conv_result = converter.convert(malformed_path, raises_on_error=False)
+    finally:
+        settings.perf.jats_iterparse = False
+
+    assert conv_result.status == ConversionStatus.FAILURE
+
+
+def test_jats_bulk_archive():
+    converter = get_converter()
+    jats_paths = get_jats_paths()
+
+    buf = BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz") as tar:
+        for jats_path in jats_paths:
+            tar.add(jats_path, arcname=f"bulk/{jats_path.name}")
+        # The other files of the article packages are skipped
+        figure_path = Path(os.path.dirname(__file__) + "/data/2305.03393v1-pg9-img.png")
+        tar.add(figure_path, arcname="bulk/figure.png")
+    buf.seek(0)
+
+    settings.perf.jats_bulk_archives = True
+    try:
+        conv_results = list(
+            converter.convert_all([DocumentStream(name="bulk.tar.gz", stream=buf)])
+        )
+    finally:
+        settings.perf.jats_bulk_archives = False
+
+    assert [res.input.file.name for res in conv_results] == [
+        jats_path.name for jats_path in jats_paths
+    ]
+    for jats_path, conv_result in zip(jats_paths, conv_results):
+        expected = converter.convert(jats_path).document
+        assert conv_result.document.export_to_dict() == expected.export_to_dict()
@@ -1,5 +1,9 @@
+from io import BytesIO
 from pathlib import Path
 
+from docling_core.types.doc import DocItemLabel
+from docling_core.types.doc.document import ContentLayer
+
 from docling.backend.md_backend import MarkdownDocumentBackend
 from docling.datamodel.base_models import InputFormat
 from docling.datamodel.document import InputDocument
@@ -39,3 +43,34 @@ def test_convert_valid():
             with open(gt_path, encoding="utf-8") as f:
                 exp_data = f.read().rstrip()
             assert exp_data == act_data
+
+
+def test_convert_html_blocks():
+    md = (
+        "# Ducks\n\n"
+        "Some text\n\n"
+        "<ul>\n<li>foo</li>\n<li>bar</li>\n</ul>\n\n"
+        "<h2>Famous ducks</h2>\n\n"
+        "Name: ________________\n"
+    )
+    in_doc = InputDocument(
+        path_or_stream=BytesIO(md.encode("utf-8")),
+        format=InputFormat.MD,
+        backend=MarkdownDocumentBackend,
+        filename="ducks.md",
+    )
+    backend = MarkdownDocumentBackend(
+        in_doc=in_doc, path_or_stream=BytesIO(md.encode("utf-8"))
+    )
+    doc = backend.convert()
+
+    # The HTML blocks are added in place, the Markdown items being kept as they are
+    assert [(item.label, item.text) for item in doc.texts] == [
+        (DocItemLabel.TITLE, "Ducks"),
+        (DocItemLabel.PARAGRAPH, "Some text"),
+        (DocItemLabel.LIST_ITEM, "foo"),
+        (DocItemLabel.LIST_ITEM, "bar"),
+        (DocItemLabel.SECTION_HEADER, "Famous ducks"),
+        (DocItemLabel.PARAGRAPH, "Name: ________________"),
+    ]
+    assert all(item.content_layer == ContentLayer.BODY for item in doc.texts)
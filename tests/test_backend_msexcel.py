@@ -1,8 +1,14 @@
 import os
+from io import BytesIO
 from pathlib import Path
 
+import pytest
+from openpyxl import Workbook
+
+from docling.backend import msexcel_backend
+from docling.backend.msexcel_backend import MsExcelDocumentBackend
 from docling.datamodel.base_models import InputFormat
-from docling.datamodel.document import ConversionResult, DoclingDocument
+from docling.datamodel.document import ConversionResult, DoclingDocument, InputDocument
 from docling.document_converter import DocumentConverter
 
 from .verify_utils import verify_document, verify_export
@@ -56,3 +62,90 @@ def test_e2e_xlsx_conversions():
         assert verify_document(
             doc, str(gt_path) + ".json", GENERATE
         ), "document document"
+
+
+def test_xlsx_merged_cells_and_gaps():
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["Region", None, "Total"])
+    ws.append(["North", "East", 3])
+    ws.append([1, 2, None])
+    ws.merge_cells("A1:B1")
+    ws.merge_cells("C2:C3")
+    # A second table, separated by an empty row
+    ws["B6"] = "Notes"
+    ws["B7"] = "None yet"
+
+    stream = BytesIO()
+    wb.save(stream)
+    stream.seek(0)
+
+    in_doc = InputDocument(
+        path_or_stream=stream,
+        format=InputFormat.XLSX,
+        filename="merged.xlsx",
+        backend=MsExcelDocumentBackend,
+    )
+    doc = in_doc._backend.convert()
+
+    assert len(doc.tables) == 2
+    table = doc.tables[0].data
+    assert table.num_rows == 3 and table.num_cols == 3
+    cells = [
+        (c.text, c.start_row_offset_idx, c.start_col_offset_idx)
+        + (c.row_span, c.col_span)
+        for c in table.table_cells
+    ]
+    assert cells == [
+        ("Region", 0, 0, 1, 2),
+        ("Total", 0, 2, 1, 1),
+        ("North", 1, 0, 1, 1),
+        ("East", 1, 1, 1, 1),
+        ("3", 1, 2, 2, 1),
+        ("1", 2, 0, 1, 1),
+        ("2", 2, 1, 1, 1),
+    ]
+    assert [c.text for c in doc.tables[1].data.table_cells] == ["Notes", "None yet"]
+
+
+def test_xlsx_without_sheet_parser(monkeypatch: pytest.MonkeyPatch):
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["Region", "Area", "Total"])
+    ws.append(["North", "East", 3])
+    ws.append([1, 2.5, None])
+    ws["B6"] = "Notes"
+
+    stream = BytesIO()
+    wb.save(stream)
+
+    def convert() -> DoclingDocument:
+        in_doc = InputDocument(
+            path_or_stream=BytesIO(stream.getvalue()),
+            format=InputFormat.XLSX,
+            filename="fallback.xlsx",
+            backend=MsExcelDocumentBackend,
+        )
+        return in_doc._backend.convert()
+
+    expected = convert()
+
+    # The values are read with iter_rows() when the private parser is missing
+    monkeypatch.setattr(msexcel_backend, "WorkSheetParser", None)
+    doc = convert()
+
+    assert len(doc.tables) == 2
+    assert [t.data.table_cells for t in doc.tables] == [
+        t.data.table_cells for t in expected.tables
+    ]
+    assert [c.text for c in doc.tables[0].data.table_cells] == [
+        "Region",
+        "Area",
+        "Total",
+        "North",
+        "East",
+        "3",
+        "1",
+        "2.5",
+        "None",
+    ]
@@ -1,6 +1,9 @@
 import os
+from io import BytesIO
 from pathlib import Path
 
+from docx import Document
+
 from docling.backend.msword_backend import MsWordDocumentBackend
 from docling.datamodel.base_models import InputFormat
 from docling.datamodel.document import (
@@ -91,3 +94,39 @@ def test_e2e_docx_conversions():
         if docx_path.name == "word_tables.docx":
             pred_html: str = doc.export_to_html()
             assert verify_export(pred_html, str(gt_path) + ".html"), "export to html"
+
+
+def test_table_merged_cells():
+    docx_doc = Document()
+    table = docx_doc.add_table(rows=4, cols=3)
+    for row_idx, row in enumerate(table.rows):
+        for col_idx, cell in enumerate(row.cells):
+            cell.text = f"{row_idx}.{col_idx}"
+    table.cell(0, 0).merge(table.cell(0, 2))
+    table.cell(1, 0).merge(table.cell(3, 0))
+    table.cell(2, 1).merge(table.cell(3, 2))
+    stream = BytesIO()
+    docx_doc.save(stream)
+
+    in_doc = InputDocument(
+        path_or_stream=stream,
+        format=InputFormat.DOCX,
+        backend=MsWordDocumentBackend,
+        filename="merged.docx",
+    )
+    doc = in_doc._backend.convert()
+
+    data = doc.tables[0].data
+    assert data.num_rows == 4 and data.num_cols == 3
+    cells = [
+        (c.start_row_offset_idx, c.start_col_offset_idx, c.row_span, c.col_span)
+        for c in data.table_cells
+    ]
+    assert cells == [
+        (0, 0, 1, 3),
+        (1, 0, 3, 1),
+        (1, 1, 1, 1),
+        (1, 2, 1, 1),
+        (2, 1, 2, 2),
+    ]
+    assert data.table_cells[0].text.split() == ["0.0", "0.1", "0.2"]
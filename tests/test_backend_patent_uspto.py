@@ -2,6 +2,7 @@
 
 import logging
 import os
+from io import BytesIO
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 
@@ -10,8 +11,10 @@ from docling_core.types import DoclingDocument
 from docling_core.types.doc import DocItemLabel, TableData, TextItem
 
 from docling.backend.xml.uspto_backend import PatentUsptoDocumentBackend, XmlTable
-from docling.datamodel.base_models import InputFormat
+from docling.datamodel.base_models import ConversionStatus, DocumentStream, InputFormat
 from docling.datamodel.document import InputDocument
+from docling.datamodel.settings import settings
+from docling.document_converter import DocumentConverter
 
 from .verify_utils import verify_document
 
@@ -455,3 +458,62 @@ def test_patent_uspto_grant_aps(patents):
     assert len(doc.tables) == 0
     for item in texts:
         assert "##STR1##" not in item.text
+
+
+def test_patent_uspto_bulk(patents):
+    """Test the split of a bulk file into one document per patent."""
+
+    patent_paths = sorted(DATA_PATH.glob("ipg*.xml"))
+    # Each patent starts on a new line, with its XML declaration
+    bulk = "\n".join(path.read_text(encoding="utf-8") for path in patent_paths)
+    expected = {item[0].name: item[1] for item in patents}
+
+    try:
+        settings.perf.uspto_bulk_split = True
+        for workers in [1, 2]:
+            settings.perf.uspto_bulk_workers = workers
+            converter = DocumentConverter(allowed_formats=[InputFormat.XML_USPTO])
+            stream = DocumentStream(
+                name="ipg_bulk.xml", stream=BytesIO(bulk.encode("utf-8"))
+            )
+            results = list(converter.convert_all([stream]))
+
+            assert [res.input.file.name for res in results] == [
+                f"ipg_bulk-{ix + 1}.xml" for ix in range(len(patent_paths))
+            ]
+            for path, res in zip(patent_paths, results):
+                assert res.status == ConversionStatus.SUCCESS
+                assert res.document.texts == expected[path.name].texts
+                assert res.document.tables == expected[path.name].tables
+    finally:
+        settings.perf.uspto_bulk_split = False
+        settings.perf.uspto_bulk_workers = 1
+
+
+def test_patent_uspto_bulk_large_batch(patents):
+    """Test the parallel parse of a bulk file with batches larger than the window."""
+
+    patent_paths = sorted(DATA_PATH.glob("ipg*.xml")) * 4
+    bulk = "\n".join(path.read_text(encoding="utf-8") for path in patent_paths)
+    expected = {item[0].name: item[1] for item in patents}
+
+    doc_batch_size = settings.perf.doc_batch_size
+    try:
+        settings.perf.uspto_bulk_split = True
+        settings.perf.uspto_bulk_workers = 2
+        # The whole bulk file is read in one batch, before any conversion
+        settings.perf.doc_batch_size = 50
+        converter = DocumentConverter(allowed_formats=[InputFormat.XML_USPTO])
+        stream = DocumentStream(
+            name="ipg_bulk.xml", stream=BytesIO(bulk.encode("utf-8"))
+        )
+        results = list(converter.convert_all([stream]))
+
+        assert len(results) == len(patent_paths)
+        for path, res in zip(patent_paths, results):
+            assert res.status == ConversionStatus.SUCCESS
+            assert res.document.texts == expected[path.name].texts
+    finally:
+        settings.perf.uspto_bulk_split = False
+        settings.perf.uspto_bulk_workers = 1
+        settings.perf.doc_batch_size = doc_batch_size
@@ -3,6 +3,7 @@ from pathlib import Path
 
 from docling.datamodel.base_models import InputFormat
 from docling.datamodel.document import ConversionResult, DoclingDocument
+from docling.datamodel.settings import ImageExtractionMode, settings
 from docling.document_converter import DocumentConverter
 
 from .verify_utils import verify_document, verify_export
@@ -56,3 +57,51 @@ def test_e2e_pptx_conversions():
         assert verify_document(
             doc, str(gt_path) + ".json", GENERATE
         ), "document document"
+
+
+def test_pptx_image_extraction_modes():
+    pptx_path = Path("./tests/data/pptx/powerpoint_with_image.pptx")
+    converter = get_converter()
+
+    pictures = {}
+    try:
+        for mode in ImageExtractionMode:
+            settings.perf.image_extraction_mode = mode
+            doc = converter.convert(pptx_path).document
+            pictures[mode] = doc.pictures
+    finally:
+        settings.perf.image_extraction_mode = ImageExtractionMode.PNG
+
+    png_image = pictures[ImageExtractionMode.PNG][0].image
+    original_image = pictures[ImageExtractionMode.ORIGINAL][0].image
+    assert png_image is not None and original_image is not None
+    assert png_image.mimetype == "image/png"
+    # The original image has the same size, without being re-encoded
+    assert original_image.size == png_image.size
+    assert original_image.pil_image is not None
+    assert original_image.pil_image.size == png_image.pil_image.size
+
+    assert len(pictures[ImageExtractionMode.SKIP]) == len(
+        pictures[ImageExtractionMode.PNG]
+    )
+    assert all(pic.image is None for pic in pictures[ImageExtractionMode.SKIP])
+
+
+def test_pptx_parallel_slides():
+    pptx_path = Path("./tests/data/pptx/powerpoint_sample.pptx")
+    converter = get_converter()
+
+    sequential = converter.convert(pptx_path).document.export_to_dict()
+    try:
+        for processes in [False, True]:
+            settings.perf.pptx_slide_workers = 2
+            settings.perf.pptx_slide_processes = processes
+            doc = converter.convert(pptx_path).document
+            # The slide fragments are merged in order, with the same references
+            assert doc.export_to_dict() == sequential
+            assert [p.page_no for p in doc.pages.values()] == list(
+                range(1, len(doc.pages) + 1)
+            )
+    finally:
+        settings.perf.pptx_slide_workers = 1
+        settings.perf.pptx_slide_processes = False
@@ -1,8 +1,12 @@
 from pathlib import Path
 
+import pytest
 from typer.testing import CliRunner
 
+from docling.backend.image_backend import ImageDocumentBackend
 from docling.cli.main import app
+from docling.datamodel.base_models import InputFormat
+from docling.document_converter import DocumentConverter
 
 runner = CliRunner()
 
@@ -25,3 +29,20 @@ def test_cli_convert(tmp_path):
     assert result.exit_code == 0
     converted = output / f"{Path(source).stem}.md"
     assert converted.exists()
+
+
+def test_cli_image_backend(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    converters = []
+
+    def convert_all(self, *args, **kwargs):
+        converters.append(self)
+        return iter([])
+
+    monkeypatch.setattr(DocumentConverter, "convert_all", convert_all)
+    source = "./tests/data/2305.03393v1-pg9-img.png"
+    result = runner.invoke(app, [source, "--output", str(tmp_path)])
+    assert result.exit_code == 0
+
+    (converter,) = converters
+    image_option = converter.format_to_options[InputFormat.IMAGE]
+    assert image_option.backend is ImageDocumentBackend
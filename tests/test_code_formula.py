@@ -1,15 +1,18 @@
 from pathlib import Path
 
-from docling_core.types.doc import CodeItem, TextItem
+from docling_core.types.doc import CodeItem, DoclingDocument, TextItem
 from docling_core.types.doc.labels import CodeLanguageLabel, DocItemLabel
+from PIL import Image
 
 from docling.backend.docling_parse_backend import DoclingParseDocumentBackend
 from docling.backend.docling_parse_v2_backend import DoclingParseV2DocumentBackend
-from docling.datamodel.base_models import InputFormat
+from docling.datamodel.base_models import InputFormat, ItemAndImageEnrichmentElement
 from docling.datamodel.document import ConversionResult
-from docling.datamodel.pipeline_options import PdfPipelineOptions
+from docling.datamodel.pipeline_options import AcceleratorOptions, PdfPipelineOptions
 from docling.document_converter import DocumentConverter, PdfFormatOption
+from docling.models.code_formula_model import CodeFormulaModel, CodeFormulaModelOptions
 from docling.pipeline.standard_pdf_pipeline import StandardPdfPipeline
+from docling.utils.lazy_model import LazyModel
 
 
 def get_converter():
@@ -64,3 +67,49 @@ def test_code_and_formula_conversion():
     gt = "a ^ { 2 } + 8 = 1 2"
     predicted = formula_blocks[0].text
     assert predicted == gt, f"mismatch in text {predicted=}, {gt=}"
+
+
+class _EchoPredictor:
+    def __init__(self):
+        self.batches = []
+
+    def predict(self, images, labels):
+        self.batches.append(list(zip(labels, [im.size for im in images])))
+        return [f"{label} {im.size}" for label, im in zip(labels, images)]
+
+
+def test_code_formula_bucketing():
+    model = CodeFormulaModel(
+        enabled=True,
+        artifacts_path=None,
+        options=CodeFormulaModelOptions(),
+        accelerator_options=AcceleratorOptions(),
+    )
+    predictor = _EchoPredictor()
+    model._code_formula_model = LazyModel("echo", lambda: predictor)
+
+    doc = DoclingDocument(name="test")
+    elements = []
+    for i in range(12):
+        if i % 3 == 0:
+            item = doc.add_code(text="x = 1\n" * (i + 1))
+            size = (300, 20 * (i + 1))
+        else:
+            item = doc.add_text(label=DocItemLabel.FORMULA, text="a" * (i + 1))
+            size = (20 * (i + 1), 20)
+        elements.append(
+            ItemAndImageEnrichmentElement(item=item, image=Image.new("RGB", size))
+        )
+    expected = [f"{el.item.label} {el.image.size}" for el in elements]
+
+    results = list(model(doc, elements))
+
+    # Results keep the original order
+    assert results == [el.item for el in elements]
+    assert [item.text for item in results] == expected
+
+    # Code and formulas are never mixed, and the batches are full but the last
+    # one of each label
+    assert [len(b) for b in predictor.batches] == [4, 5, 3]
+    for batch in predictor.batches:
+        assert len({label for label, _ in batch}) == 1
@@ -0,0 +1,203 @@
+import random
+from pathlib import Path
+from typing import List
+
+from docling_core.types.doc import Size
+from PIL import Image
+
+from docling.backend.docling_parse_v2_backend import DoclingParseV2DocumentBackend
+from docling.datamodel.base_models import InputFormat, Page, VlmPrediction
+from docling.datamodel.document import ConversionResult, InputDocument
+from docling.models.doctags_document_model import DocTagsDocumentModel
+from docling.utils.doctags import doctags_to_document
+
+from .doctags_reference import reference_doctags_to_document
+
+TEXT_TAGS = [
+    "title",
+    "section_header_level_1",
+    "checkbox_selected",
+    "checkbox_unselected",
+    "text",
+    "page_header",
+    "page_footer",
+    "formula",
+    "caption",
+    "list_item",
+    "footnote",
+    "code",
+]
+CELL_TAGS = ["<fcel>", "<ched>", "<rhed>", "<srow>", "<ecel>"]
+WORDS = ["alpha", "beta", "gamma", "delta", "1.5", "(a)", "x = y", "&", "été"]
+
+
+def _get_words(rng: random.Random) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 6)))
+
+
+def _get_locs(rng: random.Random) -> str:
+    l, r = sorted(rng.sample(range(500), 2))
+    t, b = sorted(rng.sample(range(500), 2))
+    return "".join(f"<loc_{v}>" for v in (l, t, r, b))
+
+
+def _get_otsl(rng: random.Random) -> str:
+    num_rows, num_cols = rng.randint(1, 5), rng.randint(1, 5)
+    grid: List[List[str]] = [[""] * num_cols for _ in range(num_rows)]
+    for i in range(num_rows):
+        for j in range(num_cols):
+            if grid[i][j]:
+                continue
+            # Spanning cells over the free cells on the right and below
+            col_span = 1
+            while (
+                j + col_span < num_cols
+                and not grid[i][j + col_span]
+                and rng.random() < 0.3
+            ):
+                col_span += 1
+            row_span = 1
+            while (
+                i + row_span < num_rows
+                and all(not grid[i + row_span][j + k] for k in range(col_span))
+                and rng.random() < 0.3
+            ):
+                row_span += 1
+            for k in range(row_span):
+                for m in range(col_span):
+                    if k == 0 and m == 0:
+                        cell = rng.choice(CELL_TAGS)
+                        if cell != "<ecel>":
+                            cell += _get_words(rng)
+                    elif k == 0:
+                        cell = "<lcel>"
+                    elif m == 0:
+                        cell = "<ucel>"
+                    else:
+                        cell = "<xcel>"
+                    grid[i + k][j + m] = cell
+
+    return "".join("".join(row) + "<nl>" for row in grid)
+
+
+def _get_doctags(rng: random.Random) -> str:
+    parts = []
+    for _ in range(rng.randint(0, 12)):
+        kind = rng.random()
+        locs = _get_locs(rng) if rng.random() < 0.9 else ""
+        if kind < 0.6:
+            tag = rng.choice(TEXT_TAGS)
+            parts.append(f"<{tag}>{locs}{_get_words(rng)}</{tag}>")
+        elif kind < 0.8:
+            parts.append(f"<otsl>{locs}{_get_otsl(rng)}</otsl>")
+        elif kind < 0.9:
+            caption = _get_words(rng) if rng.random() < 0.5 else ""
+            parts.append(f"<picture>{_get_locs(rng)}{caption}</picture>")
+        else:
+            # Unknown tags and text between the blocks are skipped
+            parts.append(rng.choice(["<unknown>", "\n", "<page_break>", "noise"]))
+    return "".join(parts)
+
+
+def _get_pages(doctags: List[str]) -> List[Page]:
+    pages = []
+    for page_no, text in enumerate(doctags):
+        page = Page(page_no=page_no, size=Size(width=612, height=792))
+        page._image_cache = {1.0: Image.new("RGB", (612, 792), "white")}
+        page.predictions.vlm_response = VlmPrediction(text=text)
+        pages.append(page)
+    return pages
+
+
+def test_doctags_same_as_reference():
+    rng = random.Random(42)
+    for _ in range(200):
+        doctags = [_get_doctags(rng) for _ in range(rng.randint(1, 3))]
+        pages = _get_pages(doctags)
+
+        doc = doctags_to_document(pages)
+        ref_doc = reference_doctags_to_document(pages)
+        assert doc.export_to_dict() == ref_doc.export_to_dict(), doctags
+
+
+def test_doctags_truncated_same_as_reference():
+    # Generation stopped at the token limit leaves the last block unclosed
+    rng = random.Random(7)
+    for _ in range(200):
+        doctags = _get_doctags(rng)
+        truncated = doctags[: doctags.rfind("</")] if "</" in doctags else doctags
+        pages = _get_pages([truncated])
+
+        doc = doctags_to_document(pages)
+        ref_doc = reference_doctags_to_document(pages)
+        assert doc.export_to_dict() == ref_doc.export_to_dict(), truncated
+
+
+def test_doctags_table_spans():
+    otsl = (
+        "<otsl><loc_0><loc_0><loc_500><loc_500>"
+        "<ched>Name<lcel><ched>Total<nl>"
+        "<fcel>a<fcel>b<rhed>c<nl>"
+        "<ucel><ecel><ucel><nl></otsl>"
+    )
+    doc = doctags_to_document(_get_pages([otsl]))
+
+    table = doc.tables[0]
+    assert table.data.num_rows == 3 and table.data.num_cols == 3
+    cells = [
+        (c.text, c.start_row_offset_idx, c.start_col_offset_idx)
+        + (c.row_span, c.col_span)
+        for c in table.data.table_cells
+    ]
+    assert cells == [
+        ("Name", 0, 0, 1, 2),
+        ("Total", 0, 2, 1, 1),
+        ("a", 1, 0, 2, 1),
+        ("b", 1, 1, 1, 1),
+        ("c", 1, 2, 2, 1),
+        ("", 2, 1, 1, 1),
+    ]
+    assert table.prov[0].bbox.as_tuple() == (0, 0, 612, 792)
+
+
+def test_doctags_fuzz():
+    tokens = (
+        [f"<{tag}>" for tag in TEXT_TAGS + ["document_index", "otsl", "picture"]]
+        + [f"</{tag}>" for tag in TEXT_TAGS + ["document_index", "otsl", "picture"]]
+        + CELL_TAGS
+        + ["<lcel>", "<ucel>", "<xcel>", "<nl>", "<loc_10>", "<loc_", "<", ">"]
+        + ["<loc_999999>", "</>", "<>", " ", "\n", "text", "<<otsl>"]
+    )
+    rng = random.Random(0)
+    for _ in range(500):
+        if rng.random() < 0.8:
+            text = "".join(rng.choice(tokens) for _ in range(rng.randint(0, 60)))
+        else:
+            text = "".join(chr(rng.randint(0, 0x24F)) for _ in range(200))
+
+        for force_backend_text in [False, True]:
+            doctags_to_document(_get_pages([text]), force_backend_text)
+
+
+def test_doctags_document_model():
+    rng = random.Random(3)
+    doctags = [_get_doctags(rng) for _ in range(5)]
+    pages = _get_pages(doctags)
+
+    in_doc = InputDocument(
+        path_or_stream=Path("./tests/data/2305.03393v1-pg9-img.png"),
+        format=InputFormat.IMAGE,
+        backend=DoclingParseV2DocumentBackend,
+    )
+    conv_res = ConversionResult(input=in_doc)
+    conv_res.pages = pages
+
+    # The pages are added in batches, as they leave the VLM
+    model = DocTagsDocumentModel()
+    for start in range(0, len(pages), 2):
+        list(model(conv_res, pages[start : start + 2]))
+
+    doc = model.pop_document(conv_res)
+    assert doc is not None
+    assert doc.export_to_dict() == doctags_to_document(pages).export_to_dict()
+    assert model.pop_document(conv_res) is None
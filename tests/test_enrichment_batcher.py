@@ -0,0 +1,112 @@
+import time
+from pathlib import Path
+from typing import Iterable, List, Optional, Set
+
+from docling_core.types.doc import DoclingDocument, NodeItem, TextItem
+from PIL import Image
+
+from docling.datamodel.base_models import (
+    ConversionStatus,
+    InputFormat,
+    ItemAndImageEnrichmentElement,
+)
+from docling.datamodel.document import ConversionResult
+from docling.datamodel.settings import settings
+from docling.document_converter import DocumentConverter
+from docling.models.base_model import GenericEnrichmentModel
+
+
+class _TextModel(GenericEnrichmentModel[ItemAndImageEnrichmentElement]):
+    elements_batch_size = 8
+
+    def __init__(self):
+        self.batch_docs: List[Set[str]] = []
+
+    def is_processable(self, doc: DoclingDocument, element: NodeItem) -> bool:
+        return isinstance(element, TextItem)
+
+    def prepare_element(
+        self, conv_res: ConversionResult, element: NodeItem
+    ) -> Optional[ItemAndImageEnrichmentElement]:
+        if not self.is_processable(conv_res.document, element):
+            return None
+        element.orig = conv_res.input.file.name  # type: ignore[union-attr]
+        return ItemAndImageEnrichmentElement(
+            item=element, image=Image.new("RGB", (4, 4))
+        )
+
+    def __call__(
+        self,
+        doc: DoclingDocument,
+        element_batch: Iterable[ItemAndImageEnrichmentElement],
+    ) -> Iterable[NodeItem]:
+        elements = list(element_batch)
+        self.batch_docs.append({el.item.orig for el in elements})  # type: ignore
+        for el in elements:
+            assert isinstance(el.item, TextItem)
+            el.item.text = f"[enriched] {el.item.text}"
+            yield el.item
+
+
+def test_cross_document_enrichment():
+    sources = sorted(Path("./tests/data/docx").glob("unit_test_*.docx"))
+    converter = DocumentConverter(allowed_formats=[InputFormat.DOCX])
+    converter.initialize_pipeline(InputFormat.DOCX)
+    model = _TextModel()
+    converter._get_pipeline(InputFormat.DOCX).enrichment_pipe = [model]
+
+    settings.perf.enrichment_max_wait = 60.0
+    try:
+        results = list(converter.convert_all(sources))
+    finally:
+        settings.perf.enrichment_max_wait = None
+
+    # Results are returned in order, with every item enriched in its document
+    assert [r.input.file.name for r in results] == [s.name for s in sources]
+    num_items = 0
+    for conv_res in results:
+        assert conv_res.status == ConversionStatus.SUCCESS
+        for item, _ in conv_res.document.iterate_items():
+            if isinstance(item, TextItem):
+                num_items += 1
+                assert item.text.startswith("[enriched] ")
+
+    assert sum(len(d) > 0 for d in model.batch_docs) == len(model.batch_docs)
+    assert any(len(docs) > 1 for docs in model.batch_docs)
+    # Only the last batch may be partial
+    assert len(model.batch_docs) == -(-num_items // model.elements_batch_size)
+
+
+def test_partial_batch_flushed_after_max_wait():
+    sources = sorted(Path("./tests/data/docx").glob("unit_test_*.docx"))[:3]
+    converter = DocumentConverter(allowed_formats=[InputFormat.DOCX])
+    converter.initialize_pipeline(InputFormat.DOCX)
+    pipeline = converter._get_pipeline(InputFormat.DOCX)
+    model = _TextModel()
+    model.elements_batch_size = 1000
+    pipeline.enrichment_pipe = [model]
+
+    # The second document finishes after the elements of the first one waited
+    # longer than max_wait
+    build_document = pipeline._build_document
+
+    def _build_document(conv_res: ConversionResult) -> ConversionResult:
+        if conv_res.input.file.name == sources[1].name:
+            time.sleep(0.5)
+        return build_document(conv_res)
+
+    pipeline._build_document = _build_document  # type: ignore[method-assign]
+
+    settings.perf.enrichment_max_wait = 0.2
+    try:
+        results = converter.convert_all(sources)
+        first = next(results)
+        # The partial batch is run before the third document is converted
+        assert model.batch_docs == [{sources[0].name, sources[1].name}]
+        assert first.input.file.name == sources[0].name
+        rest = list(results)
+    finally:
+        settings.perf.enrichment_max_wait = None
+
+    assert [r.input.file.name for r in rest] == [s.name for s in sources[1:]]
+    assert model.batch_docs[1:] == [{sources[2].name}]
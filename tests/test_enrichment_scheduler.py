@@ -0,0 +1,129 @@
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+import pytest
+from docling_core.types.doc import (
+    BoundingBox,
+    CoordOrigin,
+    DoclingDocument,
+    NodeItem,
+    PictureItem,
+    ProvenanceItem,
+    Size,
+)
+from PIL import Image
+
+from docling.backend.docling_parse_v2_backend import DoclingParseV2DocumentBackend
+from docling.backend.pdf_backend import PdfPageBackend
+from docling.datamodel.base_models import (
+    InputFormat,
+    ItemAndImageEnrichmentElement,
+    Page,
+)
+from docling.datamodel.document import ConversionResult, InputDocument
+from docling.datamodel.pipeline_options import PipelineOptions
+from docling.datamodel.settings import settings
+from docling.models.base_model import BaseItemAndImageEnrichmentModel
+from docling.pipeline.simple_pipeline import SimplePipeline
+
+
+class _CountingPageBackend(PdfPageBackend):
+    def __init__(self):
+        self.renders: List[Optional[BoundingBox]] = []
+
+    def get_text_in_rect(self, bbox: BoundingBox) -> str:
+        return ""
+
+    def get_text_cells(self):
+        return []
+
+    def get_bitmap_rects(self, scale: float = 1):
+        return []
+
+    def get_page_image(
+        self, scale: float = 1, cropbox: Optional[BoundingBox] = None
+    ) -> Image.Image:
+        self.renders.append(cropbox)
+        return Image.new("RGB", (round(100 * scale), round(100 * scale)), "white")
+
+    def get_size(self) -> Size:
+        return Size(width=100, height=100)
+
+    def is_valid(self) -> bool:
+        return True
+
+    def unload(self):
+        pass
+
+
+class _PictureModel(BaseItemAndImageEnrichmentModel):
+    images_scale = 2.0
+    elements_batch_size = 2
+
+    def __init__(self, name: str):
+        self.name = name
+        self.batches: List[int] = []
+
+    def is_processable(self, doc: DoclingDocument, element: NodeItem) -> bool:
+        return isinstance(element, PictureItem)
+
+    def __call__(
+        self,
+        doc: DoclingDocument,
+        element_batch: Iterable[ItemAndImageEnrichmentElement],
+    ) -> Iterable[NodeItem]:
+        elements = list(element_batch)
+        self.batches.append(len(elements))
+        for el in elements:
+            assert el.image.size == (40, 20)
+            yield el.item
+
+
+def _get_conv_res(num_pages: int, pictures_per_page: int) -> ConversionResult:
+    in_doc = InputDocument(
+        path_or_stream=Path("./tests/data/2305.03393v1-pg9-img.png"),
+        format=InputFormat.IMAGE,
+        backend=DoclingParseV2DocumentBackend,
+    )
+    conv_res = ConversionResult(input=in_doc)
+    conv_res.document = DoclingDocument(name="test")
+    for page_ix in range(num_pages):
+        page = Page(page_no=page_ix, size=Size(width=100, height=100))
+        page._backend = _CountingPageBackend()
+        conv_res.pages.append(page)
+        conv_res.document.add_page(page_no=page_ix + 1, size=page.size)
+        for i in range(pictures_per_page):
+            bbox = BoundingBox(
+                l=10,
+                t=90 - 10 * i,
+                r=30,
+                b=80 - 10 * i,
+                coord_origin=CoordOrigin.BOTTOMLEFT,
+            )
+            conv_res.document.add_picture(
+                prov=ProvenanceItem(page_no=page_ix + 1, bbox=bbox, charspan=(0, 0))
+            )
+    return conv_res
+
+
+@pytest.mark.parametrize("concurrency", [1, 2])
+def test_single_pass_enrichment(concurrency: int):
+    pipeline = SimplePipeline(pipeline_options=PipelineOptions())
+    first, second = _PictureModel("first"), _PictureModel("second")
+    pipeline.enrichment_pipe = [first, second]
+
+    conv_res = _get_conv_res(num_pages=2, pictures_per_page=3)
+
+    settings.perf.enrichment_concurrency = concurrency
+    try:
+        pipeline._enrich_document(conv_res)
+    finally:
+        settings.perf.enrichment_concurrency = 1
+
+    assert first.batches == [2, 2, 2]
+    assert second.batches == [2, 2, 2]
+
+    # Each page is rendered once for both models, and released afterwards
+    for page in conv_res.pages:
+        assert page._backend.renders == [None]
+        assert page._image_cache == {}
@@ -0,0 +1,129 @@
+from pathlib import Path
+from types import SimpleNamespace
+from typing import List, Optional
+
+import pytest
+import torch
+from docling_core.types.doc import BoundingBox, Size
+from PIL import Image
+
+from docling.backend.docling_parse_v2_backend import DoclingParseV2DocumentBackend
+from docling.backend.pdf_backend import PdfPageBackend
+from docling.datamodel.base_models import InputFormat, Page
+from docling.datamodel.document import ConversionResult, InputDocument
+from docling.datamodel.pipeline_options import (
+    AcceleratorOptions,
+    smoldocling_vlm_conversion_options,
+)
+from docling.datamodel.settings import settings
+from docling.models.hf_vlm_model import HuggingFaceVlmModel
+from docling.utils.lazy_model import LazyModel
+
+EOS, PAD = 2, 0
+
+
+class _PageBackend(PdfPageBackend):
+    def __init__(self, valid: bool = True):
+        self.valid = valid
+
+    def get_text_in_rect(self, bbox: BoundingBox) -> str:
+        return ""
+
+    def get_text_cells(self):
+        return []
+
+    def get_bitmap_rects(self, scale: float = 1):
+        return []
+
+    def get_page_image(
+        self, scale: float = 1, cropbox: Optional[BoundingBox] = None
+    ) -> Image.Image:
+        return Image.new("L", (round(100 * scale), round(100 * scale)))
+
+    def get_size(self) -> Size:
+        return Size(width=100, height=100)
+
+    def is_valid(self) -> bool:
+        return self.valid
+
+    def unload(self):
+        pass
+
+
+class _Processor:
+    tokenizer = SimpleNamespace(pad_token_id=PAD, padding_side="left")
+
+    def apply_chat_template(self, messages, add_generation_prompt):
+        return "prompt"
+
+    def __call__(self, text, images, padding, return_tensors):
+        assert padding and len(text) == len(images)
+        assert all(im[0].mode == "RGB" for im in images)
+        return {"input_ids": torch.ones((len(text), 3), dtype=torch.long)}
+
+    def decode(self, token_ids, skip_special_tokens):
+        return " ".join(str(t) for t in token_ids)
+
+
+class _Model:
+    generation_config = SimpleNamespace(eos_token_id=EOS)
+
+    def __init__(self):
+        self.batch_sizes: List[int] = []
+
+    def generate(self, input_ids, max_new_tokens, use_cache):
+        self.batch_sizes.append(len(input_ids))
+        generated = torch.tensor([[5, 6, EOS, PAD, PAD], [7, 8, 9, 10, EOS]])
+        return torch.cat([input_ids, generated[: len(input_ids)]], dim=1)
+
+
+def test_batched_page_generation(monkeypatch: pytest.MonkeyPatch):
+    model = HuggingFaceVlmModel(
+        enabled=False,
+        artifacts_path=None,
+        accelerator_options=AcceleratorOptions(),
+        vlm_options=smoldocling_vlm_conversion_options,
+    )
+    model.device = "cpu"
+    model.param_question = "Convert this page to docling."
+    vlm_model = _Model()
+    model._processor_and_model = LazyModel("test", lambda: (_Processor(), vlm_model))
+
+    in_doc = InputDocument(
+        path_or_stream=Path("./tests/data/2305.03393v1-pg9-img.png"),
+        format=InputFormat.IMAGE,
+        backend=DoclingParseV2DocumentBackend,
+    )
+    conv_res = ConversionResult(input=in_doc)
+    pages = []
+    for page_no, valid in enumerate([True, False, True]):
+        page = Page(page_no=page_no)
+        page._backend = _PageBackend(valid=valid)
+        page.size = page._backend.get_size()
+        pages.append(page)
+
+    # The generation of the batch takes 2 seconds
+    clock = iter([10.0, 12.0])
+    monkeypatch.setattr(
+        "docling.models.hf_vlm_model.time",
+        SimpleNamespace(time=lambda: next(clock, 12.0)),
+    )
+
+    settings.debug.profile_pipeline_timings = True
+    try:
+        result = list(model(conv_res, pages))
+    finally:
+        settings.debug.profile_pipeline_timings = False
+
+    assert result == pages
+    assert vlm_model.batch_sizes == [2]
+
+    # Each page keeps its own tokens, without the padding of the batch
+    assert pages[0].predictions.vlm_response is not None
+    assert pages[0].predictions.vlm_response.text == f"5 6 {EOS}"
+    assert pages[1].predictions.vlm_response is None
+    assert pages[2].predictions.vlm_response is not None
+    assert pages[2].predictions.vlm_response.text == f"7 8 9 10 {EOS}"
+
+    assert conv_res.timings["vlm_tokens"].times == [3, 5]
+    assert conv_res.timings["vlm_tokens_per_sec"].times == [4.0]
@@ -0,0 +1,229 @@
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from docling_core.types.doc import (
+    BoundingBox,
+    CoordOrigin,
+    DocItemLabel,
+    PictureItem,
+    Size,
+    TableItem,
+)
+from PIL import Image
+
+from docling.backend.docling_parse_v2_backend import DoclingParseV2DocumentBackend
+from docling.backend.pdf_backend import PdfPageBackend
+from docling.datamodel.base_models import (
+    AssembledUnit,
+    Cell,
+    Cluster,
+    InputFormat,
+    LayoutPrediction,
+    Page,
+    TextElement,
+    VlmPrediction,
+)
+from docling.datamodel.document import ConversionResult, InputDocument
+from docling.datamodel.pipeline_options import (
+    HybridPdfPipelineOptions,
+    PageRoutingOptions,
+)
+from docling.models.base_model import BasePageModel
+from docling.models.hf_vlm_model import HuggingFaceVlmModel
+from docling.models.page_routing_model import PageRoutingModel, RoutedPageModel
+from docling.models.readingorder_model import ReadingOrderModel, ReadingOrderOptions
+from docling.models.vlm_page_assemble_model import (
+    VlmPageAssembleModel,
+    VlmPageAssembleOptions,
+)
+from docling.pipeline.hybrid_pdf_pipeline import HybridPdfPipeline
+
+PAGE_TAGS = (
+    "<page_header><loc_25><loc_10><loc_475><loc_20>Annual report</page_header>"
+    "<section_header_level_1><loc_25><loc_40><loc_475><loc_60>Scanned results"
+    "</section_header_level_1>"
+    "<text><loc_25><loc_70><loc_475><loc_100>The numbers of the year.</text>"
+    "<otsl><loc_25><loc_120><loc_475><loc_200>"
+    "<fcel>Year<fcel>Revenue<nl><fcel>2024<fcel>42<nl></otsl>"
+    "<picture><loc_25><loc_250><loc_250><loc_400>Figure 1. Growth</picture>"
+)
+
+
+class _PageBackend(PdfPageBackend):
+    def __init__(self, bitmap_rects: List[BoundingBox]):
+        self.bitmap_rects = bitmap_rects
+
+    def get_text_in_rect(self, bbox: BoundingBox) -> str:
+        return ""
+
+    def get_text_cells(self):
+        return []
+
+    def get_bitmap_rects(self, scale: float = 1):
+        return self.bitmap_rects
+
+    def get_page_image(
+        self, scale: float = 1, cropbox: Optional[BoundingBox] = None
+    ) -> Image.Image:
+        return Image.new("RGB", (round(500 * scale), round(500 * scale)), "white")
+
+    def get_size(self) -> Size:
+        return Size(width=500, height=500)
+
+    def is_valid(self) -> bool:
+        return True
+
+    def unload(self):
+        pass
+
+
+class _RecordingModel(BasePageModel):
+    def __init__(self):
+        self.page_nos: List[int] = []
+
+    def __call__(
+        self, conv_res: ConversionResult, page_batch: Iterable[Page]
+    ) -> Iterable[Page]:
+        for page in page_batch:
+            self.page_nos.append(page.page_no)
+            yield page
+
+
+def _get_conv_res(pages: List[Page]) -> ConversionResult:
+    in_doc = InputDocument(
+        path_or_stream=Path("./tests/data/2305.03393v1-pg9-img.png"),
+        format=InputFormat.IMAGE,
+        backend=DoclingParseV2DocumentBackend,
+    )
+    conv_res = ConversionResult(input=in_doc)
+    conv_res.pages = pages
+    return conv_res
+
+
+def _get_text_page(page_no: int) -> Page:
+    page = Page(page_no=page_no, size=Size(width=500, height=500))
+    page._backend = _PageBackend(bitmap_rects=[])
+    bbox = BoundingBox(l=50, t=50, r=450, b=80, coord_origin=CoordOrigin.TOPLEFT)
+    page.cells = [
+        Cell(id=i, text=f"word{i}", bbox=bbox) for i in range(10)  # type: ignore
+    ]
+    return page
+
+
+def _get_scanned_page(page_no: int) -> Page:
+    page = Page(page_no=page_no, size=Size(width=500, height=500))
+    page._backend = _PageBackend(
+        bitmap_rects=[BoundingBox(l=0, t=0, r=500, b=450)],
+    )
+    return page
+
+
+def test_page_routing():
+    pages = [_get_text_page(0), _get_scanned_page(1), _get_text_page(2)]
+    conv_res = _get_conv_res(pages)
+
+    router = PageRoutingModel(options=PageRoutingOptions(), use_layout=False)
+    standard_model, vlm_model = _RecordingModel(), _RecordingModel()
+    pipe = [
+        router,
+        RoutedPageModel(standard_model, use_vlm=False),
+        RoutedPageModel(vlm_model, use_vlm=True),
+    ]
+    page_batch: Iterable[Page] = pages
+    for model in pipe:
+        page_batch = model(conv_res, page_batch)
+
+    assert list(page_batch) == pages
+    assert [p._use_vlm for p in pages] == [False, True, False]
+    assert standard_model.page_nos == [0, 2]
+    assert vlm_model.page_nos == [1]
+
+    # Unconfident layouts are routed after the layout analysis
+    for page, confidence in [(pages[0], 0.2), (pages[2], 0.9)]:
+        page.predictions.layout = LayoutPrediction(
+            clusters=[
+                Cluster(
+                    id=0,
+                    label=DocItemLabel.TEXT,
+                    bbox=BoundingBox(l=50, t=50, r=450, b=80),
+                    confidence=confidence,
+                )
+            ]
+        )
+    router = PageRoutingModel(options=PageRoutingOptions(), use_layout=True)
+    list(router(conv_res, pages))
+    assert [p._use_vlm for p in pages] == [True, True, False]
+
+
+def test_vlm_loaded_for_routed_pages_only():
+    pipeline = HybridPdfPipeline(
+        HybridPdfPipelineOptions(do_ocr=False, do_table_structure=False)
+    )
+    (vlm_step,) = [
+        model
+        for model in pipeline.build_pipe
+        if isinstance(model, RoutedPageModel)
+        and isinstance(model.model, HuggingFaceVlmModel)
+    ]
+    vlm_model = vlm_step.model
+    assert isinstance(vlm_model, HuggingFaceVlmModel)
+    assert not vlm_model._processor_and_model.is_loaded
+
+    pages = [_get_text_page(0), _get_text_page(1)]
+    conv_res = _get_conv_res(pages)
+    assert list(vlm_step(conv_res, pages)) == pages
+    assert not vlm_model._processor_and_model.is_loaded
+
+
+def test_vlm_pages_merged_in_document():
+    text_page = _get_text_page(0)
+    text_cluster = Cluster(
+        id=0,
+        label=DocItemLabel.TEXT,
+        bbox=BoundingBox(l=50, t=50, r=450, b=80, coord_origin=CoordOrigin.TOPLEFT),
+    )
+    text_element = TextElement(
+        label=DocItemLabel.TEXT,
+        id=0,
+        page_no=0,
+        cluster=text_cluster,
+        text="A page with programmatic text.",
+    )
+    text_page.assembled = AssembledUnit(elements=[text_element], body=[text_element])
+
+    scanned_page = _get_scanned_page(1)
+    scanned_page._use_vlm = True
+    scanned_page.predictions.vlm_response = VlmPrediction(text=PAGE_TAGS)
+
+    conv_res = _get_conv_res([text_page, scanned_page])
+    assemble_model = VlmPageAssembleModel(options=VlmPageAssembleOptions())
+    list(assemble_model(conv_res, conv_res.pages))
+
+    assert scanned_page.assembled is not None
+    assert [el.label for el in scanned_page.assembled.headers] == [
+        DocItemLabel.PAGE_HEADER
+    ]
+    assert len(scanned_page.assembled.elements) == 6
+
+    conv_res.assembled = AssembledUnit(
+        elements=text_page.assembled.elements + scanned_page.assembled.elements,
+        body=text_page.assembled.body + scanned_page.assembled.body,
+        headers=scanned_page.assembled.headers,
+    )
+    doc = ReadingOrderModel(options=ReadingOrderOptions())(conv_res)
+
+    texts = [(t.prov[0].page_no, t.text) for t in doc.texts]
+    assert texts[0] == (1, "A page with programmatic text.")
+    assert (2, "Scanned results") in texts
+    assert (2, "The numbers of the year.") in texts
+
+    tables = [item for item, _ in doc.iterate_items() if isinstance(item, TableItem)]
+    assert len(tables) == 1
+    assert tables[0].prov[0].page_no == 2
+    assert tables[0].data.num_rows == 2 and tables[0].data.num_cols == 2
+
+    pictures = [
+        item for item, _ in doc.iterate_items() if isinstance(item, PictureItem)
+    ]
+    assert len(pictures) == 1
+    assert pictures[0].prov[0].page_no == 2
@@ -0,0 +1,85 @@
+import zipfile
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from docling.datamodel.pipeline_options import ImageFormat, ImageSinkOptions
+from docling.utils.image_sink import FileImageSink, ImageSink, create_image_sink
+
+
+def _images():
+    return [
+        Image.new("RGB", (64, 32), (255, 0, 0)),
+        Image.new("RGB", (64, 32), (0, 255, 0)),
+        Image.new("RGB", (64, 32), (255, 0, 0)),  # duplicate of the first
+    ]
+
+
+def test_embedded_sink():
+    sink = create_image_sink(None)
+    assert type(sink) is ImageSink
+    ref = sink.add(_images()[0], dpi=72)
+    assert str(ref.uri).startswith("data:image/png;base64,")
+
+
+@pytest.mark.parametrize("image_format", list(ImageFormat))
+def test_directory_sink(tmp_path: Path, image_format: ImageFormat):
+    options = ImageSinkOptions(
+        output_path=tmp_path / "images", image_format=image_format
+    )
+    with create_image_sink(options) as sink:
+        assert isinstance(sink, FileImageSink)
+        refs = [sink.add(im, dpi=144) for im in _images()]
+
+    # Content-addressed, the duplicate is stored once
+    assert refs[0].uri == refs[2].uri
+    assert refs[0].uri != refs[1].uri
+    assert len(list((tmp_path / "images").iterdir())) == 2
+
+    for ref, im in zip(refs, _images()):
+        assert isinstance(ref.uri, Path)
+        assert ref.uri.exists()
+        assert ref.dpi == 144
+        assert (ref.size.width, ref.size.height) == (64, 32)
+        assert ref.pil_image is not None
+        assert ref.pil_image.size == im.size
+
+
+def test_zip_sink(tmp_path: Path):
+    options = ImageSinkOptions(
+        output_path=tmp_path / "images.zip", image_format=ImageFormat.JPEG, quality=50
+    )
+    with create_image_sink(options) as sink:
+        refs = [sink.add(im, dpi=72) for im in _images()]
+    assert all(ref.mimetype == "image/jpeg" for ref in refs)
+
+    # A second document appends to the same archive
+    with create_image_sink(options) as sink:
+        sink.add(Image.new("RGB", (8, 8), (0, 0, 255)), dpi=72)
+
+    with zipfile.ZipFile(tmp_path / "images.zip") as zf:
+        names = zf.namelist()
+    assert len(names) == 3
+
+    # The references are qualified with the path of the archive
+    assert isinstance(refs[0].uri, Path)
+    assert refs[0].uri.parent == (tmp_path / "images.zip").absolute()
+    assert refs[0].uri.name in names
+    member = zipfile.Path(refs[0].uri.parent, at=refs[0].uri.name)
+    assert member.read_bytes()[:3] == b"\xff\xd8\xff"  # JPEG
+
+
+def test_zip_sink_concurrent(tmp_path: Path):
+    # Sinks of concurrent conversions share the archive
+    options = ImageSinkOptions(output_path=tmp_path / "images.zip")
+    sinks = [create_image_sink(options) for _ in range(2)]
+    for ix, sink in enumerate(sinks):
+        sink.add(Image.new("RGB", (8, 8), (ix, 0, 0)), dpi=72)
+        sink.add(Image.new("RGB", (8, 8), (0, 0, 255)), dpi=72)
+    for sink in sinks:
+        sink.close()
+
+    with zipfile.ZipFile(tmp_path / "images.zip") as zf:
+        assert zf.testzip() is None
+        assert len(zf.namelist()) == 3
@@ -0,0 +1,74 @@
+from pathlib import Path
+
+from docling.backend.docling_parse_v2_backend import DoclingParseV2DocumentBackend
+from docling.datamodel.base_models import InputFormat
+from docling.datamodel.document import ConversionResult, InputDocument
+from docling.datamodel.settings import settings
+from docling.utils.lazy_model import LazyModel, record_model_loads, unload_idle_models
+
+
+def _get_conv_res() -> ConversionResult:
+    in_doc = InputDocument(
+        path_or_stream=Path("./tests/data/2305.03393v1-pg9-img.png"),
+        format=InputFormat.IMAGE,
+        backend=DoclingParseV2DocumentBackend,
+    )
+    return ConversionResult(input=in_doc)
+
+
+def test_lazy_model_loads_once():
+    calls = []
+
+    def _loader():
+        calls.append(1)
+        return object()
+
+    model = LazyModel("dummy", _loader)
+    assert not model.is_loaded
+    assert calls == []
+
+    first = model.get()
+    assert model.get() is first
+    assert model.is_loaded
+    assert len(calls) == 1
+
+    model.unload()
+    assert not model.is_loaded
+
+    # Loaded again on the next use
+    assert model.get() is not first
+    assert len(calls) == 2
+    assert len(model.load_times) == 2
+    model.unload()
+
+
+def test_unload_idle_models():
+    used = LazyModel("used", lambda: object())
+    idle = LazyModel("idle", lambda: object())
+    idle.get()
+    used.get()
+
+    # Pretend the idle model was last used a minute ago
+    idle.last_used -= 60.0
+
+    assert unload_idle_models(idle_timeout=30.0) == 1
+    assert not idle.is_loaded
+    assert used.is_loaded
+
+    used.unload()
+
+
+def test_model_load_time_recorded():
+    model = LazyModel("dummy", lambda: object())
+
+    settings.debug.profile_pipeline_timings = True
+    try:
+        conv_res = _get_conv_res()
+        with record_model_loads(conv_res):
+            model.get()
+            model.get()
+    finally:
+        settings.debug.profile_pipeline_timings = False
+
+    assert conv_res.timings["model_load_dummy"].count == 1
+    model.unload()
@@ -0,0 +1,76 @@
+import gc
+
+from docling.datamodel.base_models import InputFormat
+from docling.datamodel.pipeline_options import PdfPipelineOptions
+from docling.document_converter import DocumentConverter, PdfFormatOption
+from docling.models.layout_model import LayoutModel
+from docling.utils.model_registry import ModelRegistry, make_model_key
+
+
+class _Owner:
+    pass
+
+
+def test_registry_refcount():
+    registry = ModelRegistry()
+    key = make_model_key(_Owner, artifacts_path=None, device="cpu", num_threads=4)
+
+    owner_a, owner_b = _Owner(), _Owner()
+    handle_a = registry.acquire(owner_a, key, "dummy", lambda: object())
+    handle_b = registry.acquire(owner_b, key, "dummy", lambda: object())
+    assert handle_a is handle_b
+    assert registry.refcount(key) == 2
+
+    handle_a.get()
+    del owner_a
+    gc.collect()
+    assert registry.refcount(key) == 1
+    assert handle_b.is_loaded
+
+    # The model is unloaded with its last owner
+    del owner_b
+    gc.collect()
+    assert registry.refcount(key) == 0
+    assert len(registry) == 0
+    assert not handle_b.is_loaded
+
+
+def _get_converter(**kwargs) -> DocumentConverter:
+    pipeline_options = PdfPipelineOptions(do_ocr=False, **kwargs)
+    return DocumentConverter(
+        format_options={
+            InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)
+        }
+    )
+
+
+def _get_layout_model(converter: DocumentConverter) -> LayoutModel:
+    pipeline = converter._get_pipeline(InputFormat.PDF)
+    return next(m for m in pipeline.build_pipe if isinstance(m, LayoutModel))
+
+
+def test_models_shared_across_converters_and_options():
+    converter = _get_converter()
+    other_converter = _get_converter(generate_page_images=True)
+
+    layout = _get_layout_model(converter)
+    assert _get_layout_model(other_converter)._layout_predictor is (
+        layout._layout_predictor
+    )
+
+    # Changing options unrelated to the weights reuses the same model
+    pdf_option = converter.format_to_options[InputFormat.PDF]
+    first_options = pdf_option.pipeline_options
+    first_pipeline = converter._get_pipeline(InputFormat.PDF)
+
+    pdf_option.pipeline_options = PdfPipelineOptions(
+        do_ocr=False, generate_page_images=True
+    )
+    second_pipeline = converter._get_pipeline(InputFormat.PDF)
+    assert second_pipeline is not first_pipeline
+    assert _get_layout_model(converter)._layout_predictor is layout._layout_predictor
+
+    # Alternating configurations are served from the pipeline cache
+    pdf_option.pipeline_options = first_options
+    assert converter._get_pipeline(InputFormat.PDF) is first_pipeline
+    assert len(converter.initialized_pipelines) == 2
@@ -0,0 +1,142 @@
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from docling_core.types.doc import BoundingBox, CoordOrigin, Size
+from PIL import Image
+
+from docling.backend.docling_parse_v2_backend import DoclingParseV2DocumentBackend
+from docling.backend.pdf_backend import PdfPageBackend
+from docling.datamodel.base_models import Cell, InputFormat, OcrCell, Page
+from docling.datamodel.document import ConversionResult, InputDocument
+from docling.datamodel.pipeline_options import CascadeOcrOptions, EasyOcrOptions
+from docling.datamodel.settings import settings
+from docling.models.base_ocr_model import BaseOcrModel
+from docling.models.cascade_ocr_model import CascadeOcrModel
+
+
+class _ScannedPageBackend(PdfPageBackend):
+    def get_text_in_rect(self, bbox: BoundingBox) -> str:
+        return ""
+
+    def get_text_cells(self) -> Iterable[Cell]:
+        return []
+
+    def get_bitmap_rects(self, scale: float = 1) -> Iterable[BoundingBox]:
+        yield BoundingBox(l=0, t=0, r=100, b=100, coord_origin=CoordOrigin.TOPLEFT)
+
+    def get_page_image(
+        self, scale: float = 1, cropbox: Optional[BoundingBox] = None
+    ) -> Image.Image:
+        return Image.new("RGB", (round(100 * scale), round(100 * scale)), "white")
+
+    def get_size(self) -> Size:
+        return Size(width=100, height=100)
+
+    def is_valid(self) -> bool:
+        return True
+
+    def unload(self):
+        pass
+
+
+class _FakeOcrModel(BaseOcrModel):
+    def __init__(self, cells: List[OcrCell]):
+        super().__init__(enabled=True, options=EasyOcrOptions())
+        self.cells = cells
+        self.calls: List[BoundingBox] = []
+
+    def _ocr_rect(
+        self, page: Page, ocr_rect: BoundingBox, scale: float
+    ) -> List[OcrCell]:
+        self.calls.append(ocr_rect)
+        return [c for c in self.cells if c.bbox.overlaps(ocr_rect)]
+
+    def __call__(self, conv_res, page_batch):
+        raise NotImplementedError
+
+
+def _cell(ix: int, text: str, confidence: float, l: float, t: float) -> OcrCell:
+    return OcrCell(
+        id=ix,
+        text=text,
+        confidence=confidence,
+        bbox=BoundingBox(
+            l=l, t=t, r=l + 20, b=t + 10, coord_origin=CoordOrigin.TOPLEFT
+        ),
+    )
+
+
+def _get_conv_res() -> ConversionResult:
+    in_doc = InputDocument(
+        path_or_stream=Path("./tests/data/2305.03393v1-pg9-img.png"),
+        format=InputFormat.IMAGE,
+        backend=DoclingParseV2DocumentBackend,
+    )
+    return ConversionResult(input=in_doc)
+
+
+def test_cascade_escalates_only_weak_cells():
+    fast = _FakeOcrModel(
+        [
+            _cell(0, "clean", 0.95, l=10, t=10),
+            _cell(1, "blurry", 0.30, l=10, t=60),
+        ]
+    )
+    accurate = _FakeOcrModel([_cell(0, "sharp", 0.90, l=10, t=60)])
+
+    model = CascadeOcrModel(
+        enabled=True,
+        options=CascadeOcrOptions(confidence_threshold=0.8, force_full_page_ocr=True),
+        fast_model=fast,
+        accurate_model=accurate,
+    )
+
+    page = Page(page_no=0)
+    page._backend = _ScannedPageBackend()
+    page.size = page._backend.get_size()
+
+    settings.debug.profile_pipeline_timings = True
+    try:
+        conv_res = _get_conv_res()
+        pages = list(model(conv_res, [page]))
+    finally:
+        settings.debug.profile_pipeline_timings = False
+
+    texts = sorted(c.text for c in pages[0].cells)
+    assert texts == ["clean", "sharp"]
+
+    # The accurate engine only ran on the region around the weak cell
+    assert len(accurate.calls) == 1
+    assert accurate.calls[0].t < 60 and accurate.calls[0].b > 70
+    assert accurate.calls[0].b <= 100
+
+    assert conv_res.timings["ocr_cascade_hit_rate"].times == [0.5]
+    assert conv_res.timings["ocr_cascade_fast"].count == 1
+    assert conv_res.timings["ocr_cascade_accurate"].count == 1
+
+
+def test_cascade_ocr_rect():
+    fast = _FakeOcrModel(
+        [
+            _cell(0, "clean", 0.95, l=10, t=10),
+            _cell(1, "blurry", 0.30, l=10, t=60),
+        ]
+    )
+    accurate = _FakeOcrModel([_cell(0, "sharp", 0.90, l=10, t=60)])
+
+    model = CascadeOcrModel(
+        enabled=True,
+        options=CascadeOcrOptions(confidence_threshold=0.8),
+        fast_model=fast,
+        accurate_model=accurate,
+    )
+
+    page = Page(page_no=0)
+    page._backend = _ScannedPageBackend()
+    page.size = page._backend.get_size()
+
+    rect = BoundingBox(l=0, t=0, r=100, b=100, coord_origin=CoordOrigin.TOPLEFT)
+    cells = model._ocr_rect(page, rect, scale=1.0)
+
+    assert [c.text for c in cells] == ["clean", "sharp"]
+    assert len(accurate.calls) == 1
@@ -0,0 +1,202 @@
+from pathlib import Path
+
+from docling_core.types.doc import (
+    BoundingBox,
+    CoordOrigin,
+    DocItemLabel,
+    PictureItem,
+    Size,
+    TableItem,
+)
+from PIL import Image
+
+from docling.backend.docling_parse_v2_backend import DoclingParseV2DocumentBackend
+from docling.datamodel.base_models import (
+    AssembledUnit,
+    Cluster,
+    FigureElement,
+    InputFormat,
+    Page,
+    Table,
+)
+from docling.datamodel.document import ConversionResult, InputDocument
+from docling.datamodel.pipeline_options import ImageSinkOptions, PdfPipelineOptions
+from docling.models.document_picture_classifier import DocumentPictureClassifier
+from docling.models.page_element_crop_model import (
+    PageElementCropModel,
+    PageElementCropOptions,
+)
+from docling.pipeline.standard_pdf_pipeline import StandardPdfPipeline
+from docling.utils.image_sink import ImageSink
+
+SCALE = 2.0
+
+
+def _get_page(page_no: int) -> Page:
+    page = Page(page_no=page_no, size=Size(width=100, height=200))
+
+    # Gradient, such that crops at different positions differ
+    image = Image.new("RGB", (200, 400))
+    image.putdata([(x % 256, y % 256, page_no) for y in range(400) for x in range(200)])
+    page._image_cache = {SCALE: image}
+
+    picture_bbox = BoundingBox(l=10, t=20, r=60, b=70, coord_origin=CoordOrigin.TOPLEFT)
+    table_bbox = BoundingBox(l=5, t=100, r=95, b=180, coord_origin=CoordOrigin.TOPLEFT)
+    page.assembled = AssembledUnit(
+        elements=[
+            FigureElement(
+                label=DocItemLabel.PICTURE,
+                id=0,
+                page_no=page_no,
+                cluster=Cluster(id=0, label=DocItemLabel.PICTURE, bbox=picture_bbox),
+            ),
+            Table(
+                label=DocItemLabel.TABLE,
+                id=1,
+                page_no=page_no,
+                cluster=Cluster(id=1, label=DocItemLabel.TABLE, bbox=table_bbox),
+                otsl_seq=[],
+                table_cells=[],
+            ),
+        ]
+    )
+    page.assembled.body = list(page.assembled.elements)
+    return page
+
+
+def test_element_images_cropped_in_page_pipeline():
+    pipeline = StandardPdfPipeline(
+        PdfPipelineOptions(
+            do_ocr=False,
+            do_table_structure=False,
+            images_scale=SCALE,
+            generate_picture_images=True,
+            generate_table_images=True,
+        )
+    )
+    assert not pipeline.keep_images
+
+    in_doc = InputDocument(
+        path_or_stream=Path("./tests/data/2305.03393v1-pg9-img.png"),
+        format=InputFormat.IMAGE,
+        backend=DoclingParseV2DocumentBackend,
+    )
+    conv_res = ConversionResult(input=in_doc)
+    conv_res.pages = [_get_page(0), _get_page(1)]
+    expected = {}
+    for page in conv_res.pages:
+        assert page.assembled is not None
+        for el in page.assembled.elements:
+            box = el.cluster.bbox.scaled(scale=SCALE).as_tuple()
+            expected[(page.page_no, el.label)] = page._image_cache[SCALE].crop(box)
+
+    crop_model = PageElementCropModel(
+        PageElementCropOptions(images_scale=SCALE, crop_pictures=True, crop_tables=True)
+    )
+    for page in crop_model(conv_res, conv_res.pages):
+        # The page raster is released, as done by the pipeline
+        page._image_cache = {}
+        assert len(page._element_images) == 2
+
+    conv_res = pipeline._assemble_document(conv_res)
+
+    items = [
+        item
+        for item, _ in conv_res.document.iterate_items()
+        if isinstance(item, (PictureItem, TableItem))
+    ]
+    assert len(items) == 4
+    for item in items:
+        assert item.image is not None
+        page_ix = item.prov[0].page_no - 1
+        expected_im = expected[(page_ix, item.label)]
+        assert item.image.pil_image is not None
+        assert item.image.pil_image.tobytes() == expected_im.tobytes()
+
+    assert all(page._element_images == {} for page in conv_res.pages)
+
+
+def test_element_image_missing():
+    pipeline = StandardPdfPipeline(
+        PdfPipelineOptions(
+            do_ocr=False,
+            do_table_structure=False,
+            images_scale=SCALE,
+            generate_picture_images=True,
+            generate_table_images=True,
+        )
+    )
+
+    in_doc = InputDocument(
+        path_or_stream=Path("./tests/data/2305.03393v1-pg9-img.png"),
+        format=InputFormat.IMAGE,
+        backend=DoclingParseV2DocumentBackend,
+    )
+    conv_res = ConversionResult(input=in_doc)
+    conv_res.pages = [_get_page(0)]
+
+    crop_model = PageElementCropModel(
+        PageElementCropOptions(images_scale=SCALE, crop_pictures=True, crop_tables=True)
+    )
+    for page in crop_model(conv_res, conv_res.pages):
+        page._image_cache = {}
+        # The table was not cropped, and the page raster is not kept
+        del page._element_images[1]
+
+    conv_res = pipeline._assemble_document(conv_res)
+
+    pictures = [
+        item
+        for item, _ in conv_res.document.iterate_items()
+        if isinstance(item, PictureItem)
+    ]
+    tables = [
+        item
+        for item, _ in conv_res.document.iterate_items()
+        if isinstance(item, TableItem)
+    ]
+    assert len(pictures) == 1 and pictures[0].image is not None
+    assert len(tables) == 1 and tables[0].image is None
+
+
+def test_element_images_in_zip_sink_enriched(tmp_path: Path):
+    pipeline = StandardPdfPipeline(
+        PdfPipelineOptions(
+            do_ocr=False,
+            do_table_structure=False,
+            do_picture_classification=True,
+            images_scale=SCALE,
+            generate_picture_images=True,
+            image_sink_options=ImageSinkOptions(output_path=tmp_path / "images.zip"),
+        )
+    )
+    (classifier,) = [
+        model
+        for model in pipeline.enrichment_pipe
+        if isinstance(model, DocumentPictureClassifier)
+    ]
+
+    in_doc = InputDocument(
+        path_or_stream=Path("./tests/data/2305.03393v1-pg9-img.png"),
+        format=InputFormat.IMAGE,
+        backend=DoclingParseV2DocumentBackend,
+    )
+    conv_res = ConversionResult(input=in_doc)
+    conv_res.pages = [_get_page(0)]
+    crop_model = PageElementCropModel(
+        PageElementCropOptions(images_scale=SCALE, crop_pictures=True)
+    )
+    for page in crop_model(conv_res, conv_res.pages):
+        page._image_cache = {}
+
+    conv_res = pipeline._assemble_document(conv_res)
+
+    # The sink is closed, the classifier reads the picture back from its reference
+    (picture,) = [
+        item
+        for item, _ in conv_res.document.iterate_items()
+        if isinstance(item, PictureItem)
+    ]
+    element = classifier.prepare_element(conv_res, picture)
+    assert element is not None
+    assert element.image.size == (100, 100)
@@ -0,0 +1,114 @@
+import gc
+from pathlib import Path
+
+from docling_core.types.doc import BoundingBox, CoordOrigin, DocItemLabel, Size
+from PIL import Image
+
+from docling.backend.image_backend import ImageDocumentBackend
+from docling.datamodel.base_models import (
+    AssembledUnit,
+    Cluster,
+    ConversionStatus,
+    InputFormat,
+    LayoutPrediction,
+    OcrCell,
+    Page,
+    TextElement,
+)
+from docling.datamodel.document import InputDocument
+from docling.datamodel.pipeline_options import PdfPipelineOptions
+from docling.pipeline.standard_pdf_pipeline import StandardPdfPipeline
+from docling.utils.page_store import PageStore, restored_page
+
+
+def _get_page(page_no: int) -> Page:
+    bbox = BoundingBox(l=10, t=10, r=50, b=20, coord_origin=CoordOrigin.TOPLEFT)
+    cell = OcrCell(id=0, text=f"page {page_no}", bbox=bbox, confidence=0.9)
+    cluster = Cluster(id=0, label=DocItemLabel.TEXT, bbox=bbox, cells=[cell])
+
+    page = Page(page_no=page_no, size=Size(width=100, height=200))
+    page.cells = [cell]
+    page.predictions.layout = LayoutPrediction(clusters=[cluster])
+    page.assembled = AssembledUnit(
+        elements=[
+            TextElement(
+                label=DocItemLabel.TEXT,
+                id=0,
+                page_no=page_no,
+                cluster=cluster,
+                text=cell.text,
+            )
+        ]
+    )
+    page._image_cache = {2.0: Image.new("RGB", (200, 400), (page_no * 50, 0, 0))}
+    return page
+
+
+def test_spill_and_restore():
+    store = PageStore()
+    pages = [_get_page(i) for i in range(3)]
+    for page in pages:
+        store.spill(page)
+
+    for page in pages:
+        # The state is not in memory anymore
+        assert page.cells == []
+        assert page.assembled is None
+        assert page._image_cache == {}
+
+        with restored_page(page):
+            assert isinstance(page.cells[0], OcrCell)
+            assert page.cells[0].text == f"page {page.page_no}"
+            assert page.predictions.layout is not None
+            assert len(page.predictions.layout.clusters) == 1
+            assert page.assembled is not None
+            assert isinstance(page.assembled.elements[0], TextElement)
+        assert page.assembled is None
+
+        im = page.get_image(scale=2.0)
+        assert im is not None
+        assert im.size == (200, 400)
+        assert im.getpixel((0, 0)) == (page.page_no * 50, 0, 0)
+
+        cropbox = BoundingBox(l=0, t=0, r=50, b=100, coord_origin=CoordOrigin.TOPLEFT)
+        assert page.get_image(scale=2.0, cropbox=cropbox).size == (100, 200)
+
+
+def test_store_removed_with_pages():
+    store = PageStore()
+    page = _get_page(0)
+    store.spill(page)
+    directory = store.directory
+    assert directory.exists()
+
+    del store, page
+    gc.collect()
+    assert not directory.exists()
+
+
+def test_pipeline_page_images_spilled():
+    pipeline_options = PdfPipelineOptions(
+        do_ocr=False,
+        do_table_structure=False,
+        low_memory_mode=True,
+        generate_page_images=True,
+    )
+    pipeline = StandardPdfPipeline(pipeline_options)
+    # Only the page pre-processing, which renders the page images, the other
+    # stages need the model weights
+    pipeline.build_pipe = pipeline.build_pipe[:1]
+
+    in_doc = InputDocument(
+        path_or_stream=Path("./tests/data/2305.03393v1-pg9-img.png"),
+        format=InputFormat.IMAGE,
+        backend=ImageDocumentBackend,
+    )
+    conv_res = pipeline.execute(in_doc, raises_on_error=True)
+
+    assert conv_res.status == ConversionStatus.SUCCESS
+    page = conv_res.pages[0]
+    # The page backend is unloaded, the image is read back from the store
+    assert page._page_store is not None
+    assert page.image is not None
+    assert page.image.size == (1275, 1650)
+    assert conv_res.document.pages[1].image is not None
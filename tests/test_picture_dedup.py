@@ -0,0 +1,109 @@
+import io
+from pathlib import Path
+
+from docling_core.types.doc import DoclingDocument, PictureClassificationData
+from PIL import Image, ImageDraw
+
+from docling.datamodel.base_models import ItemAndImageEnrichmentElement
+from docling.datamodel.pipeline_options import AcceleratorOptions, PictureDedupOptions
+from docling.models.document_picture_classifier import (
+    DocumentPictureClassifier,
+    DocumentPictureClassifierOptions,
+)
+from docling.utils.lazy_model import LazyModel
+from docling.utils.picture_dedup import PictureResultCache, get_image_hash
+
+
+class _CountingPredictor:
+    def __init__(self):
+        self.num_images = 0
+
+    def predict(self, images):
+        self.num_images += len(images)
+        return [[("logo", 0.9), ("icon", 0.1)] for _ in images]
+
+
+def _get_image(color: str) -> Image.Image:
+    image = Image.new("RGB", (64, 32), "white")
+    ImageDraw.Draw(image).ellipse((8, 4, 40, 28), fill=color)
+    return image
+
+
+def _get_classifier(dedup_options: PictureDedupOptions):
+    classifier = DocumentPictureClassifier(
+        enabled=True,
+        artifacts_path=None,
+        options=DocumentPictureClassifierOptions(),
+        accelerator_options=AcceleratorOptions(),
+        dedup_options=dedup_options,
+    )
+    predictor = _CountingPredictor()
+    classifier._document_picture_classifier = LazyModel("counting", lambda: predictor)
+    return classifier, predictor
+
+
+def _classify(
+    classifier: DocumentPictureClassifier, colors, document_hash: str = "doc"
+):
+    doc = DoclingDocument(name="test")
+    elements = [
+        ItemAndImageEnrichmentElement(
+            item=doc.add_picture(), image=_get_image(c), document_hash=document_hash
+        )
+        for c in colors
+    ]
+    return list(classifier(doc, elements))
+
+
+def test_duplicate_pictures_classified_once(tmp_path: Path):
+    dedup_options = PictureDedupOptions(store_path=tmp_path / "pictures.db")
+    classifier, predictor = _get_classifier(dedup_options)
+
+    items = _classify(classifier, ["red", "blue", "red", "red", "blue"])
+    assert predictor.num_images == 2
+    for item in items:
+        assert len(item.annotations) == 1
+        annotation = item.annotations[0]
+        assert isinstance(annotation, PictureClassificationData)
+        assert annotation.predicted_classes[0].class_name == "logo"
+        assert annotation.predicted_classes[0].confidence == 0.9
+
+    # The persistent store serves another model instance, e.g. in a later run
+    classifier, predictor = _get_classifier(dedup_options)
+    _classify(classifier, ["red", "blue", "green"])
+    assert predictor.num_images == 1
+
+
+def test_picture_results_scoped_per_document(tmp_path: Path):
+    # Without a persistent store, the results are only reused within a document
+    classifier, predictor = _get_classifier(PictureDedupOptions())
+    _classify(classifier, ["red", "red"], document_hash="doc1")
+    _classify(classifier, ["red", "red"], document_hash="doc2")
+    assert predictor.num_images == 2
+
+    classifier, predictor = _get_classifier(
+        PictureDedupOptions(store_path=tmp_path / "pictures.db")
+    )
+    _classify(classifier, ["red", "red"], document_hash="doc1")
+    _classify(classifier, ["red", "red"], document_hash="doc2")
+    assert predictor.num_images == 1
+
+
+def test_near_duplicate_pictures():
+    image = _get_image("red")
+    buf = io.BytesIO()
+    image.save(buf, "JPEG", quality=70)
+    reencoded = Image.open(buf).convert("RGB")
+    flipped = image.transpose(Image.Transpose.FLIP_LEFT_RIGHT)
+    assert get_image_hash(image) != get_image_hash(reencoded)
+
+    cache = PictureResultCache("test", PictureDedupOptions(near_duplicates=True))
+    calls = []
+
+    def predict(images):
+        calls.append(len(images))
+        return [f"result {len(calls)}"] * len(images)
+
+    assert cache.map([image], predict) == ["result 1"]
+    assert cache.map([reencoded, flipped], predict) == ["result 1", "result 2"]
+    assert calls == [1, 1]
@@ -0,0 +1,46 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from docling.datamodel.base_models import ConversionStatus, InputFormat
+from docling.datamodel.pipeline_options import ImageSinkOptions, PdfPipelineOptions
+from docling.document_converter import DocumentConverter, PdfFormatOption
+from docling.worker_pool import ConverterWorkerPool
+
+
+def test_worker_pool_conversion():
+    sources = sorted(Path("./tests/data/docx").glob("unit_test_*.docx"))
+    converter = DocumentConverter(allowed_formats=[InputFormat.DOCX])
+
+    with ConverterWorkerPool(
+        converter,
+        num_workers=2,
+        formats=[InputFormat.DOCX],
+        warmup_source=sources[0],
+        num_threads=1,
+    ) as pool:
+        results = list(pool.convert_all(sources))
+
+    assert [r.input.file.name for r in results] == [s.name for s in sources]
+    for conv_res, source in zip(results, sources):
+        assert conv_res.status == ConversionStatus.SUCCESS
+        expected = converter.convert(source).document.export_to_markdown()
+        assert conv_res.document.export_to_markdown() == expected
+
+    assert len(pool.worker_unique_rss) > 0
+    assert os.getpid() not in pool.worker_unique_rss
+
+
+def test_worker_pool_zip_image_sink(tmp_path: Path):
+    pipeline_options = PdfPipelineOptions(
+        image_sink_options=ImageSinkOptions(output_path=tmp_path / "images.zip")
+    )
+    converter = DocumentConverter(
+        format_options={
+            InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)
+        }
+    )
+
+    with pytest.raises(ValueError):
+        ConverterWorkerPool(converter, num_workers=2)